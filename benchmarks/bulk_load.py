@@ -0,0 +1,103 @@
+"""Measures how fast pandas DataFrames are appended to a table by each loading strategy.
+
+DuckDB is used as a local stand-in for the engines that bulk load DataFrames, so the VALUES literal
+path, the generic executemany path and DuckDB's native path can be compared without a server. Pass
+--postgres-dsn (requires psycopg2) to compare the VALUES path with COPY FROM STDIN on Postgres.
+
+Usage:
+    python benchmarks/bulk_load.py --rows 10000 100000
+    python benchmarks/bulk_load.py --postgres-dsn "dbname=bench user=postgres"
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import typing as t
+
+import duckdb
+import numpy as np
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.core.engine_adapter import DuckDBEngineAdapter, EngineAdapter, PostgresEngineAdapter
+from sqlmesh.core.engine_adapter.mixins import BulkLoadDataFrameMixin
+
+COLUMNS_TO_TYPES = {
+    "id": exp.DataType.build("int"),
+    "name": exp.DataType.build("text"),
+    "price": exp.DataType.build("double"),
+    "ds": exp.DataType.build("date"),
+}
+
+
+class ValuesDuckDBEngineAdapter(DuckDBEngineAdapter):
+    _df_to_source_queries = EngineAdapter._df_to_source_queries  # type: ignore
+
+
+class ExecutemanyDuckDBEngineAdapter(BulkLoadDataFrameMixin, DuckDBEngineAdapter):
+    BULK_LOAD_PARAMETER_PLACEHOLDER = "?"
+
+
+class ValuesPostgresEngineAdapter(PostgresEngineAdapter):
+    _df_to_source_queries = EngineAdapter._df_to_source_queries  # type: ignore
+
+
+def make_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "name": [f"item_{i % 1000}" for i in range(rows)],
+            "price": rng.random(rows) * 100,
+            "ds": pd.date_range("2024-01-01", periods=rows, freq="min").date,
+        }
+    )
+
+
+def rows_per_second(adapter: EngineAdapter, df: pd.DataFrame, repeat: int) -> float:
+    table = "bulk_load_benchmark"
+    best = float("inf")
+    for _ in range(repeat):
+        adapter.drop_table(table)
+        adapter.create_table(table, COLUMNS_TO_TYPES)
+        start = time.perf_counter()
+        adapter.insert_append(table, df, columns_to_types=COLUMNS_TO_TYPES)
+        best = min(best, time.perf_counter() - start)
+    adapter.drop_table(table)
+    return len(df) / best
+
+
+def adapters(postgres_dsn: t.Optional[str]) -> t.Dict[str, EngineAdapter]:
+    connection = duckdb.connect()
+    result: t.Dict[str, EngineAdapter] = {
+        "duckdb values": ValuesDuckDBEngineAdapter(lambda: connection),
+        "duckdb executemany": ExecutemanyDuckDBEngineAdapter(lambda: connection),
+        "duckdb native": DuckDBEngineAdapter(lambda: connection),
+    }
+    if postgres_dsn:
+        import psycopg2
+
+        result["postgres values"] = ValuesPostgresEngineAdapter(
+            lambda: psycopg2.connect(postgres_dsn)
+        )
+        result["postgres copy"] = PostgresEngineAdapter(lambda: psycopg2.connect(postgres_dsn))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--postgres-dsn", help="A libpq connection string of a local Postgres.")
+    args = parser.parse_args()
+
+    print(f"{'loader':<20}{'rows':>10}{'rows/sec':>14}")
+    for name, adapter in adapters(args.postgres_dsn).items():
+        for rows in args.rows:
+            rate = rows_per_second(adapter, make_df(rows), args.repeat)
+            print(f"{name:<20}{rows:>10}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compares the makespan of a DAG run when ready nodes are processed in FIFO order versus in order of their
+longest remaining path.
+
+Each node sleeps for its duration, so the comparison runs the actual ConcurrentDAGExecutor. Durations are
+either replayed from the evaluation durations recorded in a project's cache (--project), or generated for
+a DAG where a long chain of heavy models competes with many cheap leaf models for the workers.
+
+Usage:
+    python benchmarks/critical_path.py --tasks 4
+    python benchmarks/critical_path.py --project examples/sushi --time-scale 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import typing as t
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.context import Context
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache
+from sqlmesh.utils.concurrency import concurrent_apply_to_dag
+from sqlmesh.utils.dag import DAG
+
+
+def synthetic_timings(
+    chain_length: int = 10, leaves: int = 100
+) -> t.Tuple[DAG[str], t.Dict[str, float]]:
+    rng = random.Random(0)
+    dag: DAG[str] = DAG()
+    durations_ms: t.Dict[str, float] = {"root": 10.0}
+    dag.add("root")
+    for i in range(chain_length):
+        durations_ms[f"chain_{i}"] = 50.0
+        dag.add(f"chain_{i}", [f"chain_{i - 1}" if i else "root"])
+    for i in range(leaves):
+        durations_ms[f"leaf_{i}"] = rng.uniform(5.0, 25.0)
+        dag.add(f"leaf_{i}", ["root"])
+    return dag, durations_ms
+
+
+def recorded_timings(project: str) -> t.Tuple[DAG[str], t.Dict[str, float]]:
+    context = Context(paths=project)
+    snapshots = context.snapshots
+    evaluation_durations = EvaluationDurationCache(
+        context.path / c.CACHE, cache_config=context.config.cache
+    )
+
+    estimates = {
+        name: evaluation_durations.estimate(snapshot, (0, 0))
+        for name, snapshot in snapshots.items()
+    }
+    # Models that were never evaluated are assumed to take as long as a typical one, like in the scheduler.
+    known = sorted(e for e in estimates.values() if e)
+    default = known[len(known) // 2] if known else 1.0
+    durations_ms = {name: estimate or default for name, estimate in estimates.items()}
+
+    dag: DAG[str] = DAG()
+    for name, deps in context.dag.graph.items():
+        if name in snapshots:
+            dag.add(name, [dep for dep in deps if dep in snapshots])
+    return dag, durations_ms
+
+
+def longest_path_priorities(dag: DAG[str], durations_ms: t.Dict[str, float]) -> t.Dict[str, float]:
+    priorities: t.Dict[str, float] = {}
+    downstream = dag.reversed.graph
+    for node in reversed(dag.sorted):
+        priorities[node] = durations_ms[node] + max(
+            (priorities[d] for d in downstream[node]), default=0.0
+        )
+    return priorities
+
+
+def makespan_seconds(
+    dag: DAG[str],
+    durations_ms: t.Dict[str, float],
+    tasks_num: int,
+    time_scale: float,
+    priorities: t.Optional[t.Dict[str, float]] = None,
+) -> float:
+    start = time.perf_counter()
+    concurrent_apply_to_dag(
+        dag,
+        lambda node: time.sleep(durations_ms[node] / 1000 * time_scale),
+        tasks_num,
+        priorities=priorities,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--project", help="Replay the durations recorded in this project's cache.")
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument(
+        "--time-scale", type=float, default=1.0, help="Multiplier applied to every duration."
+    )
+    args = parser.parse_args()
+
+    dag, durations_ms = recorded_timings(args.project) if args.project else synthetic_timings()
+    lower_bound = max(longest_path_priorities(dag, durations_ms).values(), default=0.0)
+
+    print(f"{'ordering':<16}{'makespan s':>12}")
+    print(f"{'lower bound':<16}{lower_bound / 1000 * args.time_scale:>12.3f}")
+    fifo = makespan_seconds(dag, durations_ms, args.tasks, args.time_scale)
+    print(f"{'fifo':<16}{fifo:>12.3f}")
+    critical_path = makespan_seconds(
+        dag,
+        durations_ms,
+        args.tasks,
+        args.time_scale,
+        priorities=longest_path_priorities(dag, durations_ms),
+    )
+    print(f"{'critical path':<16}{critical_path:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measures how the concurrent DAG executor scales with the number of nodes.
+
+The DAG resembles the one built by the scheduler for a large restatement: a few hundred snapshots with
+one node per batch, where each batch depends on the same batch of up to three upstream snapshots. The
+applied function does no work, so the timings reflect the executor's own overhead. The "skip" run fails
+every root node and measures how fast all downstream nodes get skipped.
+
+Usage:
+    python benchmarks/dag_executor.py --nodes 1000 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import typing as t
+
+from sqlmesh.utils.concurrency import concurrent_apply_to_dag
+from sqlmesh.utils.dag import DAG
+
+SNAPSHOTS = 500
+
+Node = t.Tuple[int, int]
+
+
+def make_dag(nodes: int) -> DAG[Node]:
+    rng = random.Random(0)
+    snapshots = min(SNAPSHOTS, nodes)
+    parents = {s: rng.sample(range(s), min(s, 3)) if s else [] for s in range(snapshots)}
+    dag: DAG[Node] = DAG()
+    for batch in range(nodes // snapshots):
+        for snapshot in range(snapshots):
+            dag.add((snapshot, batch), [(parent, batch) for parent in parents[snapshot]])
+    return dag
+
+
+def run_seconds(dag: DAG[Node], fn: t.Callable[[Node], None], tasks_num: int) -> float:
+    start = time.perf_counter()
+    concurrent_apply_to_dag(dag, fn, tasks_num, raise_on_error=False)
+    return time.perf_counter() - start
+
+
+def noop(node: Node) -> None:
+    pass
+
+
+def fail_roots(node: Node) -> None:
+    if node[0] == 0:
+        raise RuntimeError("Root node failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--tasks", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>10}{'run s':>10}{'skip s':>10}{'us/node':>10}")
+    for nodes in args.nodes:
+        dag = make_dag(nodes)
+        size = len(dag.graph)
+        run = run_seconds(dag, noop, args.tasks)
+        skip = run_seconds(dag, fail_roots, args.tasks)
+        print(f"{size:>10}{run:>10.2f}{skip:>10.2f}{run / size * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Microbenchmarks for interval bookkeeping on snapshots with many uncompacted hourly intervals.
+
+Times merge_intervals, remove_interval and compute_missing_intervals on in-memory interval lists, and
+reading the same intervals back from a DuckDB-backed state sync, where every interval is its own row.
+
+Usage:
+    python benchmarks/intervals.py --intervals 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import typing as t
+
+import duckdb
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.node import IntervalUnit
+from sqlmesh.core.snapshot import SnapshotIntervals
+from sqlmesh.core.snapshot.definition import (
+    Intervals,
+    compute_missing_intervals,
+    merge_intervals,
+    remove_interval,
+)
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.utils.date import to_timestamp
+
+HOUR_MS = 60 * 60 * 1000
+START_TS = to_timestamp("2020-01-01")
+
+
+def hourly_intervals(count: int) -> Intervals:
+    """Returns one interval per hour, skipping every 100th hour, in random order."""
+    intervals = [
+        (START_TS + i * HOUR_MS, START_TS + (i + 1) * HOUR_MS) for i in range(count) if i % 100
+    ]
+    random.Random(0).shuffle(intervals)
+    return intervals
+
+
+def best_seconds(fn: t.Callable[[], t.Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def state_sync_read(intervals: Intervals) -> t.Callable[[], t.Any]:
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(duckdb.connect, "duckdb"), schema=c.SQLMESH
+    )
+    state_sync.migrate(default_catalog=None)
+    snapshot_intervals = SnapshotIntervals(
+        name='"db"."hourly"',
+        identifier="1",
+        version="1",
+        intervals=intervals,
+        dev_intervals=[],
+    )
+    state_sync.add_snapshots_intervals([snapshot_intervals])
+    return lambda: state_sync._get_snapshot_intervals([snapshot_intervals.name_version])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intervals", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<28}{'intervals':>11}{'ms':>10}")
+    for count in args.intervals:
+        intervals = hourly_intervals(count)
+        merged = merge_intervals(intervals)
+        end_ts = START_TS + count * HOUR_MS
+        middle_ts = START_TS + (count // 2) * HOUR_MS
+
+        benchmarks: t.Dict[str, t.Callable[[], t.Any]] = {
+            "merge_intervals": lambda: merge_intervals(intervals),
+            "remove_interval": lambda: remove_interval(merged, middle_ts, middle_ts + HOUR_MS),
+            "compute_missing_intervals": lambda: compute_missing_intervals(
+                IntervalUnit.HOUR, tuple(merged), START_TS, end_ts, 0, None
+            ),
+            "state sync read": state_sync_read(intervals),
+        }
+        for name, fn in benchmarks.items():
+            print(f"{name:<28}{count:>11}{best_seconds(fn, args.repeat) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measures cold project load time against the number of SQL models and loader worker processes.
+
+A project of generated SQL models is written to a temporary directory, and its model cache is removed
+before every load so that all models are parsed and built.
+
+Usage:
+    python benchmarks/load_models.py --models 500 2000 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from shutil import rmtree
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.config import Config, ModelDefaultsConfig
+from sqlmesh.core.context import Context
+
+
+def write_project(path: Path, models: int) -> None:
+    models_path = path / c.MODELS
+    models_path.mkdir(parents=True)
+    for i in range(models):
+        # Each model reads from up to two earlier models, which gives the DAG some depth and fan-in.
+        parents = sorted({i // 2, i // 3} - {i}) if i else []
+        source = (
+            " JOIN ".join(
+                f"bench.model_{p} AS p{j}" + (f" ON p0.id = p{j}.id" if j else "")
+                for j, p in enumerate(parents)
+            )
+            if parents
+            else "(SELECT 1 AS id, 'a' AS name, CAST('2024-01-01' AS DATE) AS ds) AS p0"
+        )
+        (models_path / f"model_{i}.sql").write_text(
+            f"""MODEL (
+  name bench.model_{i},
+  kind INCREMENTAL_BY_TIME_RANGE (time_column ds),
+  grain id,
+);
+
+SELECT
+  p0.id::INT AS id,
+  UPPER(p0.name)::TEXT AS name,
+  p0.ds::DATE AS ds
+FROM {source}
+WHERE p0.ds BETWEEN @start_ds AND @end_ds
+"""
+        )
+
+
+def load_seconds(path: Path, workers: int, repeat: int) -> float:
+    config = Config(
+        model_defaults=ModelDefaultsConfig(dialect="duckdb"),
+        loader_kwargs={"max_workers": workers},
+    )
+    best = float("inf")
+    for _ in range(repeat):
+        rmtree(path / c.CACHE, ignore_errors=True)
+        context = Context(paths=path, config=config, load=False)
+        start = time.perf_counter()
+        context.load()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'models':>8}{'workers':>9}{'seconds':>10}")
+    for models in args.models:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            write_project(path, models)
+            for workers in args.workers:
+                seconds = load_seconds(path, workers, args.repeat)
+                print(f"{models:>8}{workers:>9}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measures the latency of a plan on an unchanged project in a new session.
+
+A project of generated SQL models backed by a local DuckDB file is planned and applied once. Each
+measured run then creates a new Context and plans again without any changes, either with the cached
+node hashes removed (cold) or kept from the previous session. Computing the snapshots, which
+fingerprints every node, is also timed on its own. Project loading is excluded from the timings.
+
+Usage:
+    python benchmarks/plan_latency.py --models 200 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+from shutil import rmtree
+
+from rich.console import Console as RichConsole
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.config import Config, DuckDBConnectionConfig, GatewayConfig, ModelDefaultsConfig
+from sqlmesh.core.console import TerminalConsole
+from sqlmesh.core.context import Context
+
+QUIET_CONSOLE = TerminalConsole(console=RichConsole(quiet=True))
+
+
+def write_project(path: Path, models: int) -> Config:
+    models_path = path / c.MODELS
+    models_path.mkdir(parents=True)
+    for i in range(models):
+        source = f"bench.model_{(i - 1) // 2}" if i else "(SELECT 1 AS id, 'a' AS name)"
+        (models_path / f"model_{i}.sql").write_text(
+            f"""MODEL (name bench.model_{i}, kind FULL, audits (not_null(columns := (id))));
+
+@DEF(suffix, '_{i}');
+
+SELECT id::INT AS id, CONCAT(name, @suffix)::TEXT AS name FROM {source} AS s
+"""
+        )
+    return Config(
+        gateways=GatewayConfig(connection=DuckDBConnectionConfig(database=str(path / "db.duckdb"))),
+        model_defaults=ModelDefaultsConfig(dialect="duckdb"),
+    )
+
+
+def best_seconds(
+    path: Path, config: Config, warm: bool, repeat: int, fn: t.Callable[[Context], t.Any]
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if not warm:
+            rmtree(path / c.CACHE / "node_hashes", ignore_errors=True)
+        context = Context(paths=path, config=config, console=QUIET_CONSOLE)
+        start = time.perf_counter()
+        fn(context)
+        best = min(best, time.perf_counter() - start)
+        context.close()
+    return best
+
+
+def plan(context: Context) -> None:
+    assert not context.plan(no_prompts=True, skip_tests=True).has_changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for models in args.models:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            config = write_project(path, models)
+            context = Context(paths=path, config=config, console=QUIET_CONSOLE)
+            context.plan(auto_apply=True, no_prompts=True, skip_tests=True)
+            context.close()
+
+            print(f"\n{'models':>8}{'hashes':>8}{'snapshots s':>13}{'plan s':>10}")
+            for warm in (False, True):
+                snapshots = best_seconds(
+                    path, config, warm, args.repeat, lambda context: context.snapshots
+                )
+                plan_s = best_seconds(path, config, warm, args.repeat, plan)
+                hashes = "cached" if warm else "cold"
+                print(f"{models:>8}{hashes:>8}{snapshots:>13.2f}{plan_s:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
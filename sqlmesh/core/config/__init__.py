@@ -2,6 +2,10 @@ from sqlmesh.core.config.categorizer import (
     AutoCategorizationMode as AutoCategorizationMode,
     CategorizerConfig as CategorizerConfig,
 )
+from sqlmesh.core.config.cache import (
+    CacheConfig as CacheConfig,
+    CacheStore as CacheStore,
+)
 from sqlmesh.core.config.common import EnvironmentSuffixTarget as EnvironmentSuffixTarget
 from sqlmesh.core.config.connection import (
     BaseDuckDBConnectionConfig as BaseDuckDBConnectionConfig,
@@ -30,6 +34,7 @@ from sqlmesh.core.config.migration import MigrationConfig as MigrationConfig
 from sqlmesh.core.config.model import ModelDefaultsConfig as ModelDefaultsConfig
 from sqlmesh.core.config.naming import NameInferenceConfig as NameInferenceConfig
 from sqlmesh.core.config.plan import PlanConfig as PlanConfig
+from sqlmesh.core.config.resource_pool import ResourcePoolConfig as ResourcePoolConfig
 from sqlmesh.core.config.root import Config as Config
 from sqlmesh.core.config.run import RunConfig as RunConfig
 from sqlmesh.core.config.scheduler import (
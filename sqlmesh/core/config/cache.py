@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import typing as t
+from enum import Enum
+from pathlib import Path
+
+from sqlmesh.core.config.base import BaseConfig
+from sqlmesh.utils.cache import BaseCache, FileCache, PackFileCache
+from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.pydantic import field_validator
+
+T = t.TypeVar("T")
+
+
+class CacheStore(str, Enum):
+    FILE = "file"
+    PACK = "pack"
+
+    @property
+    def is_file(self) -> bool:
+        return self == CacheStore.FILE
+
+    @property
+    def is_pack(self) -> bool:
+        return self == CacheStore.PACK
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class CacheConfig(BaseConfig):
+    """The configuration of the local cache of model definitions and optimized queries.
+
+    Args:
+        store: The cache store. "file" stores each entry in a separate file, while "pack" stores all entries
+            in a single memory-mapped pack file.
+        max_size_mb: The maximum size of a pack file in megabytes. Least recently used entries are evicted
+            once the limit is exceeded. Only applies to the "pack" store.
+    """
+
+    store: CacheStore = CacheStore.FILE
+    max_size_mb: int = 1024
+
+    @field_validator("max_size_mb", mode="after")
+    @classmethod
+    def _validate_positive_int(cls, v: int) -> int:
+        if v <= 0:
+            raise ConfigError(f"Value must be a positive integer, got {v}")
+        return v
+
+    def create_cache(self, path: Path, prefix: str) -> BaseCache[T]:
+        """Creates a cache instance in the given folder.
+
+        Args:
+            path: The path to the cache folder.
+            prefix: The prefix shared between all entries of this cache.
+
+        Returns:
+            The cache instance.
+        """
+        if self.store.is_pack:
+            return PackFileCache(path, prefix=prefix, max_size=self.max_size_mb * 1024**2)
+        return FileCache(path, prefix=prefix)
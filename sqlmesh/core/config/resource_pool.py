@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import fnmatch
+import typing as t
+
+from sqlmesh.core.config.base import BaseConfig
+from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.pydantic import field_validator, model_validator, model_validator_v1_args
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.node import _Node
+
+
+class ResourcePoolConfig(BaseConfig):
+    """A pool of concurrency slots shared by the evaluations of models assigned to it.
+
+    Args:
+        max_slots: The number of concurrency slots in the pool.
+        weight: The number of slots taken by the evaluation of a model assigned to the pool.
+        models: Names of models assigned to the pool. Supports wildcards.
+        tags: Tags of models assigned to the pool. Supports wildcards.
+        gateways: Names of gateways. All models are assigned to the pool when running on one of these gateways.
+    """
+
+    max_slots: int
+    weight: int = 1
+    models: t.List[str] = []
+    tags: t.List[str] = []
+    gateways: t.List[str] = []
+
+    @field_validator("max_slots", "weight", mode="after")
+    @classmethod
+    def _validate_positive_int(cls, v: int) -> int:
+        if v <= 0:
+            raise ConfigError(f"Value must be a positive integer, got {v}")
+        return v
+
+    @model_validator(mode="after")
+    @model_validator_v1_args
+    def _validate_weight(cls, values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        weight, max_slots = values.get("weight"), values.get("max_slots")
+        if weight and max_slots and weight > max_slots:
+            raise ConfigError(
+                f"The weight of a resource pool ({weight}) can't exceed its number of slots ({max_slots})."
+            )
+        return values
+
+    def is_assigned(self, node: _Node, gateway: t.Optional[str] = None) -> bool:
+        """Returns whether the given node is assigned to this pool.
+
+        Args:
+            node: The node.
+            gateway: The name of the gateway the node is evaluated on.
+        """
+        if gateway is not None and gateway in self.gateways:
+            return True
+        if any(fnmatch.fnmatchcase(node.name, pattern) for pattern in self.models):
+            return True
+        return any(
+            fnmatch.fnmatchcase(tag.lower(), pattern.lower())
+            for tag in node.tags
+            for pattern in self.tags
+        )
@@ -14,6 +14,7 @@ from sqlmesh.cicd.config import CICDBotConfig
 from sqlmesh.core import constants as c
 from sqlmesh.core.config import EnvironmentSuffixTarget
 from sqlmesh.core.config.base import BaseConfig, UpdateStrategy
+from sqlmesh.core.config.cache import CacheConfig
 from sqlmesh.core.config.common import variables_validator
 from sqlmesh.core.config.connection import (
     ConnectionConfig,
@@ -28,6 +29,7 @@ from sqlmesh.core.config.migration import MigrationConfig
 from sqlmesh.core.config.model import ModelDefaultsConfig
 from sqlmesh.core.config.naming import NameInferenceConfig as NameInferenceConfig
 from sqlmesh.core.config.plan import PlanConfig
+from sqlmesh.core.config.resource_pool import ResourcePoolConfig
 from sqlmesh.core.config.run import RunConfig
 from sqlmesh.core.config.scheduler import BuiltInSchedulerConfig, SchedulerConfig
 from sqlmesh.core.config.ui import UIConfig
@@ -72,6 +74,9 @@ class Config(BaseConfig):
         log_limit: The default number of logs to keep.
         format: The formatting options for SQL code.
         ui: The UI configuration for SQLMesh.
+        cache: The configuration of the local cache of model definitions and optimized queries.
+        resource_pools: Named pools of concurrency slots that limit the number of concurrent evaluations of models
+            assigned to them by the built-in scheduler.
         feature_flags: Feature flags to enable/disable certain features.
         plan: The plan configuration.
         migration: The migration configuration.
@@ -110,6 +115,8 @@ class Config(BaseConfig):
     run: RunConfig = RunConfig()
     format: FormatConfig = FormatConfig()
     ui: UIConfig = UIConfig()
+    cache: CacheConfig = CacheConfig()
+    resource_pools: t.Dict[str, ResourcePoolConfig] = {}
     feature_flags: FeatureFlag = FeatureFlag()
     plan: PlanConfig = PlanConfig()
     migration: MigrationConfig = MigrationConfig()
@@ -129,6 +136,8 @@ class Config(BaseConfig):
         "run": UpdateStrategy.NESTED_UPDATE,
         "format": UpdateStrategy.NESTED_UPDATE,
         "ui": UpdateStrategy.NESTED_UPDATE,
+        "cache": UpdateStrategy.NESTED_UPDATE,
+        "resource_pools": UpdateStrategy.KEY_UPDATE,
         "loader_kwargs": UpdateStrategy.KEY_UPDATE,
         "plan": UpdateStrategy.NESTED_UPDATE,
     }
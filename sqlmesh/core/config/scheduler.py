@@ -8,6 +8,7 @@ import typing as t
 from pydantic import Field
 from requests import Session
 
+from sqlmesh.core import constants as c
 from sqlmesh.core.config.base import BaseConfig
 from sqlmesh.core.config.common import concurrent_tasks_validator
 from sqlmesh.core.console import Console
@@ -17,6 +18,7 @@ from sqlmesh.core.plan import (
     MWAAPlanEvaluator,
     PlanEvaluator,
 )
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache
 from sqlmesh.core.state_sync import EngineAdapterStateSync, StateSync
 from sqlmesh.schedulers.airflow.client import AirflowClient
 from sqlmesh.schedulers.airflow.mwaa_client import MWAAClient
@@ -129,9 +131,43 @@ class _EngineAdapterStateSyncSchedulerConfig(_SchedulerConfig):
 
 
 class BuiltInSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig):
-    """The Built-In Scheduler configuration."""
+    """The Built-In Scheduler configuration.
+
+    Args:
+        audit_concurrent_tasks: The number of non-blocking audits that can run concurrently with the evaluation
+            of other models. If 0, non-blocking audits run right after the audited model is evaluated.
+        interval_commit_batch_size: The number of evaluated intervals that are recorded in the state together.
+        interval_commit_max_delay_seconds: The maximum number of seconds an evaluated interval waits to be recorded
+            in the state.
+        async_evaluation: Whether the DAG of a run is traversed on an asyncio event loop instead of in a pool of
+            threads.
+    """
 
     type_: Literal["builtin"] = Field(alias="type", default="builtin")
+    audit_concurrent_tasks: int = 0
+    interval_commit_batch_size: int = 100
+    interval_commit_max_delay_seconds: float = 10.0
+    async_evaluation: bool = False
+
+    @field_validator("audit_concurrent_tasks", mode="before")
+    @classmethod
+    def _audit_concurrent_tasks_validator(cls, v: t.Any) -> int:
+        if isinstance(v, str):
+            v = int(v)
+        if not isinstance(v, int) or v < 0:
+            raise ConfigError(
+                f"The number of concurrent audit tasks must be a non-negative integer. '{v}' was provided"
+            )
+        return v
+
+    @field_validator(
+        "interval_commit_batch_size", "interval_commit_max_delay_seconds", mode="after"
+    )
+    @classmethod
+    def _interval_commit_validator(cls, v: t.Union[int, float]) -> t.Union[int, float]:
+        if v <= 0:
+            raise ConfigError(f"The interval commit threshold must be positive. '{v}' was provided")
+        return v
 
     def create_plan_evaluator(self, context: GenericContext) -> PlanEvaluator:
         return BuiltInPlanEvaluator(
@@ -141,6 +177,15 @@ class BuiltInSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig)
             backfill_concurrent_tasks=context.concurrent_tasks,
             console=context.console,
             notification_target_manager=context.notification_target_manager,
+            audit_concurrent_tasks=self.audit_concurrent_tasks,
+            evaluation_durations=EvaluationDurationCache(
+                context.path / c.CACHE, cache_config=context.config.cache
+            ),
+            resource_pools=context.config.resource_pools,
+            gateway=context.gateway or context.config.default_gateway_name,
+            interval_commit_batch_size=self.interval_commit_batch_size,
+            interval_commit_max_delay_seconds=self.interval_commit_max_delay_seconds,
+            async_evaluation=self.async_evaluation,
         )
 
     def get_default_catalog(self, context: GenericContext) -> t.Optional[str]:
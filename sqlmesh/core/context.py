@@ -55,7 +55,7 @@ from sqlmesh.core import analytics
 from sqlmesh.core import constants as c
 from sqlmesh.core.analytics import python_api_analytics
 from sqlmesh.core.audit import Audit, StandaloneAudit
-from sqlmesh.core.config import CategorizerConfig, Config, load_configs
+from sqlmesh.core.config import BuiltInSchedulerConfig, CategorizerConfig, Config, load_configs
 from sqlmesh.core.config.loader import C
 from sqlmesh.core.console import Console, get_console
 from sqlmesh.core.context_diff import ContextDiff
@@ -69,7 +69,7 @@ from sqlmesh.core.dialect import (
 )
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.environment import Environment, EnvironmentNamingInfo
-from sqlmesh.core.loader import Loader, update_model_schemas
+from sqlmesh.core.loader import LoadedProject, Loader, update_model_schemas
 from sqlmesh.core.macros import ExecutableOrMacro, macro
 from sqlmesh.core.metric import Metric, rewrite
 from sqlmesh.core.model import Model
@@ -90,8 +90,10 @@ from sqlmesh.core.snapshot import (
     SnapshotFingerprint,
     to_table_mapping,
 )
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache, NodeHashCache
 from sqlmesh.core.state_sync import (
     CachingStateSync,
+    StateLoader,
     StateReader,
     StateSync,
     cleanup_expired_views,
@@ -444,6 +446,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             self.dag,
             self._models,
             self.path,
+            cache_config=self.config.cache,
         )
 
         if model.dialect:
@@ -475,6 +478,17 @@ class GenericContext(BaseContext, t.Generic[C]):
         if not snapshots:
             raise ConfigError("No models were found")
 
+        builtin_scheduler_kwargs: t.Dict[str, t.Any] = (
+            dict(
+                audit_max_workers=self._scheduler.audit_concurrent_tasks,
+                interval_commit_batch_size=self._scheduler.interval_commit_batch_size,
+                interval_commit_max_delay_seconds=self._scheduler.interval_commit_max_delay_seconds,
+                async_evaluation=self._scheduler.async_evaluation,
+            )
+            if isinstance(self._scheduler, BuiltInSchedulerConfig)
+            else {}
+        )
+
         return Scheduler(
             snapshots,
             self.snapshot_evaluator,
@@ -483,6 +497,12 @@ class GenericContext(BaseContext, t.Generic[C]):
             max_workers=self.concurrent_tasks,
             console=self.console,
             notification_target_manager=self.notification_target_manager,
+            evaluation_durations=EvaluationDurationCache(
+                self.path / c.CACHE, cache_config=self.config.cache
+            ),
+            resource_pools=self.config.resource_pools,
+            gateway=self.gateway or self.config.default_gateway_name,
+            **builtin_scheduler_kwargs,
         )
 
     @property
@@ -500,38 +520,28 @@ class GenericContext(BaseContext, t.Generic[C]):
     def state_reader(self) -> StateReader:
         return self.state_sync
 
-    def refresh(self) -> None:
-        """Refresh all models that have been updated."""
-        if self._loader.reload_needed():
+    def refresh(self, paths: t.Optional[t.Iterable[Path]] = None) -> None:
+        """Refresh all models that have been updated.
+
+        Args:
+            paths: The files that have been created, modified or deleted, if known. If only model files
+                have changed, just the models defined in them are reloaded instead of the whole project.
+        """
+        if paths is not None:
+            with sys_path(*self.configs):
+                project = self._loader.reload(self, paths)
+            if project is not None:
+                self._set_project(project)
+                return
+            self.load()
+        elif self._loader.reload_needed():
             self.load()
 
     def load(self, update_schemas: bool = True) -> GenericContext[C]:
         """Load all files in the context's path."""
         load_start_ts = time.perf_counter()
         with sys_path(*self.configs):
-            project = self._loader.load(self, update_schemas)
-            self._macros = project.macros
-            self._jinja_macros = project.jinja_macros
-            self._models = project.models
-            self._metrics = project.metrics
-            self._standalone_audits.clear()
-            self._audits.clear()
-            for name, audit in project.audits.items():
-                if isinstance(audit, StandaloneAudit):
-                    self._standalone_audits[name] = audit
-                else:
-                    self._audits[name] = audit
-            self.dag = project.dag
-
-            duplicates = set(self._models) & set(self._standalone_audits)
-            if duplicates:
-                raise ConfigError(
-                    f"Models and Standalone audits cannot have the same name: {duplicates}"
-                )
-
-            self._all_dialects = {m.dialect for m in self._models.values() if m.dialect} | {
-                self.default_dialect or ""
-            }
+            self._set_project(self._loader.load(self, update_schemas))
 
         analytics.collector.on_project_loaded(
             project_type=(
@@ -549,6 +559,30 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         return self
 
+    def _set_project(self, project: LoadedProject) -> None:
+        self._macros = project.macros
+        self._jinja_macros = project.jinja_macros
+        self._models = project.models
+        self._metrics = project.metrics
+        self._standalone_audits.clear()
+        self._audits.clear()
+        for name, audit in project.audits.items():
+            if isinstance(audit, StandaloneAudit):
+                self._standalone_audits[name] = audit
+            else:
+                self._audits[name] = audit
+        self.dag = project.dag
+
+        duplicates = set(self._models) & set(self._standalone_audits)
+        if duplicates:
+            raise ConfigError(
+                f"Models and Standalone audits cannot have the same name: {duplicates}"
+            )
+
+        self._all_dialects = {m.dialect for m in self._models.values() if m.dialect} | {
+            self.default_dialect or ""
+        }
+
     @python_api_analytics
     def run(
         self,
@@ -1108,14 +1142,27 @@ class GenericContext(BaseContext, t.Generic[C]):
         if restate_models is not None:
             expanded_restate_models = model_selector.expand_model_selections(restate_models)
 
-        snapshots = self._snapshots(models_override)
+        force_no_diff = restate_models is not None or (
+            backfill_models is not None and not backfill_models
+        )
+        # Environments and snapshots are shared between the stages of the plan, and the previous
+        # versions of modified snapshots are fetched along with the stored local snapshots.
+        state_loader = StateLoader(self.state_reader)
+        if not force_no_diff:
+            state_loader.prefetch_environment(
+                Environment.sanitize_name(environment or c.PROD),
+                create_from or c.PROD,
+                ensure_finalized_snapshots=self.config.plan.use_finalized_state,
+            )
+
+        snapshots = self._snapshots(models_override, state_loader=state_loader)
         context_diff = self._context_diff(
             environment or c.PROD,
             snapshots=snapshots,
             create_from=create_from,
-            force_no_diff=restate_models is not None
-            or (backfill_models is not None and not backfill_models),
+            force_no_diff=force_no_diff,
             ensure_finalized_snapshots=self.config.plan.use_finalized_state,
+            state_loader=state_loader,
         )
 
         if (
@@ -1873,19 +1920,26 @@ class GenericContext(BaseContext, t.Generic[C]):
         }
 
     def _snapshots(
-        self, models_override: t.Optional[UniqueKeyDict[str, Model]] = None
+        self,
+        models_override: t.Optional[UniqueKeyDict[str, Model]] = None,
+        state_loader: t.Optional[StateLoader] = None,
     ) -> t.Dict[str, Snapshot]:
-        prod = self.state_reader.get_environment(c.PROD)
+        state_loader = state_loader or StateLoader(self.state_reader)
+        local_nodes = {**(models_override or self._models), **self._standalone_audits}
+
+        # Remote snapshots are only used in place of nodes that don't exist locally.
+        prod = state_loader.get_environment(c.PROD)
         remote_snapshots = (
             {
                 snapshot.name: snapshot
-                for snapshot in self.state_reader.get_snapshots(prod.snapshots).values()
+                for snapshot in state_loader.get_snapshots(
+                    s for s in prod.snapshots if s.name not in local_nodes
+                ).values()
             }
             if prod
             else {}
         )
 
-        local_nodes = {**(models_override or self._models), **self._standalone_audits}
         nodes = local_nodes.copy()
         audits = self._audits.copy()
         projects = {config.project for config in self.configs.values()}
@@ -1920,8 +1974,11 @@ class GenericContext(BaseContext, t.Generic[C]):
                 snapshots[snapshot.name] = snapshot
             return snapshots
 
+        NodeHashCache(self.path / c.CACHE, cache_config=self.config.cache).update_hashes(
+            local_nodes.values(), audits
+        )
         snapshots = _nodes_to_snapshots(nodes)
-        stored_snapshots = self.state_reader.get_snapshots(snapshots.values())
+        stored_snapshots = state_loader.get_stored_snapshots(list(snapshots.values()))
 
         unrestorable_snapshots = {
             snapshot
@@ -1938,7 +1995,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                     update={"stamp": f"revert to {snapshot.identifier}"}
                 )
             snapshots = _nodes_to_snapshots(nodes)
-            stored_snapshots = self.state_reader.get_snapshots(snapshots.values())
+            stored_snapshots = state_loader.get_stored_snapshots(list(snapshots.values()))
 
         for snapshot in stored_snapshots.values():
             # Keep the original model instance to preserve the query cache.
@@ -1953,24 +2010,29 @@ class GenericContext(BaseContext, t.Generic[C]):
         create_from: t.Optional[str] = None,
         force_no_diff: bool = False,
         ensure_finalized_snapshots: bool = False,
+        state_loader: t.Optional[StateLoader] = None,
     ) -> ContextDiff:
         environment = Environment.sanitize_name(environment)
+        state_reader = state_loader or self.state_reader
         if force_no_diff:
-            return ContextDiff.create_no_diff(environment, self.state_reader)
+            return ContextDiff.create_no_diff(environment, state_reader)
 
         return ContextDiff.create(
             environment,
             snapshots=snapshots or self.snapshots,
             create_from=create_from or c.PROD,
-            state_reader=self.state_reader,
+            state_reader=state_reader,
             ensure_finalized_snapshots=ensure_finalized_snapshots,
         )
 
     def _run_janitor(self, ignore_ttl: bool = False) -> None:
         self._cleanup_environments()
-        expired_snapshots = self.state_sync.delete_expired_snapshots(ignore_ttl=ignore_ttl)
-        self.snapshot_evaluator.cleanup(
-            expired_snapshots, on_complete=self.console.update_cleanup_progress
+        # Expired snapshots are only removed from the state once all of their tables have been dropped.
+        self.state_sync.delete_expired_snapshots(
+            ignore_ttl=ignore_ttl,
+            cleanup=lambda cleanup_tasks: self.snapshot_evaluator.cleanup(
+                cleanup_tasks, on_complete=self.console.update_cleanup_progress
+            ),
         )
 
         self.state_sync.compact_intervals()
@@ -21,7 +21,7 @@ from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
 if t.TYPE_CHECKING:
-    from sqlmesh.core.state_sync import StateReader
+    from sqlmesh.core.state_sync import StateLoader, StateReader
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +66,7 @@ class ContextDiff(PydanticModel):
         environment: str,
         snapshots: t.Dict[str, Snapshot],
         create_from: str,
-        state_reader: StateReader,
+        state_reader: t.Union[StateReader, StateLoader],
         ensure_finalized_snapshots: bool = False,
     ) -> ContextDiff:
         """Create a ContextDiff object.
@@ -76,7 +76,7 @@ class ContextDiff(PydanticModel):
             snapshots: The snapshots of the current environment.
             create_from: The environment to create the target environment from if it
                 doesn't exist.
-            state_reader: StateReader to access the remote environment to diff.
+            state_reader: StateReader or StateLoader to access the remote environment to diff.
             ensure_finalized_snapshots: Whether to compare against snapshots from the latest finalized
                 environment state, or to use whatever snapshots are in the current environment state even if
                 the environment is not finalized.
@@ -122,9 +122,12 @@ class ContextDiff(PydanticModel):
             and snapshot.fingerprint != remote_snapshot_name_to_info[snapshot.name].fingerprint
         }
 
-        stored = state_reader.get_snapshots(
-            [*snapshots.values(), *modified_snapshot_name_to_snapshot_info.values()]
-        )
+        # Only the previous versions of modified snapshots need their stored nodes.
+        stored = state_reader.get_stored_snapshots(list(snapshots.values()))
+        if modified_snapshot_name_to_snapshot_info:
+            stored.update(
+                state_reader.get_snapshots(modified_snapshot_name_to_snapshot_info.values())
+            )
 
         merged_snapshots = {}
         modified_snapshots = {}
@@ -177,7 +180,9 @@ class ContextDiff(PydanticModel):
         )
 
     @classmethod
-    def create_no_diff(cls, environment: str, state_reader: StateReader) -> ContextDiff:
+    def create_no_diff(
+        cls, environment: str, state_reader: t.Union[StateReader, StateLoader]
+    ) -> ContextDiff:
         """Create a no-op ContextDiff object.
 
         Args:
@@ -9,6 +9,7 @@ the SnapshotEvaluator delegate them to engine adapters so these components can b
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import itertools
 import logging
@@ -1928,12 +1929,46 @@ class EngineAdapter:
                 self._log_sql(sql)
                 self._execute(sql, **kwargs)
 
+    async def execute_async(
+        self,
+        expressions: t.Union[str, exp.Expression, t.Sequence[exp.Expression]],
+        ignore_unsupported_errors: bool = False,
+        quote_identifiers: bool = True,
+        **kwargs: t.Any,
+    ) -> None:
+        """Execute a sql query without blocking the running event loop.
+
+        Statements are executed one after another outside of a transaction and their results are discarded.
+        Engines that run queries as remote jobs submit a job and poll its status, so that no thread is held
+        while the job is running. Other engines execute each statement in a worker thread.
+        """
+        to_sql_kwargs = (
+            {"unsupported_level": ErrorLevel.IGNORE} if ignore_unsupported_errors else {}
+        )
+
+        for e in ensure_list(expressions):
+            sql = t.cast(
+                str,
+                (
+                    self._to_sql(e, quote=quote_identifiers, **to_sql_kwargs)
+                    if isinstance(e, exp.Expression)
+                    else e
+                ),
+            )
+            self._log_sql(sql)
+            await self._execute_async(sql, **kwargs)
+
     def _log_sql(self, sql: str) -> None:
         logger.log(self._execute_log_level, "Executing SQL: %s", sql)
 
     def _execute(self, sql: str, **kwargs: t.Any) -> None:
         self.cursor.execute(sql, **kwargs)
 
+    async def _execute_async(self, sql: str, **kwargs: t.Any) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._execute, sql, **kwargs)
+        )
+
     @contextlib.contextmanager
     def temp_table(
         self,
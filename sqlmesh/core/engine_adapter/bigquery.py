@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import typing as t
+from functools import partial
 
 import pandas as pd
 from sqlglot import exp
@@ -24,7 +27,7 @@ from sqlmesh.utils.errors import SQLMeshError
 if t.TYPE_CHECKING:
     from google.api_core.retry import Retry
     from google.cloud import bigquery
-    from google.cloud.bigquery import StandardSqlDataType
+    from google.cloud.bigquery import QueryJob, QueryJobConfig, StandardSqlDataType
     from google.cloud.bigquery.client import Client as BigQueryClient
     from google.cloud.bigquery.job.base import _AsyncJob as BigQueryQueryResult
     from google.cloud.bigquery.table import Table as BigQueryTable
@@ -50,6 +53,7 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
     CATALOG_SUPPORT = CatalogSupport.FULL_SUPPORT
     MAX_TABLE_COMMENT_LENGTH = 1024
     MAX_COLUMN_COMMENT_LENGTH = 1024
+    ASYNC_JOB_POLL_INTERVAL_SECONDS = 1.0
 
     # SQL is not supported for adding columns to structs: https://cloud.google.com/bigquery/docs/managing-table-schemas#api_1
     # Can explore doing this with the API in the future
@@ -627,12 +631,45 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
         **kwargs: t.Any,
     ) -> None:
         """Execute a sql query."""
-        from google.cloud.bigquery import QueryJobConfig
-        from google.cloud.bigquery.query import ConnectionProperty
-
         # BigQuery's Python DB API implementation does not support retries, so we have to implement them ourselves.
         # So we update the cursor's query job and query data with the results of the new query job. This makes sure
         # that other cursor based operations execute correctly.
+        self._query_job = self._create_query_job(self.client, sql, self._query_job_config())
+
+        results = self._db_call(
+            self._query_job.result,
+            timeout=self._extra_config.get("job_execution_timeout_seconds"),  # type: ignore
+        )
+        self._query_data = iter(results) if results.total_rows else iter([])
+        query_results = self._query_job._query_results
+        self.cursor._set_rowcount(query_results)
+        self.cursor._set_description(query_results.schema)
+
+    async def _execute_async(self, sql: str, **kwargs: t.Any) -> None:
+        # The client and the session are resolved in the calling thread, so that all jobs are submitted through
+        # the connection of the thread that runs the event loop. Worker threads are only used for the short
+        # API calls that submit a job and check its status.
+        loop = asyncio.get_running_loop()
+        query_job = await loop.run_in_executor(
+            None, partial(self._create_query_job, self.client, sql, self._query_job_config())
+        )
+
+        timeout = self._extra_config.get("job_execution_timeout_seconds")
+        deadline = time.monotonic() + timeout if timeout else None
+        while not await loop.run_in_executor(None, partial(query_job.done, retry=self.__retry)):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise SQLMeshError(
+                    f"BigQuery job '{query_job.job_id}' didn't finish within {timeout} seconds."
+                )
+            await asyncio.sleep(self.ASYNC_JOB_POLL_INTERVAL_SECONDS)
+
+        # Raises the error of a failed job.
+        query_job.result()
+
+    def _query_job_config(self) -> QueryJobConfig:
+        from google.cloud.bigquery import QueryJobConfig
+        from google.cloud.bigquery.query import ConnectionProperty
+
         session_id = self._session_id
         connection_properties = (
             [
@@ -641,10 +678,13 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
             if session_id
             else []
         )
+        return QueryJobConfig(**self._job_params, connection_properties=connection_properties)
 
-        job_config = QueryJobConfig(**self._job_params, connection_properties=connection_properties)
-        self._query_job = self._db_call(
-            self.client.query,
+    def _create_query_job(
+        self, client: BigQueryClient, sql: str, job_config: QueryJobConfig
+    ) -> QueryJob:
+        query_job = self._db_call(
+            client.query,
             query=sql,
             job_config=job_config,
             timeout=self._extra_config.get("job_creation_timeout_seconds"),
@@ -652,19 +692,11 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
 
         logger.debug(
             "BigQuery job created: https://console.cloud.google.com/bigquery?project=%s&j=bq:%s:%s",
-            self._query_job.project,
-            self._query_job.location,
-            self._query_job.job_id,
+            query_job.project,
+            query_job.location,
+            query_job.job_id,
         )
-
-        results = self._db_call(
-            self._query_job.result,
-            timeout=self._extra_config.get("job_execution_timeout_seconds"),  # type: ignore
-        )
-        self._query_data = iter(results) if results.total_rows else iter([])
-        query_results = self._query_job._query_results
-        self.cursor._set_rowcount(query_results)
-        self.cursor._set_description(query_results.schema)
+        return query_job
 
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
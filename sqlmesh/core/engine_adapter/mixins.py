@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import typing as t
 
+import numpy as np
+import pandas as pd
 from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base import EngineAdapter
@@ -12,7 +14,7 @@ from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import TableName
-    from sqlmesh.core.engine_adapter._typing import DF
+    from sqlmesh.core.engine_adapter._typing import DF, Query
     from sqlmesh.core.engine_adapter.base import QueryOrDF
 
 logger = logging.getLogger(__name__)
@@ -312,3 +314,111 @@ class VarcharSizeWorkaroundMixin(EngineAdapter):
                 self.drop_view(temp_view_name)
 
         return statement
+
+
+class BulkLoadDataFrameMixin(EngineAdapter):
+    """Loads pandas DataFrames into a temporary table using the driver's bulk-load facilities instead of
+    rendering every row as a VALUES literal.
+
+    By default rows are sent with `executemany` and parameter binding. Adapters can override `_bulk_load_df`
+    to use a faster engine-specific mechanism. DataFrames with fewer than `BULK_LOAD_MIN_ROWS` rows are still
+    rendered as VALUES, since creating, loading and dropping the temporary table costs more round trips than
+    the literals save.
+    """
+
+    BULK_LOAD_PARAMETER_PLACEHOLDER = "%s"
+    BULK_LOAD_MIN_ROWS = 1000
+
+    def _df_to_source_queries(
+        self,
+        df: DF,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+        target_table: TableName,
+    ) -> t.List[SourceQuery]:
+        assert isinstance(df, pd.DataFrame)
+        if not self._use_bulk_load(df, columns_to_types):
+            return super()._df_to_source_queries(df, columns_to_types, batch_size, target_table)
+
+        temp_table = self._get_temp_table(target_table or "pandas")
+
+        def query_factory() -> Query:
+            # It is possible for the factory to be called multiple times and if so then the temp table will already
+            # be created so we skip creating again. This means we are assuming the first call is the same result
+            # as later calls.
+            if not self.table_exists(temp_table):
+                self.create_table(temp_table, columns_to_types)
+                self._bulk_load_df(temp_table, df, columns_to_types, batch_size)
+            return exp.select(*self._casted_columns(columns_to_types)).from_(temp_table)
+
+        return [
+            SourceQuery(
+                query_factory=query_factory,
+                cleanup_func=lambda: self.drop_table(temp_table),
+            )
+        ]
+
+    def _use_bulk_load(self, df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]) -> bool:
+        """Whether the DataFrame should be loaded through a temporary table instead of VALUES literals."""
+        # Drivers can't bind lists and dicts to arrays, structs and JSON columns, while literals rendered
+        # with sqlglot can represent them
+        return len(df.index) >= self.BULK_LOAD_MIN_ROWS and not _has_nested_values(
+            df, columns_to_types
+        )
+
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+    ) -> None:
+        """Loads the contents of the DataFrame into an existing table.
+
+        Args:
+            table: The table to load the data into.
+            df: The DataFrame to load.
+            columns_to_types: A mapping between the column name and its data type.
+            batch_size: The maximum number of rows to send to the engine at once. 0 means no limit.
+        """
+        columns = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True)
+            for column in columns_to_types
+        )
+        placeholders = ", ".join([self.BULK_LOAD_PARAMETER_PLACEHOLDER] * len(columns_to_types))
+        sql = f"INSERT INTO {table.sql(dialect=self.dialect, identify=True)} ({columns}) VALUES ({placeholders})"
+
+        # Converting to the object dtype turns numpy scalars into the native Python types that DB-API drivers
+        # know how to bind.
+        df = df[list(columns_to_types)].astype(object)
+        df = df.where(pd.notnull(df), None)
+        rows: t.List[t.Tuple[t.Any, ...]] = list(df.itertuples(index=False, name=None))
+
+        batch_size = len(rows) if batch_size == 0 else batch_size
+        cursor = self.cursor
+        for i in range(0, len(rows), max(batch_size, 1)):
+            self._log_sql(sql)
+            cursor.executemany(sql, rows[i : i + batch_size])
+
+
+_NESTED_TYPES = (
+    exp.DataType.Type.ARRAY,
+    exp.DataType.Type.JSON,
+    exp.DataType.Type.JSONB,
+    exp.DataType.Type.MAP,
+    exp.DataType.Type.STRUCT,
+)
+
+
+def _has_nested_values(df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]) -> bool:
+    """Whether any of the columns is of a nested type or contains lists or dicts."""
+    for column, kind in columns_to_types.items():
+        if kind.is_type(*_NESTED_TYPES):
+            return True
+        if (
+            column in df.columns
+            and df.dtypes[column] == object
+            and df[column].map(lambda value: isinstance(value, (list, dict, np.ndarray))).any()
+        ):
+            return True
+    return False
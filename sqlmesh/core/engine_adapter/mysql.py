@@ -7,6 +7,7 @@ from sqlglot import exp, parse_one
 
 from sqlmesh.core.dialect import to_schema
 from sqlmesh.core.engine_adapter.mixins import (
+    BulkLoadDataFrameMixin,
     LogicalMergeMixin,
     NonTransactionalTruncateMixin,
     PandasNativeFetchDFSupportMixin,
@@ -21,6 +22,8 @@ from sqlmesh.core.engine_adapter.shared import (
 from sqlmesh.core.schema_diff import SchemaDiffer
 
 if t.TYPE_CHECKING:
+    import pandas as pd
+
     from sqlmesh.core._typing import SchemaName, TableName
 
 logger = logging.getLogger(__name__)
@@ -31,6 +34,7 @@ class MySQLEngineAdapter(
     LogicalMergeMixin,
     PandasNativeFetchDFSupportMixin,
     NonTransactionalTruncateMixin,
+    BulkLoadDataFrameMixin,
 ):
     DEFAULT_BATCH_SIZE = 200
     DIALECT = "mysql"
@@ -164,3 +168,9 @@ class MySQLEngineAdapter(
 
     def ping(self) -> None:
         self._connection_pool.get().ping(reconnect=False)
+
+    def _use_bulk_load(self, df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]) -> bool:
+        # Creating the temporary table would implicitly commit the open transaction.
+        return not self._connection_pool.is_transaction_active and super()._use_bulk_load(
+            df, columns_to_types
+        )
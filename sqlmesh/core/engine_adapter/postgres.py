@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import io
 import logging
 import typing as t
+
+import pandas as pd
+from pandas.api.types import is_float_dtype  # type: ignore
 from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base_postgres import BasePostgresEngineAdapter
 from sqlmesh.core.engine_adapter.mixins import (
+    BulkLoadDataFrameMixin,
     GetCurrentCatalogFromFunctionMixin,
     PandasNativeFetchDFSupportMixin,
 )
@@ -23,8 +28,10 @@ class PostgresEngineAdapter(
     BasePostgresEngineAdapter,
     PandasNativeFetchDFSupportMixin,
     GetCurrentCatalogFromFunctionMixin,
+    BulkLoadDataFrameMixin,
 ):
     DIALECT = "postgres"
+    COPY_BATCH_SIZE = 100000
     SUPPORTS_INDEXES = True
     HAS_VIEW_BINDING = True
     CURRENT_CATALOG_EXPRESSION = exp.column("current_catalog")
@@ -70,3 +77,72 @@ class PostgresEngineAdapter(
         if not self._connection_pool.is_transaction_active:
             self._connection_pool.commit()
         return df
+
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+    ) -> None:
+        """Streams the DataFrame with `COPY ... FROM STDIN` if the driver supports it (eg. psycopg2), otherwise
+        falls back to `executemany`, which can also bind the values that CSV can't represent."""
+        cursor = self.cursor
+        df = df[list(columns_to_types)]
+        if (
+            not hasattr(cursor, "copy_expert")
+            or _contains_null_marker(df)
+            or _has_binary_values(df, columns_to_types)
+        ):
+            return super()._bulk_load_df(table, df, columns_to_types, batch_size)
+
+        for column, kind in columns_to_types.items():
+            # Pandas stores integers as floats if the column contains nulls, which would be written as
+            # "1.0" and rejected by Postgres
+            if (
+                kind.is_type(*exp.DataType.INTEGER_TYPES)
+                and is_float_dtype(df.dtypes[column])
+                and (df[column].dropna() % 1 == 0).all()
+            ):
+                df = df.assign(**{column: df[column].astype("Int64")})
+
+        columns = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True)
+            for column in columns_to_types
+        )
+        sql = f"COPY {table.sql(dialect=self.dialect, identify=True)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL_MARKER}')"
+
+        for i in range(0, len(df.index), self.COPY_BATCH_SIZE):
+            buffer = io.StringIO()
+            df.iloc[i : i + self.COPY_BATCH_SIZE].to_csv(
+                buffer, index=False, header=False, na_rep=_COPY_NULL_MARKER
+            )
+            buffer.seek(0)
+            self._log_sql(sql)
+            cursor.copy_expert(sql, buffer)
+
+
+_COPY_NULL_MARKER = "\\N"
+
+
+def _contains_null_marker(df: pd.DataFrame) -> bool:
+    """Whether any string in the DataFrame would be loaded as NULL by `COPY`, which doesn't quote them."""
+    return any(
+        (df[column] == _COPY_NULL_MARKER).any()
+        for column, dtype in df.dtypes.items()
+        if dtype == object or pd.api.types.is_string_dtype(dtype)
+    )
+
+
+def _has_binary_values(df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]) -> bool:
+    """Whether any of the columns is binary or contains bytes, which `COPY` in CSV format would load as text."""
+    return any(
+        kind.is_type(exp.DataType.Type.BINARY, exp.DataType.Type.VARBINARY)
+        or (
+            df.dtypes[column] == object
+            and df[column]
+            .map(lambda value: isinstance(value, (bytes, bytearray, memoryview)))
+            .any()
+        )
+        for column, kind in columns_to_types.items()
+    )
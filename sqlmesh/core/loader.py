@@ -3,12 +3,18 @@ from __future__ import annotations
 import abc
 import linecache
 import logging
+import multiprocessing
 import os
+import sys
+import threading
 import typing as t
 from collections import defaultdict
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from sqlglot import exp
 from sqlglot.errors import SchemaError, SqlglotError
 from sqlglot.schema import MappingSchema
 
@@ -23,6 +29,7 @@ from sqlmesh.core.model import (
     ModelCache,
     OptimizedQueryCache,
     SeedModel,
+    SqlModel,
     create_external_model,
     load_sql_based_model,
 )
@@ -35,7 +42,7 @@ from sqlmesh.utils.metaprogramming import import_python_file
 from sqlmesh.utils.yaml import YAML
 
 if t.TYPE_CHECKING:
-    from sqlmesh.core.config import Config
+    from sqlmesh.core.config import CacheConfig, Config
     from sqlmesh.core.context import GenericContext
 
 
@@ -47,9 +54,43 @@ def update_model_schemas(
     dag: DAG[str],
     models: UniqueKeyDict[str, Model],
     context_path: Path,
-) -> None:
-    schema = MappingSchema(normalize=False)
-    optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(context_path / c.CACHE)
+    previous_models: t.Optional[t.Dict[str, Model]] = None,
+    schema: t.Optional[MappingSchema] = None,
+    unchanged_models: t.Optional[t.Set[str]] = None,
+    cache_config: t.Optional[CacheConfig] = None,
+) -> MappingSchema:
+    """Updates the mapping schemas of the given models and their optimized queries in topological order.
+
+    When the models and the schema produced by a previous call are provided, the schema is updated
+    incrementally: unchanged models are replaced with their previous instances, unless the columns of
+    at least one of their upstream dependencies have changed. Propagation stops at models whose columns
+    remain the same.
+
+    Args:
+        dag: The DAG of the models.
+        models: The models to update. Unchanged models are replaced in place with their previous instances.
+        context_path: The path to the context, used to locate the optimized query cache.
+        previous_models: The models that have been updated by the previous call.
+        schema: The schema returned by the previous call. Updated in place.
+        unchanged_models: Names of models which source files haven't been modified since the previous call.
+            Only these models are compared with their previous instances.
+        cache_config: The configuration of the optimized query cache.
+
+    Returns:
+        The schema with columns of all models for which columns are known.
+    """
+    previous_models = (previous_models or {}) if schema is not None else {}
+    schema = schema if schema is not None else MappingSchema(normalize=False)
+    optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(
+        context_path / c.CACHE, cache_config
+    )
+
+    # Names of models which columns are different from the ones in the previous schema
+    changed_columns: t.Set[str] = set()
+    for name in previous_models.keys() - models.keys():
+        if previous_models[name].columns_to_types is not None:
+            _clear_model_columns(schema, name)
+            changed_columns.add(name)
 
     for name in dag.sorted:
         model = models.get(name)
@@ -58,15 +99,37 @@ def update_model_schemas(
         if not model:
             continue
 
+        previous_model = previous_models.get(name)
+        if (
+            previous_model is not None
+            and unchanged_models
+            and name in unchanged_models
+            and not model.depends_on & changed_columns
+            and _same_definition(model, previous_model)
+        ):
+            models.update({name: previous_model})
+            continue
+
+        if model is previous_model:
+            # The instance is shared with the previous call, so its copy is updated instead
+            model = model.copy(update={"mapping_schema": deepcopy(model.mapping_schema)})
+            models.update({name: model})
+
         try:
             model.update_schema(schema)
             optimized_query_cache.with_optimized_query(model)
 
             columns_to_types = model.columns_to_types
+            if columns_to_types == (previous_model and previous_model.columns_to_types):
+                continue
+
+            changed_columns.add(name)
             if columns_to_types is not None:
                 schema.add_table(
                     model.fqn, columns_to_types, dialect=model.dialect, normalize=False
                 )
+            else:
+                _clear_model_columns(schema, name)
         except SchemaError as e:
             if "nesting level:" in str(e):
                 logger.error(
@@ -74,6 +137,25 @@ def update_model_schemas(
                 )
             raise
 
+    return schema
+
+
+def _same_definition(model: Model, other: Model) -> bool:
+    if type(model) is not type(other) or model._path != other._path:
+        return False
+    return all(
+        model.__dict__.get(field) == other.__dict__.get(field)
+        for field in model.all_field_infos()
+        if field != "mapping_schema"
+    )
+
+
+def _clear_model_columns(schema: MappingSchema, name: str) -> None:
+    # Lookups treat tables with no columns the same way as tables that are missing from the schema
+    columns = schema.find(exp.to_table(name), raise_on_missing=False)
+    if columns:
+        columns.clear()
+
 
 @dataclass
 class LoadedProject:
@@ -91,6 +173,10 @@ class Loader(abc.ABC):
     def __init__(self) -> None:
         self._path_mtimes: t.Dict[Path, float] = {}
         self._dag: DAG[str] = DAG()
+        self._schema: t.Optional[MappingSchema] = None
+        self._schema_models: t.Dict[str, Model] = {}
+        self._project: t.Optional[LoadedProject] = None
+        self._update_schemas = True
 
     def load(self, context: GenericContext, update_schemas: bool = True) -> LoadedProject:
         """
@@ -103,10 +189,13 @@ class Loader(abc.ABC):
         # python files are cached by the system
         # need to manually clear here so we can reload macros
         linecache.clearcache()
+        _unload_project_modules(context.configs)
 
         self._context = context
-        self._path_mtimes.clear()
+        previous_path_mtimes = self._path_mtimes
+        self._path_mtimes = {}
         self._dag = DAG()
+        self._project = None
 
         self._load_materializations()
         self._load_signals()
@@ -132,15 +221,17 @@ class Loader(abc.ABC):
         for model in models.values():
             self._add_model_to_dag(model)
 
+        self._update_schemas = update_schemas
         if update_schemas:
-            update_model_schemas(
-                self._dag,
+            self._update_model_schemas(
                 models,
-                self._context.path,
+                unchanged_models={
+                    name
+                    for name, model in models.items()
+                    if model._path in previous_path_mtimes
+                    and previous_path_mtimes[model._path] == self._path_mtimes.get(model._path)
+                },
             )
-            for model in models.values():
-                # The model definition can be validated correctly only after the schema is set.
-                model.validate_definition()
 
         metrics = self._load_metrics()
 
@@ -152,8 +243,23 @@ class Loader(abc.ABC):
             metrics=expand_metrics(metrics),
             dag=self._dag,
         )
+        self._project = project
         return project
 
+    def reload(self, context: GenericContext, paths: t.Iterable[Path]) -> t.Optional[LoadedProject]:
+        """
+        Applies changes to the given files to the project loaded by the last call to `load`.
+
+        Args:
+            context: The context to reload macros and models for.
+            paths: The files that have been created, modified or deleted since the last load.
+
+        Returns:
+            The updated project or None if the changes can't be applied incrementally, in which case
+            the whole project needs to be loaded again.
+        """
+        return None
+
     def reload_needed(self) -> bool:
         """
         Checks for any modifications to the files the macros and models depend on
@@ -267,6 +373,28 @@ class Loader(abc.ABC):
             else:
                 yield filepath
 
+    def _update_model_schemas(
+        self, models: UniqueKeyDict[str, Model], unchanged_models: t.Set[str]
+    ) -> None:
+        schema, schema_models = self._schema, self._schema_models
+        # Reset the state first, so that a failed update doesn't leave it partially updated
+        self._schema, self._schema_models = None, {}
+        self._schema = update_model_schemas(
+            self._dag,
+            models,
+            self._context.path,
+            previous_models=schema_models,
+            schema=schema,
+            unchanged_models=unchanged_models,
+            cache_config=self._context.config.cache,
+        )
+        for name, model in models.items():
+            # The model definition can be validated correctly only after the schema is set.
+            # Previous instances have already been validated.
+            if model is not schema_models.get(name):
+                model.validate_definition()
+        self._schema_models = dict(models)
+
     def _add_model_to_dag(self, model: Model) -> None:
         self._dag.add(model.fqn, model.depends_on)
 
@@ -276,7 +404,148 @@ class Loader(abc.ABC):
 
 
 class SqlMeshLoader(Loader):
-    """Loads macros and models for a context using the SQLMesh file formats"""
+    """Loads macros and models for a context using the SQLMesh file formats
+
+    Args:
+        max_workers: The maximum number of processes used to parse and load SQL models that are not
+            found in the cache. Loading in multiple processes requires the "fork" start method, so
+            models are loaded sequentially on platforms where it's not available, or when other threads
+            are running in this process. Default: 1.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        super().__init__()
+        self._max_workers = max_workers
+
+    def reload(self, context: GenericContext, paths: t.Iterable[Path]) -> t.Optional[LoadedProject]:
+        """
+        Reloads only the models defined in the given files, provided that all changed project files
+        are SQL or python model files. The schemas of the models downstream of the reloaded ones are
+        updated incrementally.
+        """
+        project = self._project
+        if project is None or context is not self._context:
+            return None
+
+        model_file_paths = {model._path for model in project.models.values()}
+        model_paths: t.Dict[Path, t.Tuple[Path, Config]] = {}
+        for path in {Path(path).absolute() for path in paths}:
+            model_context = self._model_file_context(path)
+            # Python files in the models directory that don't define any models may be imported
+            # by other models, so changes to them require a full reload.
+            if model_context and (
+                path.suffix == ".sql" or path not in self._path_mtimes or path in model_file_paths
+            ):
+                model_paths[path] = model_context
+            elif path in self._path_mtimes or self._is_project_file(path):
+                return None
+
+        if not model_paths:
+            return project
+
+        linecache.clearcache()
+
+        previous_path_mtimes = dict(self._path_mtimes)
+        try:
+            models: UniqueKeyDict[str, Model] = UniqueKeyDict(
+                "models",
+                {
+                    name: model
+                    for name, model in project.models.items()
+                    if model._path not in model_paths
+                },
+            )
+            unchanged_models = set(models)
+
+            model_registry.registry().clear()
+            registered: t.Set[str] = set()
+            for path, (context_path, config) in model_paths.items():
+                self._path_mtimes.pop(path, None)
+                if not path.exists() or not os.path.getsize(path):
+                    continue
+
+                self._track_file(path)
+                if path.suffix == ".py":
+                    loaded_models = self._load_python_model_file(
+                        path,
+                        context_path,
+                        config,
+                        project.macros,
+                        project.jinja_macros,
+                        self._variables(config),
+                        registered,
+                    )
+                else:
+                    load_kwargs = self._sql_model_load_kwargs(
+                        context_path,
+                        config,
+                        project.macros,
+                        project.jinja_macros,
+                        project.audits or None,
+                    )
+                    model = SqlMeshLoader._Cache(self, context_path).get_or_load_model(
+                        path, lambda: _load_sql_model_file(path, **load_kwargs)
+                    )
+                    loaded_models = [model] if model.enabled else []
+                    if isinstance(model, SeedModel):
+                        self._track_file(model.seed_path)
+
+                for model in loaded_models:
+                    models[model.fqn] = model
+
+            self._dag = DAG()
+            for model in models.values():
+                self._add_model_to_dag(model)
+
+            if self._update_schemas:
+                self._update_model_schemas(models, unchanged_models=unchanged_models)
+        except Exception:
+            self._path_mtimes = previous_path_mtimes
+            raise
+
+        self._project = LoadedProject(
+            macros=project.macros,
+            jinja_macros=project.jinja_macros,
+            models=models,
+            audits=project.audits,
+            metrics=project.metrics,
+            dag=self._dag,
+        )
+        return self._project
+
+    def _model_file_context(self, path: Path) -> t.Optional[t.Tuple[Path, Config]]:
+        """Returns the context path and config of the context the given model file belongs to."""
+        if path.suffix not in (".sql", ".py"):
+            return None
+        for context_path, config in self._context.configs.items():
+            if (context_path / c.MODELS).absolute() in path.parents:
+                if any(path.match(pattern) for pattern in config.ignore_patterns):
+                    return None
+                return context_path, config
+        return None
+
+    def _is_project_file(self, path: Path) -> bool:
+        """Whether the given file, which isn't tracked yet, affects anything other than models."""
+        for context_path in self._context.configs:
+            context_path = context_path.absolute()
+            if path.parent == context_path and (
+                path.stem == "config" or path.name == c.EXTERNAL_MODELS_YAML
+            ):
+                return True
+            if any(
+                context_path / directory in path.parents
+                for directory in (
+                    c.AUDITS,
+                    c.EXTERNAL_MODELS,
+                    c.MACROS,
+                    c.MATERIALIZATIONS,
+                    c.METRICS,
+                    c.SEEDS,
+                    c.SIGNALS,
+                )
+            ):
+                return True
+        return False
 
     def _load_scripts(self) -> t.Tuple[MacroRegistry, JinjaMacroRegistry]:
         """Loads all user defined macros."""
@@ -347,8 +616,11 @@ class SqlMeshLoader(Loader):
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
         for context_path, config in self._context.configs.items():
             cache = SqlMeshLoader._Cache(self, context_path)
-            variables = self._variables(config)
+            load_kwargs = self._sql_model_load_kwargs(
+                context_path, config, macros, jinja_macros, audits
+            )
 
+            paths = []
             for path in self._glob_paths(
                 context_path / c.MODELS, ignore_patterns=config.ignore_patterns, extension=".sql"
             ):
@@ -356,37 +628,17 @@ class SqlMeshLoader(Loader):
                     continue
 
                 self._track_file(path)
+                paths.append(path)
 
-                def _load() -> Model:
-                    with open(path, "r", encoding="utf-8") as file:
-                        try:
-                            expressions = parse(
-                                file.read(), default_dialect=config.model_defaults.dialect
-                            )
-                        except SqlglotError as ex:
-                            raise ConfigError(
-                                f"Failed to parse a model definition at '{path}': {ex}."
-                            )
-
-                    return load_sql_based_model(
-                        expressions,
-                        defaults=config.model_defaults.dict(),
-                        macros=macros,
-                        jinja_macros=jinja_macros,
-                        audits=audits,
-                        default_audits=config.model_defaults.audits,
-                        path=Path(path).absolute(),
-                        module_path=context_path,
-                        dialect=config.model_defaults.dialect,
-                        time_column_format=config.time_column_format,
-                        physical_schema_override=config.physical_schema_override,
-                        project=config.project,
-                        default_catalog=self._context.default_catalog,
-                        variables=variables,
-                        infer_names=config.model_naming.infer_names,
-                    )
+            preloaded_models = self._load_sql_model_files_concurrently(
+                [path for path in paths if not cache.exists(path)], load_kwargs
+            )
 
-                model = cache.get_or_load_model(path, _load)
+            for path in paths:
+                model = cache.get_or_load_model(
+                    path,
+                    lambda: preloaded_models.get(path) or _load_sql_model_file(path, **load_kwargs),
+                )
                 if model.enabled:
                     models[model.fqn] = model
 
@@ -396,49 +648,147 @@ class SqlMeshLoader(Loader):
 
         return models
 
+    def _sql_model_load_kwargs(
+        self,
+        context_path: Path,
+        config: Config,
+        macros: MacroRegistry,
+        jinja_macros: JinjaMacroRegistry,
+        audits: t.Optional[t.Dict[str, Audit]],
+    ) -> t.Dict[str, t.Any]:
+        return dict(
+            dialect=config.model_defaults.dialect,
+            defaults=config.model_defaults.dict(),
+            macros=macros,
+            jinja_macros=jinja_macros,
+            audits=audits,
+            default_audits=config.model_defaults.audits,
+            module_path=context_path,
+            time_column_format=config.time_column_format,
+            physical_schema_override=config.physical_schema_override,
+            project=config.project,
+            default_catalog=self._context.default_catalog,
+            variables=self._variables(config),
+            infer_names=config.model_naming.infer_names,
+        )
+
+    def _load_sql_model_files_concurrently(
+        self, paths: t.List[Path], load_kwargs: t.Dict[str, t.Any]
+    ) -> t.Dict[Path, Model]:
+        """Loads the models defined in the given files using a pool of processes.
+
+        The keyword arguments are inherited by forked worker processes so that macro and Jinja registries,
+        which may contain objects that can't be pickled, are only transferred once per worker.
+
+        Args:
+            paths: The paths to the model files.
+            load_kwargs: Keyword arguments passed to `load_sql_based_model`.
+
+        Returns:
+            A mapping from paths to loaded models. Empty if the models should be loaded sequentially instead.
+        """
+        max_workers = min(self._max_workers, len(paths))
+        if max_workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return {}
+        if threading.active_count() > 1:
+            # A forked child only inherits the calling thread, so locks held by other threads at the time
+            # of the fork would never be released in it.
+            logger.warning(
+                "Loading models sequentially because other threads are running and forking worker processes is unsafe."
+            )
+            return {}
+
+        global _worker_sql_model_load_kwargs
+        _worker_sql_model_load_kwargs = load_kwargs
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                loaded_models = pool.map(
+                    _load_sql_model_file_in_worker,
+                    paths,
+                    chunksize=max(1, len(paths) // (max_workers * 4)),
+                )
+                return dict(zip(paths, loaded_models))
+        finally:
+            _worker_sql_model_load_kwargs = {}
+
     def _load_python_models(
         self, macros: MacroRegistry, jinja_macros: JinjaMacroRegistry
     ) -> UniqueKeyDict[str, Model]:
         """Loads the python models into a Dict"""
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
-        registry = model_registry.registry()
-        registry.clear()
+        model_registry.registry().clear()
         registered: t.Set[str] = set()
 
         for context_path, config in self._context.configs.items():
             variables = self._variables(config)
-            model_registry._dialect = config.model_defaults.dialect
-            try:
-                for path in self._glob_paths(
-                    context_path / c.MODELS, ignore_patterns=config.ignore_patterns, extension=".py"
+            for path in self._glob_paths(
+                context_path / c.MODELS, ignore_patterns=config.ignore_patterns, extension=".py"
+            ):
+                if not os.path.getsize(path):
+                    continue
+
+                self._track_file(path)
+                for model in self._load_python_model_file(
+                    path, context_path, config, macros, jinja_macros, variables, registered
                 ):
-                    if not os.path.getsize(path):
-                        continue
+                    models[model.fqn] = model
 
-                    self._track_file(path)
-                    import_python_file(path, context_path)
-                    new = registry.keys() - registered
-                    registered |= new
-                    for name in new:
-                        model = registry[name].model(
-                            path=path,
-                            module_path=context_path,
-                            defaults=config.model_defaults.dict(),
-                            macros=macros,
-                            jinja_macros=jinja_macros,
-                            dialect=config.model_defaults.dialect,
-                            time_column_format=config.time_column_format,
-                            physical_schema_override=config.physical_schema_override,
-                            project=config.project,
-                            default_catalog=self._context.default_catalog,
-                            variables=variables,
-                            infer_names=config.model_naming.infer_names,
-                        )
-                        if model.enabled:
-                            models[model.fqn] = model
-            finally:
-                model_registry._dialect = None
+        return models
+
+    def _load_python_model_file(
+        self,
+        path: Path,
+        context_path: Path,
+        config: Config,
+        macros: MacroRegistry,
+        jinja_macros: JinjaMacroRegistry,
+        variables: t.Dict[str, t.Any],
+        registered: t.Set[str],
+    ) -> t.List[Model]:
+        """Loads the enabled python models defined in the given file.
+
+        Args:
+            path: The path to the python file.
+            context_path: The path to the context the file belongs to.
+            config: The config of the context.
+            macros: The macro registry.
+            jinja_macros: The Jinja macro registry.
+            variables: The variables available to the models.
+            registered: Names of models that have already been registered by previously imported files.
+                Updated in place.
 
+        Returns:
+            The enabled models defined in the file.
+        """
+        registry = model_registry.registry()
+        model_registry._dialect = config.model_defaults.dialect
+        try:
+            import_python_file(path, context_path)
+        finally:
+            model_registry._dialect = None
+
+        new = registry.keys() - registered
+        registered |= new
+        models = []
+        for name in new:
+            model = registry[name].model(
+                path=path,
+                module_path=context_path,
+                defaults=config.model_defaults.dict(),
+                macros=macros,
+                jinja_macros=jinja_macros,
+                dialect=config.model_defaults.dialect,
+                time_column_format=config.time_column_format,
+                physical_schema_override=config.physical_schema_override,
+                project=config.project,
+                default_catalog=self._context.default_catalog,
+                variables=variables,
+                infer_names=config.model_naming.infer_names,
+            )
+            if model.enabled:
+                models.append(model)
         return models
 
     def _load_materializations(self) -> None:
@@ -530,7 +880,14 @@ class SqlMeshLoader(Loader):
         def __init__(self, loader: SqlMeshLoader, context_path: Path):
             self._loader = loader
             self._context_path = context_path
-            self._model_cache = ModelCache(self._context_path / c.CACHE)
+            self._model_cache = ModelCache(
+                self._context_path / c.CACHE, loader._context.config.cache
+            )
+
+        def exists(self, target_path: Path) -> bool:
+            return self._model_cache.exists(
+                self._cache_entry_name(target_path), self._model_cache_entry_id(target_path)
+            )
 
         def get_or_load_model(self, target_path: Path, loader: t.Callable[[], Model]) -> Model:
             model = self._model_cache.get_or_load(
@@ -568,3 +925,52 @@ class SqlMeshLoader(Loader):
                     or self._loader._context.config.default_gateway_name,
                 ]
             )
+
+
+def _load_sql_model_file(path: Path, dialect: t.Optional[str], **kwargs: t.Any) -> Model:
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            expressions = parse(file.read(), default_dialect=dialect)
+        except SqlglotError as ex:
+            raise ConfigError(f"Failed to parse a model definition at '{path}': {ex}.")
+
+    return load_sql_based_model(expressions, path=Path(path).absolute(), dialect=dialect, **kwargs)
+
+
+# Set by the parent process right before worker processes are forked.
+_worker_sql_model_load_kwargs: t.Dict[str, t.Any] = {}
+
+
+def _load_sql_model_file_in_worker(path: Path) -> Model:
+    model = _load_sql_model_file(path, **_worker_sql_model_load_kwargs)
+    if isinstance(model, SqlModel):
+        # Compute dependencies in the worker so that they are returned along with the model
+        model.full_depends_on
+    return model
+
+
+def _unload_project_modules(project_paths: t.Iterable[Path]) -> None:
+    """Removes modules imported from the given project directories by a previous load.
+
+    Project files are imported by their path relative to the project root, so a module like
+    `macros.utils` imported earlier (possibly from another project) would otherwise be picked up
+    by the files that import it, and objects it defines would be serialized from a stale copy.
+    Only modules whose file is in one of the projects, or that a project file or directory of the
+    same name replaces, are removed.
+    """
+    project_paths = [path.absolute() for path in project_paths]
+    for module_name, module in list(sys.modules.items()):
+        if module_name.split(".", 1)[0] not in _PROJECT_PACKAGES:
+            continue
+        module_file = getattr(module, "__file__", None)
+        relative_path = Path(*module_name.split("."))
+        if any(
+            (module_file and path in Path(module_file).absolute().parents)
+            or (path / relative_path).with_suffix(".py").exists()
+            or (path / relative_path).is_dir()
+            for path in project_paths
+        ):
+            sys.modules.pop(module_name, None)
+
+
+_PROJECT_PACKAGES = {c.MACROS, c.MATERIALIZATIONS, c.MODELS, c.SIGNALS}
@@ -8,11 +8,14 @@ from sqlglot import exp
 from sqlglot.optimizer.simplify import gen
 
 from sqlmesh.core.model.definition import Model, SqlModel, _Model
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import BaseCache, FileCache
 from sqlmesh.utils.hashing import crc32
 
 from dataclasses import dataclass
 
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config.cache import CacheConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,13 +24,15 @@ class ModelCache:
 
     Args:
         path: The path to the cache folder.
+        cache_config: The cache configuration. Entries are stored in separate files if not provided.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, cache_config: t.Optional[CacheConfig] = None):
         self.path = path
-        self._file_cache: FileCache[Model] = FileCache(
-            path,
-            prefix="model_definition",
+        self._file_cache: BaseCache[Model] = (
+            cache_config.create_cache(path, prefix="model_definition")
+            if cache_config
+            else FileCache(path, prefix="model_definition")
         )
 
     def get_or_load(self, name: str, entry_id: str = "", *, loader: t.Callable[[], Model]) -> Model:
@@ -53,6 +58,15 @@ class ModelCache:
 
         return model
 
+    def exists(self, name: str, entry_id: str = "") -> bool:
+        """Returns true if the model definition with the given name and ID is cached, false otherwise.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+        """
+        return self._file_cache.exists(name, entry_id)
+
 
 @dataclass
 class OptimizedQueryCacheEntry:
@@ -64,12 +78,15 @@ class OptimizedQueryCache:
 
     Args:
         path: The path to the cache folder.
+        cache_config: The cache configuration. Entries are stored in separate files if not provided.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, cache_config: t.Optional[CacheConfig] = None):
         self.path = path
-        self._file_cache: FileCache[OptimizedQueryCacheEntry] = FileCache(
-            path, prefix="optimized_query"
+        self._file_cache: BaseCache[OptimizedQueryCacheEntry] = (
+            cache_config.create_cache(path, prefix="optimized_query")
+            if cache_config
+            else FileCache(path, prefix="optimized_query")
         )
 
     def with_optimized_query(self, model: Model) -> bool:
@@ -28,6 +28,7 @@ from sqlmesh.core.notification_target import (
 from sqlmesh.core.plan.definition import Plan
 from sqlmesh.core.scheduler import Scheduler, SignalFactory
 from sqlmesh.core.snapshot import DeployabilityIndex, Snapshot, SnapshotEvaluator, SnapshotIntervals
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.core.state_sync.base import PromotionResult
 from sqlmesh.core.user import User
@@ -36,6 +37,9 @@ from sqlmesh.schedulers.airflow.client import AirflowClient, BaseAirflowClient
 from sqlmesh.schedulers.airflow.mwaa_client import MWAAClient
 from sqlmesh.utils.errors import SQLMeshError
 
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config.resource_pool import ResourcePoolConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +70,13 @@ class BuiltInPlanEvaluator(PlanEvaluator):
         console: t.Optional[Console] = None,
         notification_target_manager: t.Optional[NotificationTargetManager] = None,
         signal_factory: t.Optional[SignalFactory] = None,
+        audit_concurrent_tasks: int = 0,
+        evaluation_durations: t.Optional[EvaluationDurationCache] = None,
+        resource_pools: t.Optional[t.Dict[str, "ResourcePoolConfig"]] = None,
+        gateway: t.Optional[str] = None,
+        interval_commit_batch_size: int = 100,
+        interval_commit_max_delay_seconds: float = 10.0,
+        async_evaluation: bool = False,
     ):
         self.state_sync = state_sync
         self.snapshot_evaluator = snapshot_evaluator
@@ -74,6 +85,13 @@ class BuiltInPlanEvaluator(PlanEvaluator):
         self.console = console or get_console()
         self.notification_target_manager = notification_target_manager
         self.signal_factory = signal_factory
+        self.audit_concurrent_tasks = audit_concurrent_tasks
+        self.evaluation_durations = evaluation_durations
+        self.resource_pools = resource_pools
+        self.gateway = gateway
+        self.interval_commit_batch_size = interval_commit_batch_size
+        self.interval_commit_max_delay_seconds = interval_commit_max_delay_seconds
+        self.async_evaluation = async_evaluation
 
     def evaluate(
         self,
@@ -162,6 +180,13 @@ class BuiltInPlanEvaluator(PlanEvaluator):
             console=self.console,
             notification_target_manager=self.notification_target_manager,
             signal_factory=self.signal_factory,
+            audit_max_workers=self.audit_concurrent_tasks,
+            evaluation_durations=self.evaluation_durations,
+            resource_pools=self.resource_pools,
+            gateway=self.gateway,
+            interval_commit_batch_size=self.interval_commit_batch_size,
+            interval_commit_max_delay_seconds=self.interval_commit_max_delay_seconds,
+            async_evaluation=self.async_evaluation,
         )
         is_run_successful = scheduler.run(
             plan.environment_naming_info,
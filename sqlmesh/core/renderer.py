@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import typing as t
 from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 
 from sqlglot import exp, parse
@@ -23,7 +24,7 @@ from sqlmesh.utils.errors import (
     SQLMeshError,
     raise_config_error,
 )
-from sqlmesh.utils.jinja import JinjaMacroRegistry
+from sqlmesh.utils.jinja import JinjaMacroRegistry, has_jinja
 from sqlmesh.utils.metaprogramming import Executable, prepare_env
 
 if t.TYPE_CHECKING:
@@ -357,13 +358,17 @@ class ExpressionRenderer(BaseExpressionRenderer):
 
 
 class QueryRenderer(BaseExpressionRenderer):
+    INTERVAL_CACHE_SIZE = 8
+
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
         self._optimized_cache: t.Optional[exp.Query] = None
+        self._interval_cache: t.Dict[t.Tuple[t.Any, ...], exp.Query] = {}
 
     def update_schema(self, schema: t.Dict[str, t.Any]) -> None:
         super().update_schema(schema)
         self._optimized_cache = None
+        self._interval_cache = {}
 
     def render(
         self,
@@ -380,6 +385,9 @@ class QueryRenderer(BaseExpressionRenderer):
     ) -> t.Optional[exp.Query]:
         """Renders a query, expanding macros with provided kwargs, and optionally expanding referenced models.
 
+        Optimized queries rendered at runtime are cached for the exact arguments they were rendered with, so that
+        rendering the same interval again only resolves the tables.
+
         Args:
             query: The query to render.
             start: The start datetime to render. Defaults to epoch start.
@@ -403,8 +411,26 @@ class QueryRenderer(BaseExpressionRenderer):
             runtime_stage, start, end, execution_time, *kwargs.values()
         )
 
+        interval_key = (
+            self._interval_cache_key(
+                start,
+                end,
+                execution_time,
+                snapshots=snapshots,
+                table_mapping=table_mapping,
+                deployability_index=deployability_index,
+                runtime_stage=runtime_stage,
+                **kwargs,
+            )
+            if optimize and not should_cache
+            else None
+        )
+        cached_query = self._interval_cache.get(interval_key) if interval_key else None
+
         if should_cache and self._optimized_cache and optimize:
             query = self._optimized_cache
+        elif cached_query:
+            query = cached_query
         else:
             try:
                 expressions = super()._render(
@@ -445,6 +471,9 @@ class QueryRenderer(BaseExpressionRenderer):
 
                 if should_cache:
                     self._optimized_cache = query
+                elif interval_key:
+                    self._cache_interval_query(interval_key, query)
+                    cached_query = query
 
         if optimize:
             query = self._resolve_tables(
@@ -460,6 +489,10 @@ class QueryRenderer(BaseExpressionRenderer):
                 **kwargs,
             )
 
+            if query is cached_query:
+                # Callers may modify the returned query, which must not change the cached one.
+                query = query.copy()
+
         return query
 
     def update_cache(self, expression: t.Optional[exp.Expression], optimized: bool = False) -> None:
@@ -470,6 +503,69 @@ class QueryRenderer(BaseExpressionRenderer):
         else:
             super().update_cache(expression)
 
+    @cached_property
+    def _can_cache_intervals(self) -> bool:
+        # Macros that use the engine adapter, either in Python or through Jinja, may render a different query
+        # for the same arguments.
+        return not any(
+            isinstance(e, d.Jinja) or has_jinja(e.sql())
+            for e in (self._expression, *self._macro_definitions)
+        ) and not any("engine_adapter" in e.payload for e in self._python_env.values())
+
+    def _interval_cache_key(
+        self,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+        snapshots: t.Optional[t.Dict[str, Snapshot]] = None,
+        table_mapping: t.Optional[t.Dict[str, str]] = None,
+        deployability_index: t.Optional[DeployabilityIndex] = None,
+        runtime_stage: RuntimeStage = RuntimeStage.LOADING,
+        **kwargs: t.Any,
+    ) -> t.Optional[t.Tuple[t.Any, ...]]:
+        """Returns the key of the query rendered with the given arguments, which consists of everything that
+        macros can observe, or None if the query can't be cached."""
+        if not self._can_cache_intervals:
+            return None
+
+        kwargs_key = []
+        for name, value in sorted(kwargs.items()):
+            if name == "engine_adapter":
+                continue
+            if name == "snapshot" and value is not None:
+                value = value.snapshot_id
+            elif name == "variables" and value is not None:
+                value = tuple(sorted(value.items()))
+            kwargs_key.append((name, value))
+
+        snapshots = snapshots or {}
+        key = (
+            runtime_stage,
+            *(to_datetime(time) if time else None for time in (start, end, execution_time)),
+            tuple(
+                sorted(
+                    {
+                        **self._to_table_mapping(snapshots.values(), deployability_index),
+                        **(table_mapping or {}),
+                    }.items()
+                )
+            ),
+            tuple(sorted((name, s.snapshot_id) for name, s in snapshots.items())),
+            tuple(kwargs_key),
+        )
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _cache_interval_query(self, key: t.Tuple[t.Any, ...], query: exp.Query) -> None:
+        # Replacing the full cache instead of evicting single entries is safe for concurrent renders.
+        if len(self._interval_cache) >= self.INTERVAL_CACHE_SIZE:
+            self._interval_cache = {}
+        self._interval_cache[key] = query
+
     def _optimize_query(self, query: exp.Query, all_deps: t.Set[str]) -> exp.Query:
         # We don't want to normalize names in the schema because that's handled by the optimizer
         original = query
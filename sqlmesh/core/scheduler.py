@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import logging
+import time
 import traceback
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock, Timer
 
 from sqlglot import exp
 
 from sqlmesh.core import constants as c
+from sqlmesh.core.audit import AuditResult
 from sqlmesh.core.console import Console, get_console
 from sqlmesh.core.environment import EnvironmentNamingInfo
 from sqlmesh.core.notification_target import (
@@ -19,14 +24,21 @@ from sqlmesh.core.snapshot import (
     DeployabilityIndex,
     Snapshot,
     SnapshotEvaluator,
+    SnapshotIntervals,
     earliest_start_date,
+    merge_intervals,
     missing_intervals,
 )
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache
 from sqlmesh.core.snapshot.definition import Interval as SnapshotInterval
 from sqlmesh.core.snapshot.definition import SnapshotId
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.utils import format_exception
-from sqlmesh.utils.concurrency import concurrent_apply_to_dag
+from sqlmesh.utils.concurrency import (
+    NodeExecutionFailedError,
+    async_apply_to_dag,
+    concurrent_apply_to_dag,
+)
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
@@ -38,6 +50,9 @@ from sqlmesh.utils.date import (
 )
 from sqlmesh.utils.errors import AuditError, CircuitBreakerError, SQLMeshError
 
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config.resource_pool import ResourcePoolConfig
+
 logger = logging.getLogger(__name__)
 Interval = t.Tuple[datetime, datetime]
 Batch = t.List[Interval]
@@ -107,6 +122,136 @@ def signal_factory(f: SignalFactory) -> None:
     _registered_signal_factory = f
 
 
+class IntervalCommitBuffer:
+    """Coalesces intervals of evaluated snapshots and adds them to the state sync in bulk.
+
+    Adding an interval to the state sync one at a time results in a separate transaction per evaluated batch.
+    Instead, intervals are buffered and flushed through a single `add_snapshots_intervals` call once either
+    the size or the age threshold is reached. The age threshold is enforced by a timer, so intervals are
+    recorded even if no other interval is added afterwards. Intervals must only be added once their data has
+    been written, so that a buffer lost to a crash only results in the same intervals being evaluated again.
+
+    Args:
+        state_sync: The state sync to add intervals to.
+        max_size: The number of buffered intervals that triggers a flush.
+        max_delay_seconds: The age of the oldest buffered interval that triggers a flush.
+    """
+
+    def __init__(self, state_sync: StateSync, max_size: int = 100, max_delay_seconds: float = 10.0):
+        self.state_sync = state_sync
+        self.max_size = max_size
+        self.max_delay_seconds = max_delay_seconds
+
+        self._lock = Lock()
+        self._snapshots_intervals: t.Dict[SnapshotId, SnapshotIntervals] = {}
+        self._size = 0
+        self._oldest_added_at: t.Optional[float] = None
+        self._flush_timer: t.Optional[Timer] = None
+
+    def add(self, snapshot: Snapshot, start: TimeLike, end: TimeLike, is_dev: bool = False) -> None:
+        """Buffers an interval of a snapshot, flushing the buffer if one of the thresholds is reached.
+
+        Args:
+            snapshot: The snapshot to add an interval to.
+            start: The start of the interval to add.
+            end: The end of the interval to add.
+            is_dev: Indicates whether the given interval is being added while in development mode.
+        """
+        if not snapshot.version:
+            raise SQLMeshError("Snapshot version must be set to add an interval.")
+        interval = snapshot.inclusive_exclusive(start, end, strict=False)
+
+        with self._lock:
+            snapshot_intervals = self._snapshots_intervals.get(snapshot.snapshot_id)
+            if snapshot_intervals is None:
+                snapshot_intervals = SnapshotIntervals(
+                    name=snapshot.name,
+                    identifier=snapshot.identifier,
+                    version=snapshot.version,
+                    intervals=[],
+                    dev_intervals=[],
+                )
+                self._snapshots_intervals[snapshot.snapshot_id] = snapshot_intervals
+            (snapshot_intervals.dev_intervals if is_dev else snapshot_intervals.intervals).append(
+                interval
+            )
+            self._size += 1
+            if self._oldest_added_at is None:
+                self._oldest_added_at = time.monotonic()
+            if self._flush_timer is None:
+                self._schedule_flush(
+                    max(self._oldest_added_at + self.max_delay_seconds - time.monotonic(), 0)
+                )
+
+            should_flush = (
+                self._size >= self.max_size
+                or time.monotonic() - self._oldest_added_at >= self.max_delay_seconds
+            )
+
+        if should_flush:
+            self._try_flush()
+
+    def flush(self) -> None:
+        """Adds all buffered intervals to the state sync.
+
+        Intervals are returned to the buffer if the state sync fails to add them.
+        """
+        with self._lock:
+            snapshots_intervals = self._snapshots_intervals
+            size = self._size
+            oldest_added_at = self._oldest_added_at
+            self._snapshots_intervals = {}
+            self._size = 0
+            self._oldest_added_at = None
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if not snapshots_intervals:
+            return
+
+        try:
+            self.state_sync.add_snapshots_intervals(
+                [
+                    snapshot_intervals.copy(
+                        update={
+                            "intervals": merge_intervals(snapshot_intervals.intervals),
+                            "dev_intervals": merge_intervals(snapshot_intervals.dev_intervals),
+                        }
+                    )
+                    for snapshot_intervals in snapshots_intervals.values()
+                ]
+            )
+        except Exception:
+            with self._lock:
+                for snapshot_id, snapshot_intervals in snapshots_intervals.items():
+                    buffered = self._snapshots_intervals.get(snapshot_id)
+                    if buffered is not None:
+                        snapshot_intervals.intervals.extend(buffered.intervals)
+                        snapshot_intervals.dev_intervals.extend(buffered.dev_intervals)
+                    self._snapshots_intervals[snapshot_id] = snapshot_intervals
+                self._size += size
+                if oldest_added_at is not None:
+                    self._oldest_added_at = min(
+                        oldest_added_at, self._oldest_added_at or oldest_added_at
+                    )
+            raise
+
+    def _try_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            # The data of the interval has been written, so a failure to record it shouldn't fail the
+            # evaluation. Intervals stay buffered until the next flush.
+            logger.exception("Failed to add buffered intervals to the state sync")
+
+    def _schedule_flush(self, delay_seconds: float) -> None:
+        # Must be called while holding the lock.
+        self._flush_timer = Timer(delay_seconds, self._try_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+
 class Scheduler:
     """Schedules and manages the evaluation of snapshots.
 
@@ -123,6 +268,21 @@ class Scheduler:
         max_workers: The maximum number of parallel queries to run.
         console: The rich instance used for printing scheduling information.
         signal_factory: A factory method for building Signal instances from model signal configuration.
+        audit_max_workers: The maximum number of non-blocking audits to run in parallel with the evaluation
+            of other snapshots. If 0, non-blocking audits are run right after the evaluation of a snapshot,
+            together with blocking ones.
+        evaluation_durations: The cache of historical evaluation durations. If provided, the durations of
+            evaluated intervals are recorded, and snapshot intervals on the longest remaining path of the DAG
+            are evaluated first.
+        resource_pools: Named pools of concurrency slots that limit the number of concurrent evaluations of
+            snapshots assigned to them.
+        gateway: The name of the gateway snapshots are evaluated on. Used to assign snapshots to resource pools.
+        interval_commit_batch_size: The number of evaluated intervals that are added to the state sync together
+            during a run.
+        interval_commit_max_delay_seconds: The maximum time an evaluated interval waits to be added to the state
+            sync during a run.
+        async_evaluation: Whether to traverse the DAG on an asyncio event loop instead of in a pool of threads.
+            Each batch is still evaluated in a worker thread with `loop.run_in_executor`.
     """
 
     def __init__(
@@ -135,6 +295,13 @@ class Scheduler:
         console: t.Optional[Console] = None,
         notification_target_manager: t.Optional[NotificationTargetManager] = None,
         signal_factory: t.Optional[SignalFactory] = None,
+        audit_max_workers: int = 0,
+        evaluation_durations: t.Optional[EvaluationDurationCache] = None,
+        resource_pools: t.Optional[t.Dict[str, ResourcePoolConfig]] = None,
+        gateway: t.Optional[str] = None,
+        interval_commit_batch_size: int = 100,
+        interval_commit_max_delay_seconds: float = 10.0,
+        async_evaluation: bool = False,
     ):
         self.state_sync = state_sync
         self.snapshots = {s.snapshot_id: s for s in snapshots}
@@ -147,6 +314,17 @@ class Scheduler:
             notification_target_manager or NotificationTargetManager()
         )
         self.signal_factory = signal_factory or _registered_signal_factory
+        self.audit_max_workers = audit_max_workers
+        self.evaluation_durations = evaluation_durations
+        self.resource_pools = resource_pools or {}
+        self.gateway = gateway
+        self.interval_commit_batch_size = interval_commit_batch_size
+        self.interval_commit_max_delay_seconds = interval_commit_max_delay_seconds
+        self.async_evaluation = async_evaluation
+
+        self._interval_commit_buffer: t.Optional[IntervalCommitBuffer] = None
+        self._audit_executor: t.Optional[ThreadPoolExecutor] = None
+        self._audit_futures: t.List[t.Tuple[Snapshot, Future]] = []
 
     def batches(
         self,
@@ -216,6 +394,8 @@ class Scheduler:
     ) -> None:
         """Evaluate a snapshot and add the processed interval to the state sync.
 
+        During a run, processed intervals are buffered and added to the state sync in bulk.
+
         Args:
             snapshot: Snapshot to evaluate.
             start: The start datetime to render.
@@ -244,7 +424,7 @@ class Scheduler:
             batch_index=batch_index,
             **kwargs,
         )
-        audit_results = self.snapshot_evaluator.audit(
+        audit_kwargs = dict(
             snapshot=snapshot,
             start=start,
             end=end,
@@ -252,32 +432,36 @@ class Scheduler:
             raise_exception=False,
             snapshots=snapshots,
             deployability_index=deployability_index,
-            wap_id=wap_id,
             **kwargs,
         )
 
-        audit_error_to_raise: t.Optional[AuditError] = None
-        for audit_result in (result for result in audit_results if result.count):
-            error = AuditError(
-                audit_name=audit_result.audit.name,
-                model=snapshot.model_or_none,
-                count=t.cast(int, audit_result.count),
-                query=t.cast(exp.Query, audit_result.query),
-                adapter_dialect=self.snapshot_evaluator.adapter.dialect,
+        if self._audit_executor is None:
+            audit_results = self.snapshot_evaluator.audit(wap_id=wap_id, **audit_kwargs)
+        else:
+            # Only blocking audits gate the completion of the evaluation, the rest is run in the background.
+            audit_results = self.snapshot_evaluator.audit(
+                wap_id=wap_id, blocking=True, **audit_kwargs
             )
-            self.notification_target_manager.notify(NotificationEvent.AUDIT_FAILURE, error)
-            if is_deployable and snapshot.node.owner:
-                self.notification_target_manager.notify_user(
-                    NotificationEvent.AUDIT_FAILURE, snapshot.node.owner, error
-                )
-            if audit_result.audit.blocking:
-                audit_error_to_raise = error
 
+        audit_error_to_raise = self._report_audit_results(snapshot, audit_results, is_deployable)
         if audit_error_to_raise:
             logger.error(f"Audit Failure: {traceback.format_exc()}")
             raise audit_error_to_raise
 
-        self.state_sync.add_interval(snapshot, start, end, is_dev=not is_deployable)
+        if self._interval_commit_buffer is not None:
+            self._interval_commit_buffer.add(snapshot, start, end, is_dev=not is_deployable)
+        else:
+            self.state_sync.add_interval(snapshot, start, end, is_dev=not is_deployable)
+
+        if self._audit_executor is not None:
+            self._audit_futures.append(
+                (
+                    snapshot,
+                    self._audit_executor.submit(
+                        self._run_non_blocking_audits, snapshot, is_deployable, audit_kwargs
+                    ),
+                )
+            )
 
     def run(
         self,
@@ -376,23 +560,68 @@ class Scheduler:
                 assert deployability_index  # mypy
                 self.evaluate(snapshot, start, end, execution_time, deployability_index, batch_idx)
                 evaluation_duration_ms = now_timestamp() - execution_start_ts
+                if self.evaluation_durations is not None:
+                    self.evaluation_durations.record(
+                        snapshot, (to_timestamp(start), to_timestamp(end)), evaluation_duration_ms
+                    )
             finally:
                 self.console.update_snapshot_evaluation_progress(
                     snapshot, batch_idx, evaluation_duration_ms
                 )
 
+        audit_errors: t.List[t.Tuple[Snapshot, Exception]] = []
+        self._audit_futures = []
+        self._audit_executor = (
+            ThreadPoolExecutor(max_workers=self.audit_max_workers, thread_name_prefix="audit")
+            if self.audit_max_workers > 0
+            else None
+        )
+        self._interval_commit_buffer = IntervalCommitBuffer(
+            self.state_sync,
+            max_size=self.interval_commit_batch_size,
+            max_delay_seconds=self.interval_commit_max_delay_seconds,
+        )
+
         try:
             with self.snapshot_evaluator.concurrent_context():
-                errors, skipped_intervals = concurrent_apply_to_dag(
-                    dag,
-                    evaluate_node,
-                    self.max_workers,
-                    raise_on_error=False,
-                )
+                try:
+                    errors, skipped_intervals = self._apply_to_dag(
+                        dag,
+                        evaluate_node,
+                        raise_on_error=False,
+                        priorities=(
+                            self._critical_path_priorities(dag, snapshots_by_name)
+                            if self.evaluation_durations is not None and self.max_workers > 1
+                            else None
+                        ),
+                        node_resources=self._node_resources(dag, snapshots_by_name),
+                        resource_limits={
+                            name: pool.max_slots for name, pool in self.resource_pools.items()
+                        },
+                    )
+                finally:
+                    if self._audit_executor is not None:
+                        self._audit_executor.shutdown(wait=True)
+                        self._audit_executor = None
+
+                for snapshot, future in self._audit_futures:
+                    audit_error = future.exception()
+                    if audit_error is not None:
+                        audit_errors.append((snapshot, t.cast(Exception, audit_error)))
+                self._audit_futures = []
+
+            interval_commit_error = self._flush_interval_commits()
         finally:
+            if self._interval_commit_buffer is not None:
+                # Intervals of batches that were evaluated before an unexpected failure are recorded as well.
+                self._flush_interval_commits()
             self.state_sync.recycle()
+            if self.evaluation_durations is not None:
+                self.evaluation_durations.flush()
 
-        self.console.stop_evaluation_progress(success=not errors)
+        self.console.stop_evaluation_progress(
+            success=not errors and not audit_errors and not interval_commit_error
+        )
 
         skipped_snapshots = {i[0] for i in skipped_intervals}
         for skipped in skipped_snapshots:
@@ -410,7 +639,199 @@ class Scheduler:
             # Log with INFO level to prevent duplicate messages in the console.
             logger.info(log_message)
 
-        return not errors
+        for snapshot, audit_error in audit_errors:
+            formatted_exception = "".join(format_exception(audit_error))
+            log_message = f"FAILED auditing snapshot {snapshot.snapshot_id}\n{formatted_exception}"
+            self.console.log_error(log_message)
+            logger.info(log_message)
+
+        if interval_commit_error:
+            formatted_exception = "".join(format_exception(interval_commit_error))
+            log_message = f"FAILED committing intervals\n{formatted_exception}"
+            self.console.log_error(log_message)
+            logger.info(log_message)
+
+        return not errors and not audit_errors and not interval_commit_error
+
+    def _apply_to_dag(
+        self,
+        dag: DAG[SchedulingUnit],
+        fn: t.Callable[[SchedulingUnit], None],
+        **kwargs: t.Any,
+    ) -> t.Tuple[t.List[NodeExecutionFailedError[SchedulingUnit]], t.List[SchedulingUnit]]:
+        """Applies the function to the nodes of the DAG in a pool of threads or, if `async_evaluation` is set,
+        on an asyncio event loop that hands each node to a worker thread."""
+        if not self.async_evaluation:
+            return concurrent_apply_to_dag(dag, fn, self.max_workers, **kwargs)
+
+        async def _apply() -> (
+            t.Tuple[t.List[NodeExecutionFailedError[SchedulingUnit]], t.List[SchedulingUnit]]
+        ):
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="evaluation"
+            ) as pool:
+                return await async_apply_to_dag(
+                    dag,
+                    lambda node: loop.run_in_executor(pool, fn, node),
+                    self.max_workers,
+                    **kwargs,
+                )
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_apply())
+
+        # An event loop is already running in this thread (eg. in a notebook), so the DAG is traversed on a new
+        # one in another thread.
+        with ThreadPoolExecutor(max_workers=1) as loop_thread:
+            return loop_thread.submit(asyncio.run, _apply()).result()
+
+    def _flush_interval_commits(self) -> t.Optional[Exception]:
+        """Commits the buffered intervals of evaluated batches.
+
+        Returns:
+            The error raised while committing the intervals, if any.
+        """
+        interval_commit_buffer, self._interval_commit_buffer = self._interval_commit_buffer, None
+        if interval_commit_buffer is None:
+            return None
+        try:
+            interval_commit_buffer.flush()
+        except Exception as ex:
+            logger.exception("Failed to commit intervals of evaluated batches")
+            return ex
+        return None
+
+    def _run_non_blocking_audits(
+        self, snapshot: Snapshot, is_deployable: bool, audit_kwargs: t.Dict[str, t.Any]
+    ) -> None:
+        # The WAP table has already been published by the time non-blocking audits are run.
+        audit_results = self.snapshot_evaluator.audit(blocking=False, **audit_kwargs)
+        self._report_audit_results(snapshot, audit_results, is_deployable)
+
+    def _report_audit_results(
+        self, snapshot: Snapshot, audit_results: t.List[AuditResult], is_deployable: bool
+    ) -> t.Optional[AuditError]:
+        """Notifies about failed audits.
+
+        Args:
+            snapshot: The audited snapshot.
+            audit_results: The results of the snapshot's audits.
+            is_deployable: Whether the audited snapshot is deployable.
+
+        Returns:
+            The error of the last failed blocking audit, if any.
+        """
+        audit_error_to_raise: t.Optional[AuditError] = None
+        for audit_result in (result for result in audit_results if result.count):
+            error = AuditError(
+                audit_name=audit_result.audit.name,
+                model=snapshot.model_or_none,
+                count=t.cast(int, audit_result.count),
+                query=t.cast(exp.Query, audit_result.query),
+                adapter_dialect=self.snapshot_evaluator.adapter.dialect,
+            )
+            self.notification_target_manager.notify(NotificationEvent.AUDIT_FAILURE, error)
+            if is_deployable and snapshot.node.owner:
+                self.notification_target_manager.notify_user(
+                    NotificationEvent.AUDIT_FAILURE, snapshot.node.owner, error
+                )
+            if audit_result.audit.blocking:
+                audit_error_to_raise = error
+            else:
+                self.console.log_status_update(
+                    f"[yellow]Audit '{error.audit_name}' failed for {snapshot.name} with {error.count} results. "
+                    "Audit is warn only so proceeding with execution.[/yellow]"
+                )
+
+        return audit_error_to_raise
+
+    def _node_resources(
+        self, dag: DAG[SchedulingUnit], snapshots_by_name: t.Dict[str, Snapshot]
+    ) -> t.Dict[SchedulingUnit, t.Dict[str, int]]:
+        """Returns the number of slots of each resource pool that the evaluation of a DAG node takes.
+
+        Args:
+            dag: The DAG of snapshot intervals to be evaluated.
+            snapshots_by_name: Snapshots to be evaluated by name.
+
+        Returns:
+            A mapping from DAG nodes to slots they take by resource pool name.
+        """
+        if not self.resource_pools:
+            return {}
+
+        slots_by_snapshot_name: t.Dict[str, t.Dict[str, int]] = {}
+        node_resources = {}
+        for node in dag.graph:
+            snapshot_name, (_, batch_idx) = node
+            if batch_idx == -1:
+                continue
+            if snapshot_name not in slots_by_snapshot_name:
+                snapshot_node = snapshots_by_name[snapshot_name].node
+                slots_by_snapshot_name[snapshot_name] = {
+                    name: pool.weight
+                    for name, pool in self.resource_pools.items()
+                    if pool.is_assigned(snapshot_node, self.gateway)
+                }
+            if slots_by_snapshot_name[snapshot_name]:
+                node_resources[node] = slots_by_snapshot_name[snapshot_name]
+        return node_resources
+
+    def _critical_path_priorities(
+        self, dag: DAG[SchedulingUnit], snapshots_by_name: t.Dict[str, Snapshot]
+    ) -> t.Dict[SchedulingUnit, float]:
+        """Computes the priority of each node as the estimated duration of the longest path from this node
+        to the end of the DAG, including the node itself.
+
+        Args:
+            dag: The DAG of snapshot intervals to be evaluated.
+            snapshots_by_name: Snapshots to be evaluated by name.
+
+        Returns:
+            A mapping from DAG nodes to their priorities.
+        """
+        assert self.evaluation_durations is not None  # mypy
+
+        graph = dag.graph
+        estimates: t.Dict[SchedulingUnit, t.Optional[float]] = {}
+        for node in graph:
+            snapshot_name, ((start, end), batch_idx) = node
+            estimates[node] = (
+                self.evaluation_durations.estimate(
+                    snapshots_by_name[snapshot_name], (to_timestamp(start), to_timestamp(end))
+                )
+                if batch_idx != -1
+                else 0.0
+            )
+
+        # Snapshots that were never evaluated are assumed to take as long as a typical evaluated one.
+        known_estimates = sorted(e for e in estimates.values() if e)
+        default_estimate = known_estimates[len(known_estimates) // 2] if known_estimates else 1.0
+
+        downstream: t.Dict[SchedulingUnit, t.List[SchedulingUnit]] = {node: [] for node in graph}
+        pending_downstream_num = {node: 0 for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                downstream[dep].append(node)
+                pending_downstream_num[dep] += 1
+
+        priorities: t.Dict[SchedulingUnit, float] = {}
+        leaves = [node for node, num in pending_downstream_num.items() if not num]
+        while leaves:
+            node = leaves.pop()
+            estimate = estimates[node]
+            priorities[node] = (default_estimate if estimate is None else estimate) + max(
+                (priorities[d] for d in downstream[node]), default=0.0
+            )
+            for dep in graph[node]:
+                pending_downstream_num[dep] -= 1
+                if not pending_downstream_num[dep]:
+                    leaves.append(dep)
+
+        return priorities
 
     def _dag(self, batches: SnapshotToBatches) -> DAG[SchedulingUnit]:
         """Builds a DAG of snapshot intervals to be evaluated.
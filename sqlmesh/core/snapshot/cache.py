@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 import typing as t
+from collections import OrderedDict
+from threading import Lock
 
 from pathlib import Path
+from sqlglot import exp
+from sqlglot.optimizer.simplify import gen
+
 from sqlmesh.core.model.cache import OptimizedQueryCache
-from sqlmesh.core.snapshot.definition import Snapshot, SnapshotId
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.core.model.definition import _Model
+from sqlmesh.core.snapshot.definition import Interval, Node, Snapshot, SnapshotId
+from sqlmesh.utils.cache import BaseCache, FileCache
+from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.pydantic import PydanticModel
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.audit import ModelAudit
+    from sqlmesh.core.config.cache import CacheConfig
 
 
 class SnapshotCache:
@@ -70,3 +82,194 @@ class SnapshotCache:
     def _update_node_hash_cache(snapshot: Snapshot) -> None:
         snapshot.node._data_hash = snapshot.fingerprint.data_hash
         snapshot.node._metadata_hash = snapshot.fingerprint.metadata_hash
+
+
+class ParsedNodeCache:
+    """In-memory cache of nodes parsed from the state store, keyed by the hash of their serialized payload.
+
+    Parsing a node re-validates it and parses every SQL expression it contains, which dominates the cost
+    of fetching snapshots. Node payloads are content-addressed, so each distinct payload only needs to be
+    parsed once. Nodes are deep copied in and out of the cache, so that snapshots never share a node or
+    any of its mutable fields, like the query expression.
+
+    Args:
+        max_size: The maximum number of parsed nodes to keep.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self._nodes: OrderedDict[str, Node] = OrderedDict()
+        self._max_size = max_size
+        self._lock = Lock()
+
+    def get(self, node_hash: str) -> t.Optional[Node]:
+        with self._lock:
+            node = self._nodes.get(node_hash)
+            if node is None:
+                return None
+            self._nodes.move_to_end(node_hash)
+        return node.copy(deep=True)
+
+    def put(self, node_hash: str, node: Node) -> None:
+        with self._lock:
+            self._nodes[node_hash] = node.copy(deep=True)
+            self._nodes.move_to_end(node_hash)
+            while len(self._nodes) > self._max_size:
+                self._nodes.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nodes.clear()
+
+
+class NodeHashCache:
+    """File-based cache of the data and metadata hashes of local nodes.
+
+    Computing these hashes renders the node's query and statements, which dominates the cost of
+    fingerprinting a project. Entries are keyed by the serialized node and the serialized audits it
+    references, which fully determine both hashes, so unchanged nodes can be fingerprinted across
+    sessions without being rendered again.
+
+    Args:
+        path: The path to the cache folder.
+        cache_config: The cache configuration. Entries are stored in separate files if not provided.
+    """
+
+    def __init__(self, path: Path, cache_config: t.Optional[CacheConfig] = None):
+        self._file_cache: BaseCache[t.Tuple[str, str]] = (
+            cache_config.create_cache(path, prefix="node_hashes")
+            if cache_config
+            else FileCache(path, prefix="node_hashes")
+        )
+
+    def update_hashes(self, nodes: t.Iterable[Node], audits: t.Dict[str, ModelAudit]) -> None:
+        """Sets the data and metadata hashes of the given nodes, computing and caching them on a miss.
+
+        Args:
+            nodes: The nodes whose hashes should be set.
+            audits: Available audits by name.
+        """
+        for node in nodes:
+            entry_id = self._entry_id(node, audits)
+            hashes = self._file_cache.get(node.fqn, entry_id)
+            if hashes:
+                node._data_hash, node._metadata_hash = hashes
+            else:
+                self._file_cache.put(
+                    node.fqn, entry_id, value=(node.data_hash, node.metadata_hash(audits))
+                )
+
+    @classmethod
+    def _entry_id(cls, node: Node, audits: t.Dict[str, ModelAudit]) -> str:
+        data = cls._node_data(node)
+        if isinstance(node, _Model):
+            for audit_name, _ in node.audits:
+                audit = audits.get(audit_name)
+                if audit is not None:
+                    data.extend(cls._node_data(audit))
+        return md5(data)
+
+    @staticmethod
+    def _node_data(node: PydanticModel) -> t.List[str]:
+        # Keys are sorted because the order of some mappings, like the mapping schema, depends on the
+        # order in which the project was loaded.
+        data = [node.json(sort_keys=True)]
+        # Expressions are serialized using their original SQL when it's available, which doesn't
+        # reflect changes made to them after parsing.
+        for field in node.all_field_infos():
+            data.extend(_expressions_sql(getattr(node, field)))
+        return data
+
+
+def _expressions_sql(value: t.Any) -> t.Iterator[str]:
+    if isinstance(value, exp.Expression):
+        yield gen(value)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _expressions_sql(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _expressions_sql(v)
+
+
+class EvaluationDurationCache:
+    """File-based cache of evaluation durations of snapshot intervals.
+
+    Durations are recorded by snapshot name, so that they remain useful after a model changes.
+
+    Args:
+        path: The path to the cache folder.
+        cache_config: The cache configuration. Entries are stored in separate files if not provided.
+        max_intervals: The maximum number of most recently evaluated intervals to keep for each snapshot.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        cache_config: t.Optional[CacheConfig] = None,
+        max_intervals: int = 100,
+    ):
+        self._file_cache: BaseCache[t.Dict[Interval, int]] = (
+            cache_config.create_cache(path, prefix="evaluation_durations")
+            if cache_config
+            else FileCache(path, prefix="evaluation_durations")
+        )
+        self._max_intervals = max_intervals
+        self._durations: t.Dict[str, t.Dict[Interval, int]] = {}
+        self._updated_names: t.Set[str] = set()
+        self._lock = Lock()
+
+    def estimate(self, snapshot: Snapshot, interval: Interval) -> t.Optional[float]:
+        """Estimates the evaluation duration of the given interval of a snapshot.
+
+        Args:
+            snapshot: The snapshot.
+            interval: The interval to evaluate.
+
+        Returns:
+            The estimated duration in milliseconds or None if the snapshot has never been evaluated.
+        """
+        with self._lock:
+            durations = self._get(snapshot.name)
+            if not durations:
+                return None
+
+            duration_ms = durations.get(interval)
+            if duration_ms is not None:
+                return float(duration_ms)
+
+            start, end = interval
+            if snapshot.is_incremental_by_time_range and end > start:
+                # The duration of an incremental model grows with the length of the evaluated interval.
+                rates = [d / (e - s) for (s, e), d in durations.items() if e > s]
+                if rates:
+                    return sum(rates) / len(rates) * (end - start)
+
+            return sum(durations.values()) / len(durations)
+
+    def record(self, snapshot: Snapshot, interval: Interval, duration_ms: int) -> None:
+        """Records the evaluation duration of a snapshot's interval.
+
+        Args:
+            snapshot: The evaluated snapshot.
+            interval: The evaluated interval.
+            duration_ms: The evaluation duration in milliseconds.
+        """
+        with self._lock:
+            durations = self._get(snapshot.name)
+            durations.pop(interval, None)
+            durations[interval] = duration_ms
+            while len(durations) > self._max_intervals:
+                durations.pop(next(iter(durations)))
+            self._updated_names.add(snapshot.name)
+
+    def flush(self) -> None:
+        """Persists the recorded durations."""
+        with self._lock:
+            for name in self._updated_names:
+                self._file_cache.put(name, value=self._durations[name])
+            self._updated_names.clear()
+
+    def _get(self, name: str) -> t.Dict[Interval, int]:
+        if name not in self._durations:
+            self._durations[name] = self._file_cache.get(name) or {}
+        return self._durations[name]
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from enum import IntEnum
 from functools import cached_property, lru_cache
 
+import numpy as np
 from pydantic import Field
 from sqlglot import exp
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
@@ -705,17 +706,7 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             # Skipping partial interval.
             return
 
-        intervals = self.dev_intervals if is_dev else self.intervals
-        intervals.append((start_ts, end_ts))
-
-        if len(intervals) < 2:
-            return
-
-        merged_intervals = merge_intervals(intervals)
-        if is_dev:
-            self.dev_intervals = merged_intervals
-        else:
-            self.intervals = merged_intervals
+        insert_interval(self.dev_intervals if is_dev else self.intervals, start_ts, end_ts)
 
     def remove_interval(self, interval: Interval) -> None:
         """Remove an interval from the snapshot.
@@ -1505,6 +1496,9 @@ def merge_intervals(intervals: Intervals) -> Intervals:
     Returns:
         A new list of sorted and merged intervals.
     """
+    if not intervals:
+        return []
+
     intervals = sorted(intervals)
 
     merged = [intervals[0]]
@@ -1520,6 +1514,37 @@ def merge_intervals(intervals: Intervals) -> Intervals:
     return merged
 
 
+def insert_interval(intervals: Intervals, start: int, end: int) -> None:
+    """Insert an interval into a list of sorted and merged intervals in place.
+
+    Only the intervals that overlap or are adjacent to the inserted one are merged with it,
+    so that adding the latest interval doesn't require sorting the whole list again.
+
+    Args:
+        intervals: A list of sorted and merged exclusive intervals.
+        start: The inclusive start of the interval to insert.
+        end: The exclusive end of the interval to insert.
+    """
+    # Find the first interval that ends at or after the inserted interval's start.
+    lo, hi = 0, len(intervals)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if intervals[mid][1] < start:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    merge_end = lo
+    while merge_end < len(intervals) and intervals[merge_end][0] <= end:
+        merge_end += 1
+
+    if lo < merge_end:
+        start = min(start, intervals[lo][0])
+        end = max(end, intervals[merge_end - 1][1])
+
+    intervals[lo:merge_end] = [(start, end)]
+
+
 def _format_date_time(time_like: TimeLike, unit: t.Optional[IntervalUnit]) -> str:
     if unit is None or unit.is_date_granularity:
         return to_ds(time_like)
@@ -1678,55 +1703,94 @@ def compute_missing_intervals(
     if start_ts == end_ts:
         return []
 
-    croniter = interval_unit.croniter(start_ts)
-    timestamps = [start_ts]
+    timestamps = _interval_timestamps(interval_unit, start_ts, end_ts)
+    starts = timestamps[:-1]
+    ends = timestamps[1:]
+
+    lows = np.array([low for low, _ in intervals], dtype=np.int64)
+    highs = np.array([high for _, high in intervals], dtype=np.int64)
+
+    if len(intervals) == 0:
+        missing = np.ones(len(starts), dtype=bool)
+    elif np.all(lows[1:] >= lows[:-1]):
+        # An interval is present if one of the intervals that start before it also ends after it.
+        index = np.searchsorted(lows, starts, side="right") - 1
+        max_highs = np.maximum.accumulate(highs)
+        missing = (index < 0) | (max_highs[np.maximum(index, 0)] < ends)
+    else:
+        missing = np.array(
+            [
+                _is_interval_missing(current_ts, next_ts, intervals)
+                for current_ts, next_ts in zip(starts.tolist(), ends.tolist())
+            ],
+            dtype=bool,
+        )
 
-    while True:
-        ts = to_timestamp(croniter.get_next(estimate=True))
+    if missing.any():
+        if lookback:
+            if model_end_ts:
+                croniter = interval_unit.croniter(end_ts)
+                end_ts = to_timestamp(croniter.get_prev(estimate=True))
 
-        if ts > end_ts:
-            if len(timestamps) > 1:
-                timestamps[-1] = end_ts
-            else:
-                timestamps.append(end_ts)
-            break
+                if croniter.interval_seconds:
+                    step = croniter.interval_seconds * 1000
+                    lookback -= max(-((model_end_ts - end_ts) // step), 0)
+                else:
+                    while model_end_ts < end_ts:
+                        end_ts = to_timestamp(croniter.get_prev(estimate=True))
+                        lookback -= 1
+
+                lookback = max(lookback, 0)
+
+            # An interval is also missing if the interval that is lookback intervals after it is missing
+            # or if it's within the lookback window of the end.
+            lookback_missing = np.ones(len(missing), dtype=bool)
+            lookback_missing[: max(len(missing) - lookback, 0)] = missing[lookback:]
+            missing |= lookback_missing
+
+        if model_end_ts:
+            missing &= starts < model_end_ts
+
+    return list(zip(starts[missing].tolist(), ends[missing].tolist()))
 
-        timestamps.append(ts)
 
-    missing = set()
+def _interval_timestamps(interval_unit: IntervalUnit, start_ts: int, end_ts: int) -> np.ndarray:
+    """Returns boundaries of intervals between start and end, where the last boundary is the end."""
+    croniter = interval_unit.croniter(start_ts)
 
-    for current_ts, next_ts in zip(timestamps, timestamps[1:]):
-        for low, high in intervals:
-            if current_ts < low:
-                missing.add((current_ts, next_ts))
-                break
-            elif current_ts >= low and next_ts <= high:
-                break
+    if croniter.interval_seconds:
+        step = croniter.interval_seconds * 1000
+        timestamps = np.arange(start_ts, max(end_ts, start_ts) + 1, step, dtype=np.int64)
+        if len(timestamps) > 1:
+            timestamps[-1] = end_ts
         else:
-            missing.add((current_ts, next_ts))
+            timestamps = np.append(timestamps, np.int64(end_ts))
+        return timestamps
 
-    if missing:
-        if lookback:
-            if model_end_ts:
-                croniter = interval_unit.croniter(end_ts)
-                end_ts = to_timestamp(croniter.get_prev(estimate=True))
+    timestamp_list = [start_ts]
 
-                while model_end_ts < end_ts:
-                    end_ts = to_timestamp(croniter.get_prev(estimate=True))
-                    lookback -= 1
+    while True:
+        ts = to_timestamp(croniter.get_next(estimate=True))
 
-                lookback = max(lookback, 0)
+        if ts > end_ts:
+            if len(timestamp_list) > 1:
+                timestamp_list[-1] = end_ts
+            else:
+                timestamp_list.append(end_ts)
+            break
 
-            for i, (current_ts, next_ts) in enumerate(zip(timestamps, timestamps[1:])):
-                parent = timestamps[i + lookback : i + lookback + 2]
+        timestamp_list.append(ts)
 
-                if len(parent) < 2 or tuple(parent) in missing:
-                    missing.add((current_ts, next_ts))
+    return np.array(timestamp_list, dtype=np.int64)
 
-        if model_end_ts:
-            missing = {interval for interval in missing if interval[0] < model_end_ts}
 
-    return sorted(missing)
+def _is_interval_missing(current_ts: int, next_ts: int, intervals: t.Iterable[Interval]) -> bool:
+    for low, high in intervals:
+        if current_ts < low:
+            return True
+        elif current_ts >= low and next_ts <= high:
+            return False
+    return True
 
 
 @lru_cache(maxsize=None)
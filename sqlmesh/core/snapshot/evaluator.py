@@ -23,6 +23,7 @@ For more information about audits, see `sqlmesh.core.audit`.
 from __future__ import annotations
 
 import abc
+import itertools
 import logging
 import typing as t
 import sys
@@ -358,6 +359,7 @@ class SnapshotEvaluator:
         raise_exception: bool = True,
         deployability_index: t.Optional[DeployabilityIndex] = None,
         wap_id: t.Optional[str] = None,
+        blocking: t.Optional[bool] = None,
         **kwargs: t.Any,
     ) -> t.List[AuditResult]:
         """Execute a snapshot's node's audit queries.
@@ -372,6 +374,8 @@ class SnapshotEvaluator:
                 AuditError is thrown or if we just warn with logger
             deployability_index: Determines snapshots that are deployable in the context of this evaluation.
             wap_id: The WAP ID if applicable, None otherwise.
+            blocking: If set, only audits that are blocking (True) or non-blocking (False) are executed.
+                Otherwise all audits are executed.
             kwargs: Additional kwargs to pass to the renderer.
         """
         deployability_index = deployability_index or DeployabilityIndex.all_deployable()
@@ -406,9 +410,23 @@ class SnapshotEvaluator:
         if audits_with_args:
             logger.info("Auditing snapshot %s", snapshot.snapshot_id)
 
-        for audit, audit_args in snapshot.audits_with_args:
-            results.append(
-                self._audit(
+        audits_with_blocking = [
+            (audit, audit_args, self._is_audit_blocking(audit, audit_args))
+            for audit, audit_args in audits_with_args
+        ]
+        if blocking is not None:
+            # Audits are filtered before rendering so that each audit is only rendered by the call running it.
+            audits_with_blocking = [
+                audit_with_blocking
+                for audit_with_blocking in audits_with_blocking
+                if audit_with_blocking[2] == blocking
+            ]
+
+        rendered_audits = [
+            (
+                audit,
+                audit_blocking,
+                self._render_audit(
                     audit=audit,
                     audit_args=audit_args,
                     snapshot=snapshot,
@@ -416,9 +434,27 @@ class SnapshotEvaluator:
                     start=start,
                     end=end,
                     execution_time=execution_time,
-                    raise_exception=raise_exception,
                     deployability_index=deployability_index,
                     **kwargs,
+                ),
+            )
+            for audit, audit_args, audit_blocking in audits_with_blocking
+        ]
+
+        # Audits that only filter rows of the same source are evaluated together in a single scan.
+        fused_counts = self._fetch_fused_audit_counts(
+            [query for _, _, query in rendered_audits if query is not None]
+        )
+
+        for audit, blocking, query in rendered_audits:
+            results.append(
+                self._audit(
+                    audit=audit,
+                    blocking=blocking,
+                    query=query,
+                    count=fused_counts.get(id(query)) if query is not None else None,
+                    snapshot=snapshot,
+                    raise_exception=raise_exception,
                 )
             )
 
@@ -593,9 +629,10 @@ class SnapshotEvaluator:
 
             # DataFrames, unlike SQL expressions, can provide partial results by yielding dataframes. As a result,
             # if the engine supports INSERT OVERWRITE or REPLACE WHERE and the snapshot is incremental by time range, we risk
-            # having a partial result since each dataframe write can re-truncate partitions. To avoid this, we
-            # union all the dataframes together before writing. For pandas this could result in OOM and a potential
-            # workaround for that would be to serialize pandas to disk and then read it back with Spark.
+            # having a partial result since each dataframe write can re-truncate partitions. To avoid this, pandas
+            # dataframes are first appended one by one into a staging table which is then used as the source of a
+            # single overwrite, so that only one dataframe is held in memory at a time. Other dataframe types
+            # (eg. PySpark, Snowpark) are evaluated lazily, so they are unioned together before writing.
             # Note: We assume that if multiple things are yielded from `queries_or_dfs` that they are dataframes
             # and not SQL expressions.
             elif (
@@ -603,15 +640,32 @@ class SnapshotEvaluator:
                 in (InsertOverwriteStrategy.INSERT_OVERWRITE, InsertOverwriteStrategy.REPLACE_WHERE)
                 and snapshot.is_incremental_by_time_range
             ):
-                query_or_df = reduce(
-                    lambda a, b: (
-                        pd.concat([a, b], ignore_index=True)  # type: ignore
-                        if isinstance(a, pd.DataFrame)
-                        else a.union_all(b)  # type: ignore
-                    ),  # type: ignore
-                    queries_or_dfs,
-                )
-                apply(query_or_df, index=0)
+                first_query_or_df = next(queries_or_dfs, None)
+                second_query_or_df = next(queries_or_dfs, None)
+                if second_query_or_df is None:
+                    if first_query_or_df is not None:
+                        apply(first_query_or_df, index=0)
+                elif isinstance(first_query_or_df, pd.DataFrame):
+                    with self._staged_dataframes(
+                        t.cast(
+                            t.Iterator[pd.DataFrame],
+                            itertools.chain(
+                                [first_query_or_df, second_query_or_df], queries_or_dfs
+                            ),
+                        ),
+                        target_table_name=snapshot.table_name(
+                            is_deployable=deployability_index.is_deployable(snapshot)
+                        ),
+                        columns_to_types=model.columns_to_types,
+                    ) as staged_query:
+                        apply(staged_query, index=0)
+                else:
+                    query_or_df = reduce(
+                        lambda a, b: a.union_all(b),  # type: ignore
+                        queries_or_dfs,
+                        first_query_or_df.union_all(second_query_or_df),  # type: ignore
+                    )
+                    apply(query_or_df, index=0)
             else:
                 for index, query_or_df in enumerate(queries_or_dfs):
                     apply(query_or_df, index)
@@ -621,6 +675,42 @@ class SnapshotEvaluator:
 
             return wap_id
 
+    @contextmanager
+    def _staged_dataframes(
+        self,
+        dfs: t.Iterable[pd.DataFrame],
+        target_table_name: str,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> t.Iterator[exp.Query]:
+        """Appends the given dataframes one by one into a staging table located next to the target table.
+
+        Only one dataframe is held in memory at a time. The staging table is dropped when the block exits.
+
+        Args:
+            dfs: The dataframes to stage. Must contain at least one dataframe.
+            target_table_name: The name of the table the staged data will eventually be written into.
+            columns_to_types: A mapping between the column name and its data type. If not provided,
+                the types are inferred from the first dataframe.
+
+        Yields:
+            The query which selects all staged rows.
+        """
+        dfs = iter(dfs)
+        first_df = next(dfs)
+        columns_to_types = columns_to_types or self.adapter._columns_to_types(first_df)
+
+        staging_table = self.adapter._get_temp_table(target_table_name)
+        logger.info("Staging dataframes into '%s'", staging_table.sql())
+        self.adapter.create_table(staging_table, columns_to_types)
+        try:
+            for df in itertools.chain([first_df], dfs):
+                if not df.empty:
+                    self.adapter.insert_append(staging_table, df, columns_to_types=columns_to_types)
+
+            yield self.adapter._select_columns(columns_to_types).from_(staging_table)
+        finally:
+            self.adapter.drop_table(staging_table)
+
     def _create_snapshot(
         self,
         snapshot: Snapshot,
@@ -818,7 +908,16 @@ class SnapshotEvaluator:
         table_name = snapshot.table_name(is_deployable=deployability_index.is_deployable(snapshot))
         self.adapter.wap_publish(table_name, wap_id)
 
-    def _audit(
+    @staticmethod
+    def _is_audit_blocking(audit: Audit, audit_args: t.Dict[t.Any, t.Any]) -> bool:
+        if audit.skip:
+            return False
+
+        # Model's "blocking" argument takes precedence over the audit's default setting
+        blocking = audit_args.get("blocking")
+        return blocking == exp.true() if blocking else audit.blocking
+
+    def _render_audit(
         self,
         audit: Audit,
         audit_args: t.Dict[t.Any, t.Any],
@@ -827,22 +926,13 @@ class SnapshotEvaluator:
         start: t.Optional[TimeLike],
         end: t.Optional[TimeLike],
         execution_time: t.Optional[TimeLike],
-        raise_exception: bool,
         deployability_index: t.Optional[DeployabilityIndex],
         **kwargs: t.Any,
-    ) -> AuditResult:
+    ) -> t.Optional[exp.Query]:
         if audit.skip:
-            return AuditResult(
-                audit=audit,
-                model=snapshot.model_or_none,
-                skipped=True,
-            )
-
-        # Model's "blocking" argument takes precedence over the audit's default setting
-        blocking = audit_args.pop("blocking", None)
-        blocking = blocking == exp.true() if blocking else audit.blocking
+            return None
 
-        query = audit.render_query(
+        return audit.render_query(
             snapshot,
             start=start,
             end=end,
@@ -850,13 +940,75 @@ class SnapshotEvaluator:
             snapshots=snapshots,
             deployability_index=deployability_index,
             engine_adapter=self.adapter,
-            **audit_args,
+            **{name: value for name, value in audit_args.items() if name != "blocking"},
             **kwargs,
         )
-        count, *_ = self.adapter.fetchone(
-            select("COUNT(*)").from_(query.subquery("audit")),
-            quote_identifiers=True,
-        )  # type: ignore
+
+    def _fetch_fused_audit_counts(self, queries: t.List[exp.Query]) -> t.Dict[int, int]:
+        """Computes the number of rows returned by audit queries that select rows from the same source using
+        only a filter condition, by evaluating each group of such queries with one aggregate query.
+
+        Args:
+            queries: The rendered audit queries.
+
+        Returns:
+            A mapping from the id of each fused audit query to its row count. Queries that couldn't be fused
+            with any other query are not included.
+        """
+        queries_by_source: t.Dict[
+            str, t.List[t.Tuple[exp.Query, exp.Expression, exp.Expression]]
+        ] = defaultdict(list)
+        for query in queries:
+            source_and_condition = _audit_source_and_condition(query)
+            if source_and_condition:
+                source, condition = source_and_condition
+                queries_by_source[source.sql()].append((query, source, condition))
+
+        counts = {}
+        for group in queries_by_source.values():
+            if len(group) < 2:
+                continue
+
+            source = group[0][1]
+            fused_query = select(
+                *(
+                    exp.func(
+                        "SUM",
+                        exp.case()
+                        .when(condition, exp.Literal.number(1))
+                        .else_(exp.Literal.number(0)),
+                    ).as_(f"audit_{i}")
+                    for i, (_, _, condition) in enumerate(group)
+                )
+            ).from_(source.copy())
+            row = self.adapter.fetchone(fused_query, quote_identifiers=True)
+            for i, (query, _, _) in enumerate(group):
+                # SUM returns NULL if the source has no rows
+                counts[id(query)] = int(row[i] or 0) if row else 0
+
+        return counts
+
+    def _audit(
+        self,
+        audit: Audit,
+        blocking: bool,
+        query: t.Optional[exp.Query],
+        count: t.Optional[int],
+        snapshot: Snapshot,
+        raise_exception: bool,
+    ) -> AuditResult:
+        if query is None:
+            return AuditResult(
+                audit=audit,
+                model=snapshot.model_or_none,
+                skipped=True,
+            )
+
+        if count is None:
+            count, *_ = self.adapter.fetchone(
+                select("COUNT(*)").from_(query.subquery("audit")),
+                quote_identifiers=True,
+            )  # type: ignore
         if count and raise_exception:
             audit_error = AuditError(
                 audit_name=audit.name,
@@ -888,6 +1040,43 @@ class SnapshotEvaluator:
             self.adapter.create_schema(schema)
 
 
+def _audit_source_and_condition(
+    query: exp.Query,
+) -> t.Optional[t.Tuple[exp.Expression, exp.Expression]]:
+    """Returns the source and the filter condition of an audit query if it has the form
+    `SELECT * FROM <source> WHERE <condition>`, which is the case for most built-in audits."""
+    if (
+        not isinstance(query, exp.Select)
+        or len(query.expressions) != 1
+        or not isinstance(query.expressions[0], exp.Star)
+        or not query.args.get("from")
+        or not query.args.get("where")
+        or any(
+            query.args.get(arg)
+            for arg in (
+                "with",
+                "joins",
+                "laterals",
+                "group",
+                "having",
+                "qualify",
+                "order",
+                "limit",
+                "offset",
+                "distinct",
+                "windows",
+            )
+        )
+    ):
+        return None
+
+    condition = query.args["where"].this
+    if condition.find(exp.AggFunc, exp.Window, exp.Query):
+        return None
+
+    return query.args["from"].this, condition
+
+
 def _evaluation_strategy(snapshot: SnapshotInfoLike, adapter: EngineAdapter) -> EvaluationStrategy:
     klass: t.Type
     if snapshot.is_embedded:
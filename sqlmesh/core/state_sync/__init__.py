@@ -19,6 +19,9 @@ from sqlmesh.core.state_sync.base import (
     StateSync as StateSync,
     Versions as Versions,
 )
-from sqlmesh.core.state_sync.cache import CachingStateSync as CachingStateSync
+from sqlmesh.core.state_sync.cache import (
+    CachingStateSync as CachingStateSync,
+    StateLoader as StateLoader,
+)
 from sqlmesh.core.state_sync.common import cleanup_expired_views as cleanup_expired_views
 from sqlmesh.core.state_sync.engine_adapter import EngineAdapterStateSync as EngineAdapterStateSync
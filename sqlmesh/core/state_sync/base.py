@@ -30,6 +30,9 @@ from sqlmesh.utils.pydantic import (
 
 logger = logging.getLogger(__name__)
 
+ENVIRONMENTS_TABLE_VERSION = "environments"
+INTERVALS_TABLE_VERSION = "intervals"
+
 
 class Versions(PydanticModel):
     """Represents the various versions of dependencies in the state sync."""
@@ -97,6 +100,22 @@ class StateReader(abc.ABC):
             A dictionary of snapshot ids to snapshots for ones that could be found.
         """
 
+    @abc.abstractmethod
+    def get_stored_snapshots(
+        self, snapshots: t.Collection[Snapshot]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        """Bulk fetch the stored counterparts of the given snapshots.
+
+        Stored snapshots have the same fingerprints as the given ones, so they reuse their nodes instead
+        of fetching and parsing the stored node payloads. Only snapshot records and intervals are read.
+
+        Args:
+            snapshots: The snapshots to fetch the stored counterparts of.
+
+        Returns:
+            A dictionary of snapshot ids to stored snapshots for ones that could be found.
+        """
+
     @abc.abstractmethod
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         """Checks if multiple snapshots exist in the state sync.
@@ -158,6 +177,16 @@ class StateReader(abc.ABC):
             A dictionary of model FQNs to their respective interval ends in milliseconds since epoch.
         """
 
+    @abc.abstractmethod
+    def get_table_versions(self) -> t.Dict[str, int]:
+        """Returns the current versions of state tables. A version is incremented every time the
+        corresponding table changes, which makes it possible to cheaply check whether cached state is stale.
+
+        Returns:
+            A dictionary of table names (see ENVIRONMENTS_TABLE_VERSION and INTERVALS_TABLE_VERSION) to their
+            respective versions. Tables whose changes are not tracked are omitted.
+        """
+
     @abc.abstractmethod
     def recycle(self) -> None:
         """Closes all open connections and releases all allocated resources associated with any thread
@@ -276,7 +305,9 @@ class StateSync(StateReader, abc.ABC):
 
     @abc.abstractmethod
     def delete_expired_snapshots(
-        self, ignore_ttl: bool = False
+        self,
+        ignore_ttl: bool = False,
+        cleanup: t.Optional[t.Callable[[t.List[SnapshotTableCleanupTask]], None]] = None,
     ) -> t.List[SnapshotTableCleanupTask]:
         """Removes expired snapshots.
 
@@ -286,6 +317,9 @@ class StateSync(StateReader, abc.ABC):
         Args:
             ignore_ttl: Ignore the TTL on the snapshot when considering it expired. This has the effect of deleting
                 all snapshots that are not referenced in any environment
+            cleanup: A callback that cleans up the tables of expired snapshots. If provided, it is called once with
+                the cleanup tasks of all expired snapshots and the snapshots are only removed once the cleanup of
+                their tables succeeds. This way an interrupted cleanup is resumed the next time this method is called.
 
         Returns:
             The list of table cleanup tasks.
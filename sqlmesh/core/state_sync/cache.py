@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 import typing as t
 
+from sqlmesh.core.environment import Environment
 from sqlmesh.core.model import SeedModel
 from sqlmesh.core.snapshot import (
     Snapshot,
@@ -11,8 +12,14 @@ from sqlmesh.core.snapshot import (
     SnapshotInfoLike,
     SnapshotTableCleanupTask,
 )
-from sqlmesh.core.snapshot.definition import Interval, SnapshotIntervals
-from sqlmesh.core.state_sync.base import DelegatingStateSync, StateSync
+from sqlmesh.core.snapshot.definition import Interval, Intervals, SnapshotIntervals
+from sqlmesh.core.state_sync.base import (
+    ENVIRONMENTS_TABLE_VERSION,
+    INTERVALS_TABLE_VERSION,
+    DelegatingStateSync,
+    StateReader,
+    StateSync,
+)
 from sqlmesh.utils.date import TimeLike, now_timestamp
 
 if sys.version_info >= (3, 8):
@@ -22,7 +29,10 @@ else:
 
 
 class CachingStateSync(DelegatingStateSync):
-    """In memory cache for snapshots that implements the state sync api.
+    """In memory cache for snapshots, environments and intervals that implements the state sync api.
+
+    Snapshots are cached for a fixed amount of time. Environments and intervals are cached for as long as
+    the versions of their tables in the base state sync remain the same.
 
     Args:
         state_sync: The base state sync.
@@ -40,6 +50,109 @@ class CachingStateSync(DelegatingStateSync):
 
         self.ttl = ttl
 
+        # Cached entries are only valid for the table versions they were fetched at.
+        self.table_versions: t.Dict[str, int] = {}
+        self.environment_cache: t.Dict[str, t.Optional[Environment]] = {}
+        self.all_environments: t.Optional[t.List[Environment]] = None
+        self.max_interval_end_cache: t.Dict[
+            t.Tuple[str, t.Optional[t.FrozenSet[str]], bool], t.Dict[str, int]
+        ] = {}
+        self.interval_cache: t.Dict[t.Tuple, t.Tuple[Intervals, Intervals]] = {}
+
+    def _validate_cache(self, *names: str) -> bool:
+        """Checks the current table versions and drops entries cached at older versions.
+
+        Returns:
+            Whether the changes of all the given tables are tracked, so that their state can be cached.
+        """
+        table_versions = self.state_sync.get_table_versions()
+        if table_versions.get(ENVIRONMENTS_TABLE_VERSION) != self.table_versions.get(
+            ENVIRONMENTS_TABLE_VERSION
+        ):
+            self.environment_cache.clear()
+            self.all_environments = None
+            self.max_interval_end_cache.clear()
+        if table_versions.get(INTERVALS_TABLE_VERSION) != self.table_versions.get(
+            INTERVALS_TABLE_VERSION
+        ):
+            self.max_interval_end_cache.clear()
+            self.interval_cache.clear()
+        self.table_versions = table_versions
+        return all(name in table_versions for name in names)
+
+    def get_environment(self, environment: str) -> t.Optional[Environment]:
+        if not self._validate_cache(ENVIRONMENTS_TABLE_VERSION):
+            return self.state_sync.get_environment(environment)
+
+        if environment not in self.environment_cache:
+            self.environment_cache[environment] = self.state_sync.get_environment(environment)
+        cached = self.environment_cache[environment]
+        return cached.copy() if cached else None
+
+    def get_environments(self) -> t.List[Environment]:
+        if not self._validate_cache(ENVIRONMENTS_TABLE_VERSION):
+            return self.state_sync.get_environments()
+
+        if self.all_environments is None:
+            self.all_environments = self.state_sync.get_environments()
+        return [env.copy() for env in self.all_environments]
+
+    def max_interval_end_per_model(
+        self,
+        environment: str,
+        models: t.Optional[t.Set[str]] = None,
+        ensure_finalized_snapshots: bool = False,
+    ) -> t.Dict[str, int]:
+        if not self._validate_cache(ENVIRONMENTS_TABLE_VERSION, INTERVALS_TABLE_VERSION):
+            return self.state_sync.max_interval_end_per_model(
+                environment, models=models, ensure_finalized_snapshots=ensure_finalized_snapshots
+            )
+
+        key = (
+            environment,
+            frozenset(models) if models is not None else None,
+            ensure_finalized_snapshots,
+        )
+        if key not in self.max_interval_end_cache:
+            self.max_interval_end_cache[key] = self.state_sync.max_interval_end_per_model(
+                environment, models=models, ensure_finalized_snapshots=ensure_finalized_snapshots
+            )
+        return dict(self.max_interval_end_cache[key])
+
+    def refresh_snapshot_intervals(self, snapshots: t.Collection[Snapshot]) -> t.List[Snapshot]:
+        if not snapshots or not self._validate_cache(INTERVALS_TABLE_VERSION):
+            return self.state_sync.refresh_snapshot_intervals(snapshots)
+
+        missing = []
+        for snapshot in snapshots:
+            cached = self.interval_cache.get(self._interval_cache_key(snapshot))
+            if cached:
+                snapshot.intervals = list(cached[0])
+                snapshot.dev_intervals = list(cached[1])
+            else:
+                missing.append(snapshot)
+
+        if missing:
+            for snapshot in self.state_sync.refresh_snapshot_intervals(missing):
+                self.interval_cache[self._interval_cache_key(snapshot)] = (
+                    list(snapshot.intervals),
+                    list(snapshot.dev_intervals),
+                )
+
+        return list(snapshots)
+
+    @staticmethod
+    def _interval_cache_key(snapshot: Snapshot) -> t.Tuple:
+        # Besides stored intervals, the refreshed intervals depend on these attributes of the snapshot.
+        return (
+            snapshot.snapshot_id,
+            snapshot.version_get_or_generate(),
+            snapshot.change_category,
+            snapshot.effective_from,
+            snapshot.previous_versions,
+            snapshot.migrated,
+        )
+
     def _from_cache(
         self, snapshot_id: SnapshotId, now: int
     ) -> t.Optional[Snapshot | Literal[False]]:
@@ -56,14 +169,37 @@ class CachingStateSync(DelegatingStateSync):
     ) -> t.Dict[SnapshotId, Snapshot]:
         if snapshot_ids is None:
             return self.state_sync.get_snapshots(snapshot_ids)
+        return self._get_snapshots(
+            {s.snapshot_id for s in snapshot_ids}, self.state_sync.get_snapshots
+        )
 
+    def get_stored_snapshots(
+        self, snapshots: t.Collection[Snapshot]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        snapshots_by_id = {snapshot.snapshot_id: snapshot for snapshot in snapshots}
+        stored = self._get_snapshots(
+            set(snapshots_by_id),
+            lambda missing: self.state_sync.get_stored_snapshots(
+                [snapshots_by_id[snapshot_id] for snapshot_id in missing]
+            ),
+        )
+        # Cached snapshots are shared, so the local nodes are attached to copies of them.
+        return {
+            snapshot_id: snapshot.copy(update={"node": snapshots_by_id[snapshot_id].node})
+            for snapshot_id, snapshot in stored.items()
+        }
+
+    def _get_snapshots(
+        self,
+        snapshot_ids: t.Set[SnapshotId],
+        loader: t.Callable[[t.Set[SnapshotId]], t.Dict[SnapshotId, Snapshot]],
+    ) -> t.Dict[SnapshotId, Snapshot]:
         existing = {}
         missing = set()
         now = now_timestamp()
         expire_at = now + self.ttl * 1000
 
-        for s in snapshot_ids:
-            snapshot_id = s.snapshot_id
+        for snapshot_id in snapshot_ids:
             snapshot = self._from_cache(snapshot_id, now)
 
             if snapshot is None:
@@ -73,7 +209,7 @@ class CachingStateSync(DelegatingStateSync):
                 existing[snapshot_id] = snapshot
 
         if missing:
-            existing.update(self.state_sync.get_snapshots(missing))
+            existing.update(loader(missing))
 
         for snapshot_id, snapshot in existing.items():
             cached = self._from_cache(snapshot_id, now)
@@ -117,10 +253,12 @@ class CachingStateSync(DelegatingStateSync):
         self.state_sync.delete_snapshots(snapshot_ids)
 
     def delete_expired_snapshots(
-        self, ignore_ttl: bool = False
+        self,
+        ignore_ttl: bool = False,
+        cleanup: t.Optional[t.Callable[[t.List[SnapshotTableCleanupTask]], None]] = None,
     ) -> t.List[SnapshotTableCleanupTask]:
         self.snapshot_cache.clear()
-        return self.state_sync.delete_expired_snapshots(ignore_ttl=ignore_ttl)
+        return self.state_sync.delete_expired_snapshots(ignore_ttl=ignore_ttl, cleanup=cleanup)
 
     def add_snapshots_intervals(self, snapshots_intervals: t.Sequence[SnapshotIntervals]) -> None:
         for snapshot_intervals in snapshots_intervals:
@@ -141,3 +279,110 @@ class CachingStateSync(DelegatingStateSync):
     ) -> None:
         self.snapshot_cache.clear()
         self.state_sync.unpause_snapshots(snapshots, unpaused_dt)
+
+
+class StateLoader:
+    """Loads environments and snapshots from the state at most once.
+
+    Building a plan reads the same environments and snapshots at several stages. A loader is meant to
+    live for the duration of a single plan and memoizes everything it reads. Local snapshots are loaded
+    with their stored counterparts, and only the previous versions of modified snapshots are loaded in
+    full, along with them.
+
+    Args:
+        state_reader: The state reader to load from.
+    """
+
+    def __init__(self, state_reader: StateReader):
+        self.state_reader = state_reader
+        self._environments: t.Dict[str, t.Optional[Environment]] = {}
+        # None means that the snapshot does not exist in the state.
+        self._snapshots: t.Dict[SnapshotId, t.Optional[Snapshot]] = {}
+        self._prefetched: t.Set[SnapshotId] = set()
+
+    def get_environment(self, environment: str) -> t.Optional[Environment]:
+        if environment not in self._environments:
+            self._environments[environment] = self.state_reader.get_environment(environment)
+        return self._environments[environment]
+
+    def get_snapshots(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        requested = {s.snapshot_id for s in snapshot_ids}
+        self._load(requested)
+        return self._memoized(requested)
+
+    def get_stored_snapshots(
+        self, snapshots: t.Collection[Snapshot]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        """Loads the stored counterparts of local snapshots.
+
+        Prefetched snapshots that share a name with the given snapshots but have different fingerprints
+        are loaded in full as well, since they are the previous versions of modified snapshots.
+
+        Args:
+            snapshots: The local snapshots.
+
+        Returns:
+            A dictionary of snapshot ids to stored snapshots for ones that could be found.
+        """
+        snapshots_by_id = {snapshot.snapshot_id: snapshot for snapshot in snapshots}
+        names = {snapshot.name for snapshot in snapshots}
+        previous = {
+            snapshot_id
+            for snapshot_id in self._prefetched
+            if snapshot_id.name in names and snapshot_id not in snapshots_by_id
+        }
+        self._prefetched -= previous
+
+        missing = [
+            snapshot
+            for snapshot_id, snapshot in snapshots_by_id.items()
+            if snapshot_id not in self._snapshots
+        ]
+        if missing:
+            stored = self.state_reader.get_stored_snapshots(missing)
+            for snapshot in missing:
+                self._snapshots[snapshot.snapshot_id] = stored.get(snapshot.snapshot_id)
+        self._load(previous)
+
+        return self._memoized(set(snapshots_by_id))
+
+    def prefetch_environment(
+        self, environment: str, create_from: str, ensure_finalized_snapshots: bool = False
+    ) -> None:
+        """Schedules the snapshots that an environment will be diffed against to be prefetched.
+
+        Args:
+            environment: The environment to diff.
+            create_from: The environment to create the target environment from if it doesn't exist.
+            ensure_finalized_snapshots: Whether to diff against snapshots from the latest finalized
+                environment state.
+        """
+        env = self.get_environment(environment.lower())
+        if env is None or env.expired:
+            env = self.get_environment(create_from.lower())
+        if env:
+            self._prefetched.update(
+                s.snapshot_id
+                for s in (
+                    env.finalized_or_current_snapshots
+                    if ensure_finalized_snapshots
+                    else env.snapshots
+                )
+            )
+
+    def _load(self, snapshot_ids: t.Set[SnapshotId]) -> None:
+        missing = snapshot_ids - self._snapshots.keys()
+        if missing:
+            loaded = self.state_reader.get_snapshots(missing)
+            for snapshot_id in missing:
+                self._snapshots[snapshot_id] = loaded.get(snapshot_id)
+
+    def _memoized(self, snapshot_ids: t.Set[SnapshotId]) -> t.Dict[SnapshotId, Snapshot]:
+        snapshots = {}
+        for snapshot_id in snapshot_ids:
+            snapshot = self._snapshots[snapshot_id]
+            if snapshot:
+                snapshots[snapshot_id] = snapshot
+        return snapshots
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import typing as t
 from functools import wraps
@@ -61,6 +62,15 @@ def cleanup_expired_views(
             logger.warning("Falied to drop the expired environment view '%s': %s", expired_view, e)
 
 
+def serialize_node(node: t.Dict[str, t.Any]) -> str:
+    """Serializes a node payload for the nodes table.
+
+    Payloads are addressed by the hash of this serialization, so both the state sync and the migration that
+    moved the payloads into the nodes table must use it to store equal nodes only once.
+    """
+    return json.dumps(node, separators=(",", ":"), ensure_ascii=False)
+
+
 def transactional() -> t.Callable[[t.Callable], t.Callable]:
     def decorator(func: t.Callable) -> t.Callable:
         @wraps(func)
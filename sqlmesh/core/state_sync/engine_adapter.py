@@ -54,7 +54,7 @@ from sqlmesh.core.snapshot import (
     fingerprint_from_node,
     start_date,
 )
-from sqlmesh.core.snapshot.cache import SnapshotCache
+from sqlmesh.core.snapshot.cache import ParsedNodeCache, SnapshotCache
 from sqlmesh.core.snapshot.definition import (
     Interval,
     _parents_from_node,
@@ -62,17 +62,20 @@ from sqlmesh.core.snapshot.definition import (
     remove_interval,
 )
 from sqlmesh.core.state_sync.base import (
+    ENVIRONMENTS_TABLE_VERSION,
+    INTERVALS_TABLE_VERSION,
     MIGRATIONS,
     SCHEMA_VERSION,
     PromotionResult,
     StateSync,
     Versions,
 )
-from sqlmesh.core.state_sync.common import transactional
-from sqlmesh.utils import major_minor, random_id, unique
+from sqlmesh.core.state_sync.common import serialize_node, transactional
+from sqlmesh.utils import major_minor, random_id
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import TimeLike, now, now_timestamp, time_like_to_str, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.hashing import md5
 
 logger = logging.getLogger(__name__)
 
@@ -121,10 +124,12 @@ class EngineAdapterStateSync(StateSync):
         self.engine_adapter = engine_adapter
         self.console = console or get_console()
         self.snapshots_table = exp.table_("_snapshots", db=self.schema)
+        self.nodes_table = exp.table_("_nodes", db=self.schema)
         self.environments_table = exp.table_("_environments", db=self.schema)
         self.intervals_table = exp.table_("_intervals", db=self.schema)
         self.plan_dags_table = exp.table_("_plan_dags", db=self.schema)
         self.versions_table = exp.table_("_versions", db=self.schema)
+        self.table_versions_table = exp.table_("_table_versions", db=self.schema)
 
         self._snapshot_columns_to_types = {
             "name": exp.DataType.build("text"),
@@ -136,6 +141,13 @@ class EngineAdapterStateSync(StateSync):
             "unpaused_ts": exp.DataType.build("bigint"),
             "ttl_ms": exp.DataType.build("bigint"),
             "unrestorable": exp.DataType.build("boolean"),
+            "node_hash": exp.DataType.build("text"),
+        }
+
+        # Node payloads are stored once per distinct content and referenced by their hash.
+        self._node_columns_to_types = {
+            "node_hash": exp.DataType.build("text"),
+            "node": exp.DataType.build("text"),
         }
 
         self._environment_columns_to_types = {
@@ -174,6 +186,7 @@ class EngineAdapterStateSync(StateSync):
         }
 
         self._snapshot_cache = SnapshotCache(context_path / c.CACHE)
+        self._parsed_node_cache = ParsedNodeCache()
 
     def _fetchone(self, query: t.Union[exp.Expression, str]) -> t.Optional[t.Tuple]:
         return self.engine_adapter.fetchone(
@@ -222,19 +235,98 @@ class EngineAdapterStateSync(StateSync):
             self.delete_snapshots(snapshots)
 
         snapshots_to_store = []
+        nodes_by_hash = {}
 
         for snapshot in snapshots:
             if isinstance(snapshot.node, SeedModel):
                 seed_model = t.cast(SeedModel, snapshot.node)
                 snapshot = snapshot.copy(update={"node": seed_model.to_dehydrated()})
-            snapshots_to_store.append(snapshot)
+            serialized_node = serialize_node(snapshot.node.dict(mode="json"))
+            node_hash = md5([serialized_node])
+            nodes_by_hash[node_hash] = serialized_node
+            snapshots_to_store.append((snapshot, node_hash))
 
+        self._push_nodes(nodes_by_hash)
         self.engine_adapter.insert_append(
             self.snapshots_table,
             _snapshots_to_df(snapshots_to_store),
             columns_to_types=self._snapshot_columns_to_types,
         )
 
+    def _push_nodes(self, nodes_by_hash: t.Dict[str, str]) -> None:
+        """Stores node payloads that aren't in the state store yet."""
+        # The existing rows are locked so that they can't be deleted as orphans before the snapshots that
+        # reference them are stored.
+        existing_hashes = {
+            node_hash
+            for batch in self._batches(sorted(nodes_by_hash))
+            for (node_hash,) in self._fetchall(
+                exp.select("node_hash")
+                .from_(self.nodes_table)
+                .where(exp.column("node_hash").isin(*batch))
+                .lock(copy=False)
+            )
+        }
+        new_nodes = [
+            {"node_hash": node_hash, "node": serialized_node}
+            for node_hash, serialized_node in nodes_by_hash.items()
+            if node_hash not in existing_hashes
+        ]
+        if new_nodes:
+            self.engine_adapter.insert_append(
+                self.nodes_table,
+                pd.DataFrame(new_nodes),
+                columns_to_types=self._node_columns_to_types,
+            )
+
+    def _get_nodes(self, node_hashes: t.Iterable[str]) -> t.Dict[str, str]:
+        """Fetches serialized node payloads by their hashes, each distinct payload only once."""
+        node_hashes = sorted(set(node_hashes))
+        nodes_by_hash = {
+            node_hash: serialized_node
+            for batch in self._batches(node_hashes)
+            for node_hash, serialized_node in self._fetchall(
+                exp.select("node_hash", "node")
+                .from_(self.nodes_table)
+                .where(exp.column("node_hash").isin(*batch))
+            )
+        }
+        missing_hashes = set(node_hashes) - set(nodes_by_hash)
+        if missing_hashes:
+            raise SQLMeshError(
+                f"Node payloads {', '.join(sorted(missing_hashes))} are missing from the state store."
+            )
+        return nodes_by_hash
+
+    def _delete_orphaned_nodes(self, node_hashes: t.Iterable[str]) -> None:
+        """Deletes the given node payloads unless they are still referenced by a snapshot."""
+        for batch in self._batches(sorted(set(node_hashes))):
+            node_hash_filter = exp.column("node_hash").isin(*batch)
+            # Waits for concurrent pushes that reuse these payloads, since they lock the same rows.
+            self._fetchall(
+                exp.select("node_hash")
+                .from_(self.nodes_table)
+                .where(node_hash_filter)
+                .lock(copy=False)
+            )
+            self.engine_adapter.delete_from(
+                self.nodes_table,
+                where=exp.and_(
+                    node_hash_filter,
+                    exp.not_(
+                        exp.Exists(
+                            this=exp.select("1")
+                            .from_(exp.alias_(self.snapshots_table, "s", table=True))
+                            .where(
+                                exp.column("node_hash", table="s").eq(
+                                    exp.column("node_hash", table=self.nodes_table.name)
+                                )
+                            )
+                        )
+                    ),
+                ),
+            )
+
     @transactional()
     def promote(
         self,
@@ -404,6 +496,7 @@ class EngineAdapterStateSync(StateSync):
             {"finalized_ts": environment.finalized_ts},
             where=environment_filter,
         )
+        self._bump_table_versions(ENVIRONMENTS_TABLE_VERSION)
 
     @transactional()
     def unpause_snapshots(
@@ -501,78 +594,142 @@ class EngineAdapterStateSync(StateSync):
             {"expiration_ts": now_timestamp()},
             where=filter_expr,
         )
+        self._bump_table_versions(ENVIRONMENTS_TABLE_VERSION)
 
     @transactional()
     def delete_expired_snapshots(
-        self, ignore_ttl: bool = False
+        self,
+        ignore_ttl: bool = False,
+        cleanup: t.Optional[t.Callable[[t.List[SnapshotTableCleanupTask]], None]] = None,
     ) -> t.List[SnapshotTableCleanupTask]:
         current_ts = now_timestamp(minute_floor=False)
+        promoted_snapshot_ids = self._get_environment_snapshot_ids()
+
+        expired_snapshots: t.List[SnapshotTableInfo] = []
+        cleanup_targets: t.List[SnapshotTableCleanupTask] = []
+        last_version: t.Optional[SnapshotNameVersion] = None
+        while True:
+            versions = self._get_expired_versions_page(current_ts, ignore_ttl, last_version)
+            if not versions:
+                break
+            last_version = versions[-1]
+
+            page_expired_snapshots, page_cleanup_targets = self._get_expired_snapshots(
+                versions, current_ts, ignore_ttl, promoted_snapshot_ids
+            )
+            expired_snapshots.extend(page_expired_snapshots)
+            cleanup_targets.extend(page_cleanup_targets)
+
+        # Tables of all pages are cleaned up together, so that downstream tables are dropped before the
+        # upstream tables they reference. Snapshots are only removed once the cleanup succeeds.
+        if cleanup and cleanup_targets:
+            cleanup(cleanup_targets)
+
+        if expired_snapshots:
+            # Downstream snapshots are removed before the upstream snapshots they depend on.
+            expired_snapshot_ids = {s.snapshot_id for s in expired_snapshots}
+            dag: DAG[SnapshotId] = DAG(
+                {
+                    s.snapshot_id: {p for p in s.parents if p in expired_snapshot_ids}
+                    for s in expired_snapshots
+                }
+            )
+            for batch in self._batches(dag.sorted[::-1]):
+                self.delete_snapshots(batch)
 
-        expired_query = exp.select("name", "identifier", "version").from_(self.snapshots_table)
+        return cleanup_targets
 
-        if not ignore_ttl:
-            expired_query = expired_query.where(
-                (exp.column("updated_ts") + exp.column("ttl_ms")) <= current_ts
+    def _get_environment_snapshot_ids(self) -> t.Set[SnapshotId]:
+        """Fetches the IDs of snapshots that are referenced by environments without parsing the environments."""
+        return {
+            SnapshotId(
+                name=snapshot["name"],
+                identifier=SnapshotFingerprint.parse_obj(snapshot["fingerprint"]).to_identifier(),
             )
-
-        expired_candidates = {
-            SnapshotId(name=name, identifier=identifier): SnapshotNameVersion(
-                name=name, version=version
+            for (snapshots,) in self._fetchall(
+                exp.select("snapshots").from_(self.environments_table)
             )
-            for name, identifier, version in self._fetchall(expired_query)
+            for snapshot in json.loads(snapshots)
         }
-        if not expired_candidates:
-            return []
 
-        promoted_snapshot_ids = {
-            snapshot.snapshot_id
-            for environment in self.get_environments()
-            for snapshot in environment.snapshots
-        }
+    def _get_expired_versions_page(
+        self,
+        current_ts: int,
+        ignore_ttl: bool,
+        last_version: t.Optional[SnapshotNameVersion],
+    ) -> t.List[SnapshotNameVersion]:
+        """Fetches the next page of versions with expired snapshots in (name, version) order, which is
+        served by the name_version_idx index.
 
-        def _is_snapshot_used(snapshot: Snapshot) -> bool:
-            return (
-                snapshot.snapshot_id in promoted_snapshot_ids
-                or snapshot.snapshot_id not in expired_candidates
-            )
+        Args:
+            current_ts: The timestamp to determine expiration against.
+            ignore_ttl: Whether to consider all snapshots expired.
+            last_version: The last version of the previous page.
 
-        unique_expired_versions = unique(expired_candidates.values())
-        version_batches = self._batches(unique_expired_versions)
-        cleanup_targets = []
-        for versions_batch in version_batches:
-            snapshots = self._get_snapshots_with_same_version(versions_batch)
-
-            snapshots_by_version = defaultdict(set)
-            snapshots_by_temp_version = defaultdict(set)
-            for s in snapshots:
-                snapshots_by_version[(s.name, s.version)].add(s.snapshot_id)
-                snapshots_by_temp_version[(s.name, s.temp_version_get_or_generate())].add(
-                    s.snapshot_id
+        Returns:
+            The list of versions.
+        """
+        query = exp.select("name", "version").distinct().from_(self.snapshots_table)
+        if not ignore_ttl:
+            query = query.where((exp.column("updated_ts") + exp.column("ttl_ms")) <= current_ts)
+        if last_version:
+            name = exp.column("name")
+            query = query.where(
+                exp.or_(
+                    name > exp.Literal.string(last_version.name),
+                    exp.and_(
+                        name.eq(exp.Literal.string(last_version.name)),
+                        exp.column("version") > exp.Literal.string(last_version.version),
+                    ),
                 )
+            )
+        query = query.order_by("name", "version").limit(self.SNAPSHOT_BATCH_SIZE)
+        return [
+            SnapshotNameVersion(name=name, version=version)
+            for name, version in self._fetchall(query)
+        ]
 
-            expired_snapshots = [s for s in snapshots if not _is_snapshot_used(s)]
-
-            if expired_snapshots:
-                self.delete_snapshots(expired_snapshots)
+    def _get_expired_snapshots(
+        self,
+        versions: t.List[SnapshotNameVersion],
+        current_ts: int,
+        ignore_ttl: bool,
+        promoted_snapshot_ids: t.Set[SnapshotId],
+    ) -> t.Tuple[t.List[SnapshotTableInfo], t.List[SnapshotTableCleanupTask]]:
+        snapshots = self._get_snapshots_with_same_version(versions)
+
+        snapshots_by_version = defaultdict(set)
+        snapshots_by_temp_version = defaultdict(set)
+        for s in snapshots:
+            snapshots_by_version[(s.name, s.version)].add(s.snapshot_id)
+            snapshots_by_temp_version[(s.name, s.temp_version_get_or_generate())].add(s.snapshot_id)
+
+        expired_snapshots = [
+            s
+            for s in snapshots
+            if s.snapshot_id not in promoted_snapshot_ids
+            and (ignore_ttl or s.updated_ts + s.ttl_ms <= current_ts)
+        ]
 
-            for snapshot in expired_snapshots:
-                shared_version_snapshots = snapshots_by_version[(snapshot.name, snapshot.version)]
-                shared_version_snapshots.discard(snapshot.snapshot_id)
+        cleanup_targets = []
+        for snapshot in expired_snapshots:
+            shared_version_snapshots = snapshots_by_version[(snapshot.name, snapshot.version)]
+            shared_version_snapshots.discard(snapshot.snapshot_id)
 
-                shared_temp_version_snapshots = snapshots_by_temp_version[
-                    (snapshot.name, snapshot.temp_version_get_or_generate())
-                ]
-                shared_temp_version_snapshots.discard(snapshot.snapshot_id)
+            shared_temp_version_snapshots = snapshots_by_temp_version[
+                (snapshot.name, snapshot.temp_version_get_or_generate())
+            ]
+            shared_temp_version_snapshots.discard(snapshot.snapshot_id)
 
-                if not shared_temp_version_snapshots:
-                    cleanup_targets.append(
-                        SnapshotTableCleanupTask(
-                            snapshot=snapshot.table_info,
-                            dev_table_only=bool(shared_version_snapshots),
-                        )
+            if not shared_temp_version_snapshots:
+                cleanup_targets.append(
+                    SnapshotTableCleanupTask(
+                        snapshot=snapshot.table_info,
+                        dev_table_only=bool(shared_version_snapshots),
                     )
+                )
 
-        return cleanup_targets
+        return [s.table_info for s in expired_snapshots], cleanup_targets
 
     def delete_expired_environments(self) -> t.List[Environment]:
         now_ts = now_timestamp()
@@ -589,16 +746,28 @@ class EngineAdapterStateSync(StateSync):
         )
         environments = [self._environment_from_row(r) for r in rows]
 
-        self.engine_adapter.delete_from(
-            self.environments_table,
-            where=filter_expr,
-        )
+        if environments:
+            self.engine_adapter.delete_from(
+                self.environments_table,
+                where=filter_expr,
+            )
+            self._bump_table_versions(ENVIRONMENTS_TABLE_VERSION)
 
         return environments
 
+    @transactional()
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
+        node_hashes: t.Set[str] = set()
         for where in self._snapshot_id_filter(snapshot_ids):
+            node_hashes.update(
+                node_hash
+                for (node_hash,) in self._fetchall(
+                    exp.select("node_hash").from_(self.snapshots_table).where(where)
+                )
+                if node_hash
+            )
             self.engine_adapter.delete_from(self.snapshots_table, where=where)
+        self._delete_orphaned_nodes(node_hashes)
 
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         return self._snapshot_ids_exist(snapshot_ids, self.snapshots_table)
@@ -623,13 +792,16 @@ class EngineAdapterStateSync(StateSync):
         """Resets the state store to the state when it was first initialized."""
         for table in (
             self.snapshots_table,
+            self.nodes_table,
             self.environments_table,
             self.intervals_table,
             self.plan_dags_table,
             self.versions_table,
+            self.table_versions_table,
         ):
             self.engine_adapter.drop_table(table)
         self._snapshot_cache.clear()
+        self._parsed_node_cache.clear()
         self.migrate(default_catalog)
 
     def _update_environment(self, environment: Environment) -> None:
@@ -646,6 +818,7 @@ class EngineAdapterStateSync(StateSync):
             _environment_to_df(environment),
             columns_to_types=self._environment_columns_to_types,
         )
+        self._bump_table_versions(ENVIRONMENTS_TABLE_VERSION)
 
     def _update_snapshots(
         self,
@@ -700,6 +873,43 @@ class EngineAdapterStateSync(StateSync):
             raise SQLMeshError("Must provide snapshot IDs to fetch snapshots.")
         return self._get_snapshots(snapshot_ids)
 
+    def get_stored_snapshots(
+        self, snapshots: t.Collection[Snapshot]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        if not snapshots:
+            return {}
+
+        nodes = {snapshot.snapshot_id: snapshot.node for snapshot in snapshots}
+        stored: t.Dict[SnapshotId, Snapshot] = {}
+        for query in self._get_snapshots_expressions(nodes):
+            for (
+                serialized_snapshot,
+                name,
+                identifier,
+                _,
+                updated_ts,
+                unpaused_ts,
+                unrestorable,
+                _,
+            ) in self._fetchall(query):
+                snapshot_id = SnapshotId(name=name, identifier=identifier)
+                duplicate = stored.get(snapshot_id)
+                if duplicate and duplicate.updated_ts >= updated_ts:
+                    continue
+                stored[snapshot_id] = parse_snapshot(
+                    serialized_snapshot=serialized_snapshot,
+                    serialized_node=nodes[snapshot_id],
+                    updated_ts=updated_ts,
+                    unpaused_ts=unpaused_ts,
+                    unrestorable=unrestorable,
+                )
+
+        if stored:
+            _, intervals = self._get_snapshot_intervals(stored.values())
+            Snapshot.hydrate_with_intervals_by_version(stored.values(), intervals)
+
+        return stored
+
     def _get_snapshots(
         self,
         snapshot_ids: t.Iterable[SnapshotIdLike],
@@ -720,7 +930,9 @@ class EngineAdapterStateSync(StateSync):
 
         def _loader(snapshot_ids_to_load: t.Set[SnapshotId]) -> t.Collection[Snapshot]:
             fetched_snapshots: t.Dict[SnapshotId, Snapshot] = {}
-            for query in self._get_snapshots_expressions(snapshot_ids_to_load, lock_for_update):
+            rows = [
+                (serialized_snapshot, updated_ts, unpaused_ts, unrestorable, node_hash)
+                for query in self._get_snapshots_expressions(snapshot_ids_to_load, lock_for_update)
                 for (
                     serialized_snapshot,
                     _,
@@ -729,22 +941,19 @@ class EngineAdapterStateSync(StateSync):
                     updated_ts,
                     unpaused_ts,
                     unrestorable,
-                ) in self._fetchall(query):
-                    snapshot = parse_snapshot(
-                        serialized_snapshot=serialized_snapshot,
-                        updated_ts=updated_ts,
-                        unpaused_ts=unpaused_ts,
-                        unrestorable=unrestorable,
+                    node_hash,
+                ) in self._fetchall(query)
+            ]
+            for snapshot in self._snapshots_from_rows(rows):
+                snapshot_id = snapshot.snapshot_id
+                if snapshot_id in fetched_snapshots:
+                    other = duplicates.get(snapshot_id, fetched_snapshots[snapshot_id])
+                    duplicates[snapshot_id] = (
+                        snapshot if snapshot.updated_ts > other.updated_ts else other
                     )
-                    snapshot_id = snapshot.snapshot_id
-                    if snapshot_id in fetched_snapshots:
-                        other = duplicates.get(snapshot_id, fetched_snapshots[snapshot_id])
-                        duplicates[snapshot_id] = (
-                            snapshot if snapshot.updated_ts > other.updated_ts else other
-                        )
-                        fetched_snapshots[snapshot_id] = duplicates[snapshot_id]
-                    else:
-                        fetched_snapshots[snapshot_id] = snapshot
+                    fetched_snapshots[snapshot_id] = duplicates[snapshot_id]
+                else:
+                    fetched_snapshots[snapshot_id] = snapshot
             return fetched_snapshots.values()
 
         snapshots, cached_snapshots = self._snapshot_cache.get_or_load(
@@ -803,6 +1012,7 @@ class EngineAdapterStateSync(StateSync):
                     "snapshots.updated_ts",
                     "snapshots.unpaused_ts",
                     "snapshots.unrestorable",
+                    "snapshots.node_hash",
                 )
                 .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
                 .where(where)
@@ -834,7 +1044,7 @@ class EngineAdapterStateSync(StateSync):
 
         for where in self._snapshot_name_version_filter(snapshots):
             query = (
-                exp.select("snapshot", "updated_ts", "unpaused_ts", "unrestorable")
+                exp.select("snapshot", "updated_ts", "unpaused_ts", "unrestorable", "node_hash")
                 .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
                 .where(where)
             )
@@ -843,17 +1053,39 @@ class EngineAdapterStateSync(StateSync):
 
             snapshot_rows.extend(self._fetchall(query))
 
-        return [
-            Snapshot(
-                **{
-                    **json.loads(snapshot),
-                    "updated_ts": updated_ts,
-                    "unpaused_ts": unpaused_ts,
-                    "unrestorable": unrestorable,
-                }
+        return self._snapshots_from_rows(snapshot_rows)
+
+    def _snapshots_from_rows(
+        self, rows: t.Collection[t.Tuple[str, int, t.Optional[int], bool, str]]
+    ) -> t.List[Snapshot]:
+        """Parses snapshot rows, reusing nodes that have already been parsed.
+
+        Args:
+            rows: Tuples of the serialized snapshot, updated_ts, unpaused_ts, unrestorable and node_hash.
+
+        Returns:
+            The list of Snapshot objects.
+        """
+        parsed_nodes = {node_hash: self._parsed_node_cache.get(node_hash) for *_, node_hash in rows}
+        serialized_nodes = self._get_nodes(
+            node_hash for node_hash, node in parsed_nodes.items() if node is None
+        )
+
+        snapshots = []
+        for serialized_snapshot, updated_ts, unpaused_ts, unrestorable, node_hash in rows:
+            parsed_node = parsed_nodes[node_hash]
+            snapshot = parse_snapshot(
+                serialized_snapshot=serialized_snapshot,
+                serialized_node=parsed_node.copy() if parsed_node else serialized_nodes[node_hash],
+                updated_ts=updated_ts,
+                unpaused_ts=unpaused_ts,
+                unrestorable=unrestorable,
             )
-            for snapshot, updated_ts, unpaused_ts, unrestorable in snapshot_rows
-        ]
+            if parsed_node is None:
+                parsed_nodes[node_hash] = snapshot.node
+                self._parsed_node_cache.put(node_hash, snapshot.node)
+            snapshots.append(snapshot)
+        return snapshots
 
     def _get_versions(self, lock_for_update: bool = False) -> Versions:
         no_version = Versions()
@@ -959,6 +1191,7 @@ class EngineAdapterStateSync(StateSync):
                 _snapshots_intervals_to_df(intervals_to_insert, is_removed=False),
                 columns_to_types=self._interval_columns_to_types,
             )
+            self._bump_table_versions(INTERVALS_TABLE_VERSION)
 
     @transactional()
     def remove_intervals(
@@ -1001,6 +1234,7 @@ class EngineAdapterStateSync(StateSync):
                 _intervals_to_df(intervals_to_remove, is_dev=is_dev, is_removed=True),
                 columns_to_types=self._interval_columns_to_types,
             )
+        self._bump_table_versions(INTERVALS_TABLE_VERSION)
 
     @transactional()
     def compact_intervals(self) -> None:
@@ -1075,6 +1309,21 @@ class EngineAdapterStateSync(StateSync):
 
         return result
 
+    def get_table_versions(self) -> t.Dict[str, int]:
+        return {
+            name: version
+            for name, version in self._fetchall(
+                exp.select("name", "version").from_(self.table_versions_table)
+            )
+        }
+
+    def _bump_table_versions(self, *names: str) -> None:
+        self.engine_adapter.update_table(
+            self.table_versions_table,
+            {"version": exp.column("version") + 1},
+            where=exp.column("name").isin(*names),
+        )
+
     def recycle(self) -> None:
         self.engine_adapter.recycle()
 
@@ -1138,18 +1387,29 @@ class EngineAdapterStateSync(StateSync):
 
             intervals: t.Dict[t.Tuple[str, str, str], Intervals] = defaultdict(list)
             dev_intervals: t.Dict[t.Tuple[str, str, str], Intervals] = defaultdict(list)
+            # Added intervals are collected as is and only merged once a removal needs to be applied
+            # on top of them, or once all rows have been processed.
+            unmerged_keys: t.Set[t.Tuple[bool, t.Tuple[str, str, str]]] = set()
             for row in rows:
                 _, name, identifier, version, start, end, is_dev, is_removed = row
                 intervals_key = (name, identifier, version)
                 target_intervals = intervals if not is_dev else dev_intervals
                 if is_removed:
+                    if (is_dev, intervals_key) in unmerged_keys:
+                        unmerged_keys.remove((is_dev, intervals_key))
+                        target_intervals[intervals_key] = merge_intervals(
+                            target_intervals[intervals_key]
+                        )
                     target_intervals[intervals_key] = remove_interval(
                         target_intervals[intervals_key], start, end
                     )
                 else:
-                    target_intervals[intervals_key] = merge_intervals(
-                        [*target_intervals[intervals_key], (start, end)]
-                    )
+                    unmerged_keys.add((is_dev, intervals_key))
+                    target_intervals[intervals_key].append((start, end))
+
+            for is_dev, intervals_key in unmerged_keys:
+                target_intervals = intervals if not is_dev else dev_intervals
+                target_intervals[intervals_key] = merge_intervals(target_intervals[intervals_key])
 
             for name, identifier, version in {**intervals, **dev_intervals}:
                 snapshot_intervals.append(
@@ -1220,6 +1480,7 @@ class EngineAdapterStateSync(StateSync):
                 # Cleanup plan DAGs since we currently don't migrate snapshot records that are in there.
                 self.engine_adapter.delete_from(self.plan_dags_table, "TRUE")
             self._update_versions()
+            self._bump_table_versions(ENVIRONMENTS_TABLE_VERSION, INTERVALS_TABLE_VERSION)
 
             analytics.collector.on_migration_end(
                 from_sqlmesh_version=versions.sqlmesh_version,
@@ -1249,11 +1510,11 @@ class EngineAdapterStateSync(StateSync):
         """Rollback to the previous migration."""
         logger.info("Starting migration rollback.")
         tables = (self.snapshots_table, self.environments_table, self.versions_table)
-        optional_tables = (self.intervals_table, self.plan_dags_table)
+        optional_tables = (self.intervals_table, self.plan_dags_table, self.nodes_table)
         versions = self.get_versions(validate=False)
         if versions.schema_version == 0:
             # Clean up state tables
-            for table in tables + optional_tables:
+            for table in tables + optional_tables + (self.table_versions_table,):
                 self.engine_adapter.drop_table(table)
         else:
             if not all(
@@ -1267,6 +1528,10 @@ class EngineAdapterStateSync(StateSync):
                 if self.engine_adapter.table_exists(_backup_table_name(optional_table)):
                     self._restore_table(optional_table, _backup_table_name(optional_table))
 
+            # Table versions are not restored so that state cached before the rollback gets invalidated.
+            if self.engine_adapter.table_exists(self.table_versions_table):
+                self._bump_table_versions(ENVIRONMENTS_TABLE_VERSION, INTERVALS_TABLE_VERSION)
+
         logger.info("Migration rollback successful.")
 
     def state_type(self) -> str:
@@ -1279,6 +1544,7 @@ class EngineAdapterStateSync(StateSync):
             self.versions_table,
             self.intervals_table,
             self.plan_dags_table,
+            self.nodes_table,
         ):
             if self.engine_adapter.table_exists(table):
                 with self.engine_adapter.transaction():
@@ -1325,22 +1591,42 @@ class EngineAdapterStateSync(StateSync):
         self, snapshots: t.Optional[t.Set[SnapshotId]]
     ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
         logger.info("Migrating snapshot rows...")
-        raw_snapshots = {
-            SnapshotId(name=name, identifier=identifier): {
-                **json.loads(raw_snapshot),
-                "updated_ts": updated_ts,
-                "unpaused_ts": unpaused_ts,
-                "unrestorable": unrestorable,
-            }
+        snapshot_rows = [
+            row
             for where in (self._snapshot_id_filter(snapshots) if snapshots is not None else [None])
-            for name, identifier, raw_snapshot, updated_ts, unpaused_ts, unrestorable in self._fetchall(
+            for row in self._fetchall(
                 exp.select(
-                    "name", "identifier", "snapshot", "updated_ts", "unpaused_ts", "unrestorable"
+                    "name",
+                    "identifier",
+                    "snapshot",
+                    "updated_ts",
+                    "unpaused_ts",
+                    "unrestorable",
+                    "node_hash",
                 )
                 .from_(self.snapshots_table)
                 .where(where)
                 .lock()
             )
+        ]
+        nodes_by_hash = self._get_nodes(row[-1] for row in snapshot_rows)
+        raw_snapshots = {
+            SnapshotId(name=name, identifier=identifier): {
+                **json.loads(raw_snapshot),
+                "node": json.loads(nodes_by_hash[node_hash]),
+                "updated_ts": updated_ts,
+                "unpaused_ts": unpaused_ts,
+                "unrestorable": unrestorable,
+            }
+            for (
+                name,
+                identifier,
+                raw_snapshot,
+                updated_ts,
+                unpaused_ts,
+                unrestorable,
+                node_hash,
+            ) in snapshot_rows
         }
         if not raw_snapshots:
             return {}
@@ -1665,21 +1951,22 @@ def _interval_to_df(
     }
 
 
-def _snapshots_to_df(snapshots: t.Iterable[Snapshot]) -> pd.DataFrame:
+def _snapshots_to_df(snapshots: t.Iterable[t.Tuple[Snapshot, str]]) -> pd.DataFrame:
     return pd.DataFrame(
         [
             {
                 "name": snapshot.name,
                 "identifier": snapshot.identifier,
                 "version": snapshot.version,
-                "snapshot": _snapshot_to_json(snapshot),
+                "snapshot": _snapshot_to_json(snapshot, exclude_node=True),
                 "kind_name": snapshot.model_kind_name.value if snapshot.model_kind_name else None,
                 "updated_ts": snapshot.updated_ts,
                 "unpaused_ts": snapshot.unpaused_ts,
                 "ttl_ms": snapshot.ttl_ms,
                 "unrestorable": snapshot.unrestorable,
+                "node_hash": node_hash,
             }
-            for snapshot in snapshots
+            for snapshot, node_hash in snapshots
         ]
     )
 
@@ -1720,21 +2007,27 @@ def _backup_table_name(table_name: TableName) -> exp.Table:
     return table
 
 
-def _snapshot_to_json(snapshot: Snapshot) -> str:
-    return snapshot.json(
-        exclude={"intervals", "dev_intervals", "updated_ts", "unpaused_ts", "unrestorable"}
-    )
+def _snapshot_to_json(snapshot: Snapshot, exclude_node: bool = False) -> str:
+    exclude = {"intervals", "dev_intervals", "updated_ts", "unpaused_ts", "unrestorable"}
+    if exclude_node:
+        exclude.add("node")
+    return snapshot.json(exclude=exclude)
 
 
 def parse_snapshot(
     serialized_snapshot: str,
+    serialized_node: t.Union[str, Node],
     updated_ts: int,
     unpaused_ts: t.Optional[int],
     unrestorable: bool,
 ) -> Snapshot:
+    """Parses a snapshot row. An already parsed node is used as is, without being validated again."""
     return Snapshot(
         **{
             **json.loads(serialized_snapshot),
+            "node": (
+                json.loads(serialized_node) if isinstance(serialized_node, str) else serialized_node
+            ),
             "updated_ts": updated_ts,
             "unpaused_ts": unpaused_ts,
             "unrestorable": unrestorable,
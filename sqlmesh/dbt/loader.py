@@ -244,7 +244,7 @@ class DbtLoader(Loader):
 
             target = t.cast(TargetConfig, project.context.target)
             cache_path = loader._context.path / c.CACHE / target.name
-            self._model_cache = ModelCache(cache_path)
+            self._model_cache = ModelCache(cache_path, loader._context.config.cache)
 
         def get_or_load_model(self, target_path: Path, loader: t.Callable[[], Model]) -> Model:
             model = self._model_cache.get_or_load(
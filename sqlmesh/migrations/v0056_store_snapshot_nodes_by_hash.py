@@ -0,0 +1,125 @@
+"""Move snapshot node payloads into the content-addressed '_nodes' table."""
+
+import json
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.core.state_sync.common import serialize_node
+from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    snapshots_table = "_snapshots"
+    nodes_table = "_nodes"
+    if schema:
+        snapshots_table = f"{schema}.{snapshots_table}"
+        nodes_table = f"{schema}.{nodes_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+
+    engine_adapter.drop_table(nodes_table)
+    engine_adapter.create_state_table(
+        nodes_table,
+        {
+            "node_hash": exp.DataType.build(index_type),
+            "node": exp.DataType.build("text"),
+        },
+    )
+    engine_adapter.create_index(nodes_table, "node_hash_idx", ("node_hash",))
+
+    alter_table_exp = exp.Alter(
+        this=exp.to_table(snapshots_table),
+        kind="TABLE",
+        actions=[
+            exp.ColumnDef(
+                this=exp.to_column("node_hash"),
+                kind=exp.DataType.build(index_type),
+            )
+        ],
+    )
+    engine_adapter.execute(alter_table_exp)
+
+    new_snapshots = []
+    nodes_by_hash = {}
+
+    for (
+        name,
+        identifier,
+        version,
+        snapshot,
+        kind_name,
+        updated_ts,
+        unpaused_ts,
+        ttl_ms,
+        unrestorable,
+    ) in engine_adapter.fetchall(
+        exp.select(
+            "name",
+            "identifier",
+            "version",
+            "snapshot",
+            "kind_name",
+            "updated_ts",
+            "unpaused_ts",
+            "ttl_ms",
+            "unrestorable",
+        ).from_(snapshots_table),
+        quote_identifiers=True,
+    ):
+        parsed_snapshot = json.loads(snapshot)
+        node = serialize_node(parsed_snapshot.pop("node"))
+        node_hash = md5([node])
+        nodes_by_hash[node_hash] = node
+
+        new_snapshots.append(
+            {
+                "name": name,
+                "identifier": identifier,
+                "version": version,
+                "snapshot": json.dumps(parsed_snapshot),
+                "kind_name": kind_name,
+                "updated_ts": updated_ts,
+                "unpaused_ts": unpaused_ts,
+                "ttl_ms": ttl_ms,
+                "unrestorable": unrestorable,
+                "node_hash": node_hash,
+            }
+        )
+
+    if new_snapshots:
+        engine_adapter.delete_from(snapshots_table, "TRUE")
+
+        engine_adapter.insert_append(
+            snapshots_table,
+            pd.DataFrame(new_snapshots),
+            columns_to_types={
+                "name": exp.DataType.build(index_type),
+                "identifier": exp.DataType.build(index_type),
+                "version": exp.DataType.build(index_type),
+                "snapshot": exp.DataType.build("text"),
+                "kind_name": exp.DataType.build(index_type),
+                "updated_ts": exp.DataType.build("bigint"),
+                "unpaused_ts": exp.DataType.build("bigint"),
+                "ttl_ms": exp.DataType.build("bigint"),
+                "unrestorable": exp.DataType.build("boolean"),
+                "node_hash": exp.DataType.build(index_type),
+            },
+        )
+
+        engine_adapter.insert_append(
+            nodes_table,
+            pd.DataFrame(
+                [
+                    {"node_hash": node_hash, "node": node}
+                    for node_hash, node in nodes_by_hash.items()
+                ]
+            ),
+            columns_to_types={
+                "node_hash": exp.DataType.build(index_type),
+                "node": exp.DataType.build("text"),
+            },
+        )
@@ -0,0 +1,37 @@
+"""Creates the '_table_versions' table which tracks changes to environments and intervals."""
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    table_versions_table = "_table_versions"
+    if schema:
+        table_versions_table = f"{schema}.{table_versions_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+    columns_to_types = {
+        "name": exp.DataType.build(index_type),
+        "version": exp.DataType.build("bigint"),
+    }
+
+    engine_adapter.create_state_table(
+        table_versions_table,
+        columns_to_types,
+        primary_key=("name",),
+    )
+
+    engine_adapter.insert_append(
+        table_versions_table,
+        pd.DataFrame(
+            [
+                {"name": "environments", "version": 0},
+                {"name": "intervals", "version": 0},
+            ]
+        ),
+        columns_to_types=columns_to_types,
+    )
@@ -88,6 +88,16 @@ class HttpStateSync(StateSync):
             environment, models=models, ensure_finalized_snapshots=ensure_finalized_snapshots
         )
 
+    def get_table_versions(self) -> t.Dict[str, int]:
+        """Returns the current versions of state tables.
+
+        Changes to state tables are not tracked through the Airflow REST API.
+
+        Returns:
+            An empty dictionary.
+        """
+        return {}
+
     def get_snapshots(
         self,
         snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]],
@@ -104,6 +114,20 @@ class HttpStateSync(StateSync):
         )
         return {snapshot.snapshot_id: snapshot for snapshot in snapshots}
 
+    def get_stored_snapshots(
+        self, snapshots: t.Collection[Snapshot]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        """Gets the stored counterparts of the given snapshots from the rest api.
+
+        The Airflow API always returns full snapshots, so the stored nodes are only replaced with the
+        given ones after the fact.
+        """
+        nodes = {snapshot.snapshot_id: snapshot.node for snapshot in snapshots}
+        stored = self.get_snapshots(nodes)
+        for snapshot_id, snapshot in stored.items():
+            snapshot.node = nodes[snapshot_id]
+        return stored
+
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         """Checks if multiple snapshots exist in the state sync.
 
@@ -163,7 +187,9 @@ class HttpStateSync(StateSync):
         raise NotImplementedError("Deleting snapshots is not supported by the Airflow state sync.")
 
     def delete_expired_snapshots(
-        self, ignore_ttl: bool = False
+        self,
+        ignore_ttl: bool = False,
+        cleanup: t.Optional[t.Callable[[t.List[SnapshotTableCleanupTask]], None]] = None,
     ) -> t.List[SnapshotTableCleanupTask]:
         """Removes expired snapshots.
 
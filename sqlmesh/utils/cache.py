@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import abc
 import gzip
 import logging
+import mmap
+import os
 import pickle
 import shutil
+import struct
 import typing as t
+from collections import OrderedDict
 from pathlib import Path
 
 from sqlglot import __version__ as SQLGLOT_VERSION
@@ -23,43 +28,29 @@ SQLGLOT_MAJOR_VERSION = SQLGLOT_VERSION_TUPLE[0]
 SQLGLOT_MINOR_VERSION = SQLGLOT_VERSION_TUPLE[1]
 
 
-class FileCache(t.Generic[T]):
-    """Generic file-based cache implementation.
+def _cache_version() -> str:
+    from sqlmesh.core.state_sync.base import SCHEMA_VERSION
 
-    Args:
-        path: The path to the cache folder.
-        entry_class: The type of cached entries.
-        prefix: The prefix shared between all entries to distinguish them from other entries
-            stored in the same cache folder.
-    """
+    try:
+        from sqlmesh._version import __version_tuple__
 
-    def __init__(self, path: Path, prefix: t.Optional[str] = None):
-        self._path = path / prefix if prefix else path
+        major, minor = __version_tuple__[0], __version_tuple__[1]
+    except ImportError:
+        major, minor = 0, 0
 
-        from sqlmesh.core.state_sync.base import SCHEMA_VERSION
+    return "_".join(
+        [
+            str(major),
+            str(minor),
+            SQLGLOT_MAJOR_VERSION,
+            SQLGLOT_MINOR_VERSION,
+            str(SCHEMA_VERSION),
+        ]
+    )
 
-        try:
-            from sqlmesh._version import __version_tuple__
-
-            major, minor = __version_tuple__[0], __version_tuple__[1]
-        except ImportError:
-            major, minor = 0, 0
-
-        self._cache_version = "_".join(
-            [
-                str(major),
-                str(minor),
-                SQLGLOT_MAJOR_VERSION,
-                SQLGLOT_MINOR_VERSION,
-                str(SCHEMA_VERSION),
-            ]
-        )
 
-        threshold = to_datetime("1 week ago").timestamp()
-        # delete all old cache files
-        for file in self._path.glob("*"):
-            if not file.stem.startswith(self._cache_version) or file.stat().st_atime < threshold:
-                file.unlink(missing_ok=True)
+class BaseCache(abc.ABC, t.Generic[T]):
+    """Base class for local caches of pickled entries."""
 
     def get_or_load(self, name: str, entry_id: str = "", *, loader: t.Callable[[], T]) -> T:
         """Returns an existing cached entry or loads and caches a new one.
@@ -80,6 +71,62 @@ class FileCache(t.Generic[T]):
         self.put(name, entry_id, value=loaded_entry)
         return loaded_entry
 
+    @abc.abstractmethod
+    def get(self, name: str, entry_id: str = "") -> t.Optional[T]:
+        """Returns a cached entry if exists.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+
+        Returns:
+            The entry or None if no entry was found in the cache.
+        """
+
+    @abc.abstractmethod
+    def put(self, name: str, entry_id: str = "", *, value: T) -> None:
+        """Stores the given value in the cache.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+            value: The value to store in the cache.
+        """
+
+    @abc.abstractmethod
+    def exists(self, name: str, entry_id: str = "") -> bool:
+        """Returns true if the cache entry with the given name and ID exists, false otherwise.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+
+
+class FileCache(BaseCache[T]):
+    """Generic file-based cache implementation.
+
+    Args:
+        path: The path to the cache folder.
+        entry_class: The type of cached entries.
+        prefix: The prefix shared between all entries to distinguish them from other entries
+            stored in the same cache folder.
+    """
+
+    def __init__(self, path: Path, prefix: t.Optional[str] = None):
+        self._path = path / prefix if prefix else path
+        self._cache_version = _cache_version()
+
+        threshold = to_datetime("1 week ago").timestamp()
+        # delete all old cache files
+        for file in self._path.glob("*"):
+            if not file.stem.startswith(self._cache_version) or file.stat().st_atime < threshold:
+                file.unlink(missing_ok=True)
+
     def get(self, name: str, entry_id: str = "") -> t.Optional[T]:
         """Returns a cached entry if exists.
 
@@ -133,3 +180,198 @@ class FileCache(t.Generic[T]):
     def _cache_entry_path(self, name: str, entry_id: str = "") -> Path:
         entry_file_name = "__".join(p for p in (self._cache_version, name, entry_id) if p)
         return self._path / sanitize_name(entry_file_name)
+
+
+class PackFileCache(BaseCache[T]):
+    """Generic cache implementation which stores all entries in a single append-only pack file.
+
+    Entries are located using an append-only index file and read from the memory-mapped pack file.
+    Once the size of the pack file exceeds the limit, the pack file is compacted by retaining only
+    the most recently used entries.
+
+    Args:
+        path: The path to the cache folder.
+        prefix: The name of the subfolder with the pack and index files.
+        max_size: The maximum size of the pack file in bytes.
+    """
+
+    # The length of the key and the length of the value
+    _RECORD_HEADER = struct.Struct("<II")
+    # The length of the key and the offset of the record in the pack file
+    _INDEX_HEADER = struct.Struct("<IQ")
+
+    def __init__(self, path: Path, prefix: t.Optional[str] = None, max_size: int = 1024**3):
+        self._path = path / prefix if prefix else path
+        self._max_size = max_size
+
+        cache_version = _cache_version()
+        self._pack_path = self._path / f"{cache_version}.pack"
+        self._index_path = self._path / f"{cache_version}.idx"
+
+        # delete files created by other versions
+        for file in self._path.glob("*"):
+            if file.suffix in (".pack", ".idx") and file.stem != cache_version:
+                file.unlink(missing_ok=True)
+
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._pack_size = 0
+        self._mmap: t.Optional[mmap.mmap] = None
+        self._load_index()
+
+    def get(self, name: str, entry_id: str = "") -> t.Optional[T]:
+        key = self._key(name, entry_id)
+        value = self._read(key)
+        if value is None:
+            return None
+
+        try:
+            entry = pickle.loads(value)
+        except Exception as ex:
+            logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+            return None
+        finally:
+            value.release()
+
+        self._index.move_to_end(key)
+        return entry
+
+    def put(self, name: str, entry_id: str = "", *, value: T) -> None:
+        self._path.mkdir(parents=True, exist_ok=True)
+        if not self._path.is_dir():
+            raise SQLMeshError(f"Cache path '{self._path}' is not a directory.")
+
+        key = self._key(name, entry_id)
+        key_bytes = key.encode("utf-8")
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with open(self._pack_path, "ab") as pack:
+            offset = pack.seek(0, os.SEEK_END)
+            pack.write(self._RECORD_HEADER.pack(len(key_bytes), len(data)) + key_bytes + data)
+            self._pack_size = pack.tell()
+
+        with open(self._index_path, "ab") as index:
+            index.write(self._INDEX_HEADER.pack(len(key_bytes), offset) + key_bytes)
+
+        self._index[key] = offset
+        self._index.move_to_end(key)
+
+        if self._pack_size > self._max_size:
+            self.compact()
+
+    def exists(self, name: str, entry_id: str = "") -> bool:
+        return self._key(name, entry_id) in self._index
+
+    def clear(self) -> None:
+        self._close()
+        self._index.clear()
+        self._pack_size = 0
+        try:
+            shutil.rmtree(str(self._path.absolute()))
+        except Exception:
+            pass
+
+    def compact(self) -> None:
+        """Rewrites the pack file retaining only the most recently used entries which fit into half of
+        the maximum size, so that the pack file doesn't have to be compacted after every insert."""
+        retained: t.List[t.Tuple[str, bytes]] = []
+        retained_size = 0
+        for key in reversed(self._index):
+            view = self._read(key)
+            if view is None:
+                continue
+            value = view.tobytes()
+            view.release()
+
+            record_size = self._RECORD_HEADER.size + len(key.encode("utf-8")) + len(value)
+            if retained_size + record_size > self._max_size // 2:
+                break
+            retained.append((key, value))
+            retained_size += record_size
+
+        self._close()
+        self._index.clear()
+
+        pack_tmp_path = self._pack_path.with_suffix(".pack.tmp")
+        index_tmp_path = self._index_path.with_suffix(".idx.tmp")
+        with open(pack_tmp_path, "wb") as pack, open(index_tmp_path, "wb") as index:
+            for key, value in reversed(retained):
+                key_bytes = key.encode("utf-8")
+                offset = pack.tell()
+                pack.write(self._RECORD_HEADER.pack(len(key_bytes), len(value)) + key_bytes + value)
+                index.write(self._INDEX_HEADER.pack(len(key_bytes), offset) + key_bytes)
+                self._index[key] = offset
+            self._pack_size = pack.tell()
+
+        os.replace(pack_tmp_path, self._pack_path)
+        os.replace(index_tmp_path, self._index_path)
+
+    def _load_index(self) -> None:
+        if not self._index_path.exists() or not self._pack_path.exists():
+            return
+
+        self._pack_size = self._pack_path.stat().st_size
+        data = self._index_path.read_bytes()
+        position = 0
+        while position + self._INDEX_HEADER.size <= len(data):
+            key_length, offset = self._INDEX_HEADER.unpack_from(data, position)
+            position += self._INDEX_HEADER.size
+            if position + key_length > len(data):
+                # The last record was only partially written
+                break
+            key = data[position : position + key_length].decode("utf-8", errors="replace")
+            position += key_length
+            if offset < self._pack_size:
+                self._index[key] = offset
+                self._index.move_to_end(key)
+
+    def _read(self, key: str) -> t.Optional[memoryview]:
+        offset = self._index.get(key)
+        if offset is None:
+            return None
+
+        buffer = self._buffer(offset + self._RECORD_HEADER.size)
+        if buffer is None:
+            return None
+
+        key_bytes = key.encode("utf-8")
+        key_length, value_length = self._RECORD_HEADER.unpack_from(buffer, offset)
+        key_start = offset + self._RECORD_HEADER.size
+        value_start = key_start + key_length
+        value_end = value_start + value_length
+        if value_end > len(buffer):
+            buffer = self._buffer(value_end)
+        if (
+            buffer is None
+            or key_length != len(key_bytes)
+            or buffer[key_start:value_start] != key_bytes
+        ):
+            # The pack file has been modified by another process
+            self._index.pop(key, None)
+            return None
+
+        return memoryview(buffer)[value_start:value_end]
+
+    def _buffer(self, min_size: int) -> t.Optional[mmap.mmap]:
+        if self._mmap is None or len(self._mmap) < min_size:
+            self._close()
+            if not self._pack_path.exists():
+                return None
+            with open(self._pack_path, "rb") as pack:
+                size = os.fstat(pack.fileno()).st_size
+                if size < min_size:
+                    return None
+                self._mmap = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _close(self) -> None:
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Memory views of the mapped file are still referenced, so let it be closed
+                # once they are garbage collected
+                pass
+            self._mmap = None
+
+    def _key(self, name: str, entry_id: str = "") -> str:
+        return "__".join(p for p in (name, entry_id) if p)
@@ -1,4 +1,7 @@
+import asyncio
+import heapq
 import typing as t
+from collections import defaultdict
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
 
@@ -18,34 +21,175 @@ class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
         super().__init__(f"Execution failed for node {node}")
 
 
-class ConcurrentDAGExecutor(t.Generic[H]):
-    """Concurrently traverses the given DAG in topological order while applying a function to each node.
+class _DAGExecutor(t.Generic[H]):
+    """Keeps track of the state of a topological traversal of the given DAG.
 
-    If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
+    The executor keeps track of the number of unprocessed dependencies of each node and a queue of nodes
+    that are ready to be processed, so that completing or skipping a node only touches its direct downstream
+    nodes. Ready nodes are processed in the order of their priority, and in the order they became ready
+    otherwise.
 
     Args:
         dag: The target DAG.
-        fn: The function that will be applied concurrently to each snapshot.
         tasks_num: The number of concurrent tasks.
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priorities: The priorities of nodes. Ready nodes with a higher priority are processed first.
+        node_resources: The number of slots of named resources that each node takes while being processed.
+        resource_limits: The number of available slots of each named resource. Ready nodes wait until
+            enough slots of all their resources are available.
     """
 
     def __init__(
         self,
         dag: DAG[H],
-        fn: t.Callable[[H], None],
         tasks_num: int,
         raise_on_error: bool,
+        priorities: t.Optional[t.Dict[H, float]] = None,
+        node_resources: t.Optional[t.Dict[H, t.Dict[str, int]]] = None,
+        resource_limits: t.Optional[t.Dict[str, int]] = None,
     ):
         self.dag = dag
-        self.fn = fn
         self.tasks_num = tasks_num
         self.raise_on_error = raise_on_error
+        self.priorities = priorities or {}
+        self.resource_limits = resource_limits or {}
+        # A node can't take more slots than there are, otherwise it would never be processed.
+        self.node_resources = {
+            node: {
+                resource: min(slots, self.resource_limits[resource])
+                for resource, slots in resources.items()
+                if resource in self.resource_limits
+            }
+            for node, resources in (node_resources or {}).items()
+        }
 
         self._init_state()
 
+    def _pop_nodes_to_process(self) -> t.Iterator[H]:
+        while self._ready_nodes and self._running_nodes_num < self.tasks_num:
+            ready_node = heapq.heappop(self._ready_nodes)
+            node = ready_node[2]
+
+            resources = self.node_resources.get(node, {})
+            exhausted_resource = next(
+                (r for r, slots in resources.items() if self._available_slots[r] < slots), None
+            )
+            if exhausted_resource is not None:
+                # The node becomes ready again once slots of the exhausted resource are released.
+                self._nodes_waiting_for_resource[exhausted_resource].append(ready_node)
+                continue
+
+            for resource, slots in resources.items():
+                self._available_slots[resource] -= slots
+            self._running_nodes_num += 1
+            yield node
+
+    def _complete_node(self, node: H) -> None:
+        self._release_resources(node)
+        self._unprocessed_nodes_num -= 1
+        for downstream_node in self._downstream_nodes[node]:
+            self._pending_deps_num[downstream_node] -= 1
+            if not self._pending_deps_num[downstream_node]:
+                self._add_ready_node(downstream_node)
+
+    def _fail_node(self, node: H, error: NodeExecutionFailedError[H]) -> None:
+        self._release_resources(node)
+        self._unprocessed_nodes_num -= 1
+        self._node_errors.append(error)
+        self._skip_downstream_nodes(node)
+
+    def _release_resources(self, node: H) -> None:
+        self._running_nodes_num -= 1
+        for resource, slots in self.node_resources.get(node, {}).items():
+            self._available_slots[resource] += slots
+            for ready_node in self._nodes_waiting_for_resource.pop(resource, []):
+                heapq.heappush(self._ready_nodes, ready_node)
+
+    def _add_ready_node(self, node: H) -> None:
+        # The sequence number preserves the order in which nodes became ready among nodes with the same priority.
+        heapq.heappush(
+            self._ready_nodes, (-self.priorities.get(node, 0.0), self._ready_nodes_seq, node)
+        )
+        self._ready_nodes_seq += 1
+
+    def _skip_downstream_nodes(self, failed_node: H) -> None:
+        # A skipped node never becomes ready since the failed node is one of its upstream nodes.
+        skipped_nodes = [failed_node]
+        for parent in skipped_nodes:
+            for downstream_node in self._downstream_nodes[parent]:
+                if downstream_node not in self._visited_skipped_nodes:
+                    self._visited_skipped_nodes.add(downstream_node)
+                    skipped_nodes.append(downstream_node)
+                    self._skipped_nodes.append(downstream_node)
+                    self._unprocessed_nodes_num -= 1
+
+    def _init_state(self) -> None:
+        graph = self.dag.graph
+
+        self._downstream_nodes: t.Dict[H, t.List[H]] = {node: [] for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                self._downstream_nodes[dep].append(node)
+
+        self._pending_deps_num = {node: len(deps) for node, deps in graph.items()}
+        self._ready_nodes: t.List[t.Tuple[float, int, H]] = []
+        self._ready_nodes_seq = 0
+        for node, deps in graph.items():
+            if not deps:
+                self._add_ready_node(node)
+        self._running_nodes_num = 0
+        self._available_slots = dict(self.resource_limits)
+        self._nodes_waiting_for_resource: t.Dict[str, t.List[t.Tuple[float, int, H]]] = defaultdict(
+            list
+        )
+        self._unprocessed_nodes_num = len(graph)
+
+        self._node_errors: t.List[NodeExecutionFailedError[H]] = []
+        self._skipped_nodes: t.List[H] = []
+        self._visited_skipped_nodes: t.Set[H] = set()
+
+
+class ConcurrentDAGExecutor(_DAGExecutor[H]):
+    """Concurrently traverses the given DAG in topological order while applying a function to each node
+    in a pool of threads.
+
+    If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
+
+    Args:
+        dag: The target DAG.
+        fn: The function that will be applied concurrently to each snapshot.
+        tasks_num: The number of concurrent tasks.
+        raise_on_error: If set to True raises an exception on a first encountered error,
+            otherwises returns a tuple which contains a list of failed nodes and a list of
+            skipped nodes.
+        priorities: The priorities of nodes. Ready nodes with a higher priority are processed first.
+        node_resources: The number of slots of named resources that each node takes while being processed.
+        resource_limits: The number of available slots of each named resource. Ready nodes wait until
+            enough slots of all their resources are available.
+    """
+
+    def __init__(
+        self,
+        dag: DAG[H],
+        fn: t.Callable[[H], None],
+        tasks_num: int,
+        raise_on_error: bool,
+        priorities: t.Optional[t.Dict[H, float]] = None,
+        node_resources: t.Optional[t.Dict[H, t.Dict[str, int]]] = None,
+        resource_limits: t.Optional[t.Dict[str, int]] = None,
+    ):
+        self.fn = fn
+        super().__init__(
+            dag,
+            tasks_num,
+            raise_on_error,
+            priorities=priorities,
+            node_resources=node_resources,
+            resource_limits=resource_limits,
+        )
+
     def run(self) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
         """Runs the executor.
 
@@ -59,8 +203,8 @@ class ConcurrentDAGExecutor(t.Generic[H]):
             self._init_state()
 
         with ThreadPoolExecutor(max_workers=self.tasks_num) as pool:
-            with self._unprocessed_nodes_lock:
-                self._submit_next_nodes(pool)
+            with self._state_lock:
+                self._submit_ready_nodes(pool)
             self._finished_future.result()
         return self._node_errors, self._skipped_nodes
 
@@ -68,9 +212,9 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         try:
             self.fn(node)
 
-            with self._unprocessed_nodes_lock:
-                self._unprocessed_nodes_num -= 1
-                self._submit_next_nodes(executor, node)
+            with self._state_lock:
+                self._complete_node(node)
+                self._submit_ready_nodes(executor)
         except Exception as ex:
             error = NodeExecutionFailedError(node)
             error.__cause__ = ex
@@ -79,51 +223,113 @@ class ConcurrentDAGExecutor(t.Generic[H]):
                 self._finished_future.set_exception(error)
                 return
 
-            with self._unprocessed_nodes_lock:
-                self._unprocessed_nodes_num -= 1
-                self._node_errors.append(error)
-                self._skip_next_nodes(node)
+            with self._state_lock:
+                self._fail_node(node, error)
+                self._submit_ready_nodes(executor)
 
-    def _submit_next_nodes(self, executor: Executor, processed_node: t.Optional[H] = None) -> None:
+    def _submit_ready_nodes(self, executor: Executor) -> None:
         if not self._unprocessed_nodes_num:
             self._finished_future.set_result(None)
             return
 
-        submitted_nodes = []
-        for next_node, deps in self._unprocessed_nodes.items():
-            if processed_node:
-                deps.discard(processed_node)
-            if not deps:
-                submitted_nodes.append(next_node)
+        for node in self._pop_nodes_to_process():
+            executor.submit(self._process_node, node, executor)
 
-        for submitted_node in submitted_nodes:
-            self._unprocessed_nodes.pop(submitted_node)
-            executor.submit(self._process_node, submitted_node, executor)
+    def _init_state(self) -> None:
+        super()._init_state()
+        self._state_lock = Lock()
+        self._finished_future = Future()  # type: ignore
 
-    def _skip_next_nodes(self, parent: H) -> None:
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
-            return
 
-        skipped_nodes = [node for node, deps in self._unprocessed_nodes.items() if parent in deps]
+class AsyncDAGExecutor(_DAGExecutor[H]):
+    """Concurrently traverses the given DAG in topological order while awaiting a coroutine for each node
+    on the running event loop.
+
+    Unlike `ConcurrentDAGExecutor` no thread is held while a node is being processed, so the number of
+    concurrent tasks can be much larger when processing a node mostly means waiting for a remote job.
+
+    Args:
+        dag: The target DAG.
+        fn: The coroutine function that will be awaited concurrently for each node.
+        tasks_num: The number of concurrent tasks.
+        raise_on_error: If set to True raises an exception on a first encountered error,
+            otherwises returns a tuple which contains a list of failed nodes and a list of
+            skipped nodes.
+        priorities: The priorities of nodes. Ready nodes with a higher priority are processed first.
+        node_resources: The number of slots of named resources that each node takes while being processed.
+        resource_limits: The number of available slots of each named resource. Ready nodes wait until
+            enough slots of all their resources are available.
+    """
+
+    def __init__(
+        self,
+        dag: DAG[H],
+        fn: t.Callable[[H], t.Awaitable[None]],
+        tasks_num: int,
+        raise_on_error: bool,
+        priorities: t.Optional[t.Dict[H, float]] = None,
+        node_resources: t.Optional[t.Dict[H, t.Dict[str, int]]] = None,
+        resource_limits: t.Optional[t.Dict[str, int]] = None,
+    ):
+        self.fn = fn
+        super().__init__(
+            dag,
+            tasks_num,
+            raise_on_error,
+            priorities=priorities,
+            node_resources=node_resources,
+            resource_limits=resource_limits,
+        )
+
+    async def run(self) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
+        """Runs the executor.
 
-        self._skipped_nodes.extend(skipped_nodes)
+        Raises:
+            NodeExecutionFailedError if `raise_on_error` was set to True and execution fails for any snapshot.
 
-        for skipped_node in skipped_nodes:
-            self._unprocessed_nodes_num -= 1
-            self._unprocessed_nodes.pop(skipped_node)
+        Returns:
+            A pair which contains a list of node errors and a list of skipped nodes.
+        """
+        self._init_state()
+        self._finished_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._tasks: t.Set[asyncio.Task] = set()
 
-        for skipped_node in skipped_nodes:
-            self._skip_next_nodes(skipped_node)
+        try:
+            self._submit_ready_nodes()
+            await self._finished_future
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+        return self._node_errors, self._skipped_nodes
 
-    def _init_state(self) -> None:
-        self._unprocessed_nodes = self.dag.graph
-        self._unprocessed_nodes_num = len(self._unprocessed_nodes)
-        self._unprocessed_nodes_lock = Lock()
-        self._finished_future = Future()  # type: ignore
+    async def _process_node(self, node: H) -> None:
+        try:
+            await self.fn(node)
+            self._complete_node(node)
+        except Exception as ex:
+            error = NodeExecutionFailedError(node)
+            error.__cause__ = ex
 
-        self._node_errors: t.List[NodeExecutionFailedError[H]] = []
-        self._skipped_nodes: t.List[H] = []
+            if self.raise_on_error:
+                if not self._finished_future.done():
+                    self._finished_future.set_exception(error)
+                return
+
+            self._fail_node(node, error)
+        self._submit_ready_nodes()
+
+    def _submit_ready_nodes(self) -> None:
+        if not self._unprocessed_nodes_num:
+            if not self._finished_future.done():
+                self._finished_future.set_result(None)
+            return
+
+        for node in self._pop_nodes_to_process():
+            task = asyncio.create_task(self._process_node(node))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
 
 
 def concurrent_apply_to_snapshots(
@@ -173,6 +379,9 @@ def concurrent_apply_to_dag(
     fn: t.Callable[[H], None],
     tasks_num: int,
     raise_on_error: bool = True,
+    priorities: t.Optional[t.Dict[H, float]] = None,
+    node_resources: t.Optional[t.Dict[H, t.Dict[str, int]]] = None,
+    resource_limits: t.Optional[t.Dict[str, int]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     """Applies a function to the given DAG concurrently while preserving the topological
     order between snapshots.
@@ -184,6 +393,11 @@ def concurrent_apply_to_dag(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priorities: The priorities of nodes. Ready nodes with a higher priority are processed first.
+            Ignored if the nodes are processed sequentially.
+        node_resources: The number of slots of named resources that each node takes while being processed.
+        resource_limits: The number of available slots of each named resource. Ready nodes wait until
+            enough slots of all their resources are available. Ignored if the nodes are processed sequentially.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
@@ -202,6 +416,9 @@ def concurrent_apply_to_dag(
         fn,
         tasks_num,
         raise_on_error,
+        priorities=priorities,
+        node_resources=node_resources,
+        resource_limits=resource_limits,
     ).run()
 
 
@@ -238,6 +455,50 @@ def sequential_apply_to_dag(
     return node_errors, skipped_nodes
 
 
+async def async_apply_to_dag(
+    dag: DAG[H],
+    fn: t.Callable[[H], t.Awaitable[None]],
+    tasks_num: int,
+    raise_on_error: bool = True,
+    priorities: t.Optional[t.Dict[H, float]] = None,
+    node_resources: t.Optional[t.Dict[H, t.Dict[str, int]]] = None,
+    resource_limits: t.Optional[t.Dict[str, int]] = None,
+) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
+    """Awaits a coroutine function for each node of the given DAG concurrently on the running event loop
+    while preserving the topological order between nodes.
+
+    Args:
+        dag: The target DAG.
+        fn: The coroutine function that will be awaited concurrently for each node.
+        tasks_num: The number of concurrent tasks.
+        raise_on_error: If set to True raises an exception on a first encountered error,
+            otherwises returns a tuple which contains a list of failed nodes and a list of
+            skipped nodes.
+        priorities: The priorities of nodes. Ready nodes with a higher priority are processed first.
+        node_resources: The number of slots of named resources that each node takes while being processed.
+        resource_limits: The number of available slots of each named resource. Ready nodes wait until
+            enough slots of all their resources are available.
+
+    Raises:
+        NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any node.
+
+    Returns:
+        A pair which contains a list of node errors and a list of skipped nodes.
+    """
+    if tasks_num <= 0:
+        raise ConfigError(f"Invalid number of concurrent tasks {tasks_num}")
+
+    return await AsyncDAGExecutor(
+        dag,
+        fn,
+        tasks_num,
+        raise_on_error,
+        priorities=priorities,
+        node_resources=node_resources,
+        resource_limits=resource_limits,
+    ).run()
+
+
 def concurrent_apply_to_values(
     values: t.Sequence[A],
     fn: t.Callable[[A], R],
@@ -17,9 +17,19 @@ T = t.TypeVar("T", bound=t.Hashable)
 
 class DAG(t.Generic[T]):
     def __init__(self, graph: t.Optional[t.Dict[T, t.Set[T]]] = None):
-        self._dag: t.Dict[T, t.Set[T]] = {}
+        # Nodes are interned to integer ids in the order they are added. The ids index the adjacency lists
+        # and the bits of the transitive closures below.
+        self._node_ids: t.Dict[T, int] = {}
+        self._nodes: t.List[T] = []
+        self._deps: t.List[t.Set[int]] = []
+        self._dependents: t.List[t.Set[int]] = []
+
         self._sorted: t.Optional[t.List[T]] = None
-        self._upstream: t.Dict[T, t.Set[T]] = {}
+        self._sorted_positions: t.Optional[t.List[int]] = None
+        # Lazily computed transitive closures of upstream dependencies, stored as bitsets of node ids. Once
+        # computed, a closure is kept up to date as new edges are added instead of being recomputed.
+        self._upstream_bits: t.Dict[int, int] = {}
+        self._upstream: t.Dict[int, t.Set[T]] = {}
 
         for node, dependencies in (graph or {}).items():
             self.add(node, dependencies)
@@ -31,25 +41,32 @@ class DAG(t.Generic[T]):
             node: The node to add.
             dependencies: Optional dependencies to add to the node.
         """
-        self._sorted = None
-        self._upstream.clear()
-        if node not in self._dag:
-            self._dag[node] = set()
-        if dependencies:
-            self._dag[node].update(dependencies)
-            for d in dependencies:
-                self.add(d)
+        node_id = self._intern(node)
+        if not dependencies:
+            return
+
+        node_deps = self._deps[node_id]
+        new_dep_ids = []
+        for dep in dependencies:
+            dep_id = self._intern(dep)
+            if dep_id not in node_deps:
+                node_deps.add(dep_id)
+                self._dependents[dep_id].add(node_id)
+                new_dep_ids.append(dep_id)
+
+        if new_dep_ids:
+            self._sorted = None
+            self._sorted_positions = None
+            self._extend_upstream_closures(node_id, new_dep_ids)
 
     @property
     def reversed(self) -> DAG[T]:
         """Returns a copy of this DAG with all its edges reversed."""
         result = DAG[T]()
-
-        for node, deps in self._dag.items():
-            result.add(node)
-            for dep in deps:
-                result.add(dep, [node])
-
+        result._node_ids = self._node_ids.copy()
+        result._nodes = self._nodes.copy()
+        result._deps = [dependents.copy() for dependents in self._dependents]
+        result._dependents = [deps.copy() for deps in self._deps]
         return result
 
     def subdag(self, *nodes: T) -> DAG[T]:
@@ -61,15 +78,25 @@ class DAG(t.Generic[T]):
         Returns:
             A new dag consisting of the specified nodes and upstream.
         """
-        queue = set(nodes)
-        dag: DAG[T] = DAG()
-
+        node_ids = set()
+        unknown_nodes = []
+        for node in nodes:
+            node_id = self._node_ids.get(node)
+            if node_id is None:
+                unknown_nodes.append(node)
+            else:
+                node_ids.add(node_id)
+
+        queue = list(node_ids)
         while queue:
-            node = queue.pop()
-            deps = self._dag.get(node, set())
-            dag.add(node, deps)
-            queue.update(deps)
-
+            for dep_id in self._deps[queue.pop()]:
+                if dep_id not in node_ids:
+                    node_ids.add(dep_id)
+                    queue.append(dep_id)
+
+        dag = self._induced_subdag(node_ids)
+        for node in unknown_nodes:
+            dag.add(node)
         return dag
 
     def prune(self, *nodes: T) -> DAG[T]:
@@ -81,88 +108,39 @@ class DAG(t.Generic[T]):
         Returns:
             A new dag consisting of the specified nodes.
         """
-        dag: DAG[T] = DAG()
-
-        for node, deps in self._dag.items():
-            if node in nodes:
-                dag.add(node, (dep for dep in deps if dep in nodes))
-
-        return dag
+        return self._induced_subdag(
+            {self._node_ids[node] for node in nodes if node in self._node_ids}
+        )
 
     def upstream(self, node: T) -> t.Set[T]:
         """Returns all upstream dependencies."""
-        if node not in self._upstream:
-            deps = self._dag.get(node, set())
-            self._upstream[node] = {
-                upstream for dep in deps for upstream in self.upstream(dep)
-            } | deps
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            return set()
 
-        return self._upstream[node]
+        upstream = self._upstream.get(node_id)
+        if upstream is None:
+            upstream = self._upstream[node_id] = self._nodes_from_bits(
+                self._upstream_closure(node_id)
+            )
+        return upstream
 
     @property
     def roots(self) -> t.Set[T]:
         """Returns all nodes in the graph without any upstream dependencies."""
-        return {node for node, deps in self._dag.items() if not deps}
+        return {self._nodes[node_id] for node_id, deps in enumerate(self._deps) if not deps}
 
     @property
     def graph(self) -> t.Dict[T, t.Set[T]]:
-        graph = {}
-        for node, deps in self._dag.items():
-            graph[node] = deps.copy()
-        return graph
+        nodes = self._nodes
+        return {node: {nodes[dep_id] for dep_id in deps} for node, deps in zip(nodes, self._deps)}
 
     @property
     def sorted(self) -> t.List[T]:
         """Returns a list of nodes sorted in topological order."""
         if self._sorted is None:
-            self._sorted = []
-            unprocessed_nodes = self.graph
-
-            last_processed_nodes: t.Set[T] = set()
-            cycle_candidates: t.Collection = unprocessed_nodes
-
-            while unprocessed_nodes:
-                next_nodes = {node for node, deps in unprocessed_nodes.items() if not deps}
-
-                if not next_nodes:
-                    # Sort cycle candidates to make the order deterministic
-                    cycle_candidates_msg = (
-                        "\nPossible candidates to check for circular references: "
-                        + ", ".join(str(node) for node in sorted(cycle_candidates))
-                    )
-
-                    if last_processed_nodes:
-                        last_processed_msg = "\nLast nodes added to the DAG: " + ", ".join(
-                            str(node) for node in last_processed_nodes
-                        )
-                    else:
-                        last_processed_msg = ""
-
-                    raise SQLMeshError(
-                        "Detected a cycle in the DAG. "
-                        "Please make sure there are no circular references between nodes."
-                        f"{last_processed_msg}{cycle_candidates_msg}"
-                    )
-
-                for node in next_nodes:
-                    unprocessed_nodes.pop(node)
-
-                nodes_with_unaffected_deps: t.Set[T] = set()
-                for node, deps in unprocessed_nodes.items():
-                    deps_before_subtraction = deps
-
-                    deps -= next_nodes
-                    if deps_before_subtraction == deps:
-                        nodes_with_unaffected_deps.add(node)
-
-                cycle_candidates = nodes_with_unaffected_deps or unprocessed_nodes
-
-                # Sort to make the order deterministic
-                # TODO: Make protocol that makes the type var both hashable and sortable once we are on Python 3.8+
-                last_processed_nodes = sorted(next_nodes)  # type: ignore
-                self._sorted.extend(last_processed_nodes)
-
-        return self._sorted
+            self._sort()
+        return t.cast(t.List[T], self._sorted)
 
     def downstream(self, node: T) -> t.List[T]:
         """Get all nodes that have the input node as an upstream dependency.
@@ -173,22 +151,25 @@ class DAG(t.Generic[T]):
         Returns:
             A list of descendant nodes sorted in topological order.
         """
-        sorted_nodes = self.sorted
-        try:
-            node_index = sorted_nodes.index(node)
-        except ValueError:
+        if self._sorted_positions is None:
+            self._sort()
+        positions = t.cast(t.List[int], self._sorted_positions)
+
+        node_id = self._node_ids.get(node)
+        if node_id is None:
             return []
 
-        def visit() -> t.Iterator[T]:
-            """Visit topologically sorted nodes after input node and yield downstream dependants."""
-            downstream = {node}
-            for current_node in sorted_nodes[node_index + 1 :]:
-                upstream = self._dag.get(current_node, set())
-                if not upstream.isdisjoint(downstream):
-                    downstream.add(current_node)
-                    yield current_node
+        downstream_ids = set()
+        queue = [node_id]
+        while queue:
+            for dependent_id in self._dependents[queue.pop()]:
+                if dependent_id not in downstream_ids:
+                    downstream_ids.add(dependent_id)
+                    queue.append(dependent_id)
 
-        return list(visit())
+        return [
+            self._nodes[node_id] for node_id in sorted(downstream_ids, key=positions.__getitem__)
+        ]
 
     def lineage(self, node: T) -> DAG[T]:
         """Get a dag of the node and its upstream dependencies and downstream dependents.
@@ -202,8 +183,152 @@ class DAG(t.Generic[T]):
         return self.subdag(node, *self.downstream(node))
 
     def __contains__(self, item: T) -> bool:
-        return item in self.graph
+        return item in self._node_ids
 
     def __iter__(self) -> t.Iterator[T]:
         for node in self.sorted:
             yield node
+
+    def _sort(self) -> None:
+        nodes = self._nodes
+        pending_deps_num = [len(deps) for deps in self._deps]
+        positions = [0] * len(nodes)
+
+        result: t.List[T] = []
+        last_processed_nodes: t.List[T] = []
+        next_ids = [node_id for node_id, deps_num in enumerate(pending_deps_num) if not deps_num]
+
+        while len(result) < len(nodes):
+            if not next_ids:
+                # Sort cycle candidates to make the order deterministic
+                cycle_candidates_msg = (
+                    "\nPossible candidates to check for circular references: "
+                    + ", ".join(
+                        str(node)
+                        for node in sorted(  # type: ignore
+                            nodes[node_id]
+                            for node_id, deps_num in enumerate(pending_deps_num)
+                            if deps_num
+                        )
+                    )
+                )
+
+                if last_processed_nodes:
+                    last_processed_msg = "\nLast nodes added to the DAG: " + ", ".join(
+                        str(node) for node in last_processed_nodes
+                    )
+                else:
+                    last_processed_msg = ""
+
+                raise SQLMeshError(
+                    "Detected a cycle in the DAG. "
+                    "Please make sure there are no circular references between nodes."
+                    f"{last_processed_msg}{cycle_candidates_msg}"
+                )
+
+            # Sort to make the order deterministic
+            # TODO: Make protocol that makes the type var both hashable and sortable once we are on Python 3.8+
+            next_ids.sort(key=nodes.__getitem__)  # type: ignore
+            last_processed_nodes = [nodes[node_id] for node_id in next_ids]
+            for node_id in next_ids:
+                positions[node_id] = len(result)
+                result.append(nodes[node_id])
+
+            processed_ids = next_ids
+            next_ids = []
+            for node_id in processed_ids:
+                for dependent_id in self._dependents[node_id]:
+                    pending_deps_num[dependent_id] -= 1
+                    if not pending_deps_num[dependent_id]:
+                        next_ids.append(dependent_id)
+
+        self._sorted = result
+        self._sorted_positions = positions
+
+    def _intern(self, node: T) -> int:
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._node_ids[node] = node_id
+            self._nodes.append(node)
+            self._deps.append(set())
+            self._dependents.append(set())
+            self._sorted = None
+            self._sorted_positions = None
+        return node_id
+
+    def _induced_subdag(self, node_ids: t.Set[int]) -> DAG[T]:
+        """Returns a new dag consisting of the given nodes and the edges between them."""
+        dag = DAG[T]()
+        # Ids are assigned in insertion order, so the new dag preserves the order of nodes in this one.
+        sorted_ids = sorted(node_ids)
+        new_ids = {node_id: new_id for new_id, node_id in enumerate(sorted_ids)}
+        for node_id in sorted_ids:
+            node = self._nodes[node_id]
+            dag._node_ids[node] = new_ids[node_id]
+            dag._nodes.append(node)
+            dag._deps.append({new_ids[d] for d in self._deps[node_id] if d in new_ids})
+            dag._dependents.append({new_ids[d] for d in self._dependents[node_id] if d in new_ids})
+        return dag
+
+    def _upstream_closure(self, node_id: int) -> int:
+        """Returns the bitset of all upstream dependencies of the given node.
+
+        The closure is computed with an iterative depth-first traversal, so that deep chains of dependencies
+        don't exhaust the stack.
+        """
+        closure = self._upstream_bits.get(node_id)
+        if closure is not None:
+            return closure
+
+        upstream_bits = self._upstream_bits
+        entered: t.Set[int] = set()
+        stack = [node_id]
+        while stack:
+            current_id = stack[-1]
+            if current_id in upstream_bits:
+                stack.pop()
+            elif current_id not in entered:
+                entered.add(current_id)
+                # Dependencies that were entered but not computed yet are part of a cycle.
+                stack.extend(
+                    dep_id
+                    for dep_id in self._deps[current_id]
+                    if dep_id not in upstream_bits and dep_id not in entered
+                )
+            else:
+                stack.pop()
+                closure = 0
+                for dep_id in self._deps[current_id]:
+                    closure |= (1 << dep_id) | upstream_bits.get(dep_id, 0)
+                upstream_bits[current_id] = closure
+
+        return upstream_bits[node_id]
+
+    def _extend_upstream_closures(self, node_id: int, new_dep_ids: t.List[int]) -> None:
+        """Adds new dependencies of a node to the computed closures of the node and its downstream nodes."""
+        if not self._upstream_bits:
+            return
+
+        node_bit = 1 << node_id
+        affected_ids = [
+            closure_id
+            for closure_id, closure in self._upstream_bits.items()
+            if closure_id == node_id or closure & node_bit
+        ]
+        if not affected_ids:
+            return
+
+        added_bits = 0
+        for dep_id in new_dep_ids:
+            added_bits |= (1 << dep_id) | self._upstream_closure(dep_id)
+
+        for closure_id in affected_ids:
+            closure = self._upstream_bits[closure_id]
+            if closure | added_bits != closure:
+                self._upstream_bits[closure_id] = closure | added_bits
+                self._upstream.pop(closure_id, None)
+
+    def _nodes_from_bits(self, bits: int) -> t.Set[T]:
+        nodes = self._nodes
+        return {nodes[node_id] for node_id, bit in enumerate(reversed(bin(bits))) if bit == "1"}
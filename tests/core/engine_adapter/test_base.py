@@ -1,4 +1,5 @@
 # type: ignore
+import asyncio
 import typing as t
 from datetime import datetime
 from unittest.mock import call
@@ -2642,3 +2643,12 @@ def test_insert_overwrite_by_partition_query_insert_overwrite_strategy(
     assert sql_calls == [
         'INSERT OVERWRITE TABLE "test_schema"."test_table" ("a", "ds", "b") SELECT "a", "ds", "b" FROM "tbl"'
     ]
+
+
+def test_execute_async(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+
+    asyncio.run(adapter.execute_async([parse_one("SELECT 1"), "SELECT 2"]))
+
+    # Statements are executed in a worker thread, one after another
+    assert to_sql_calls(adapter) == ["SELECT 1", "SELECT 2"]
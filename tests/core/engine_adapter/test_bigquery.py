@@ -1,4 +1,5 @@
 # type: ignore
+import asyncio
 import sys
 import typing as t
 
@@ -552,6 +553,32 @@ def test_begin_end_session(mocker: MockerFixture):
     assert not execute_b_call[1]["job_config"].connection_properties
 
 
+def test_execute_async(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    job_mock = mocker.Mock()
+    job_mock.done.side_effect = [False, False, True]
+    connection_mock._client.query.return_value = job_mock
+
+    adapter = BigQueryEngineAdapter(lambda: connection_mock, job_retries=0)
+    adapter.ASYNC_JOB_POLL_INTERVAL_SECONDS = 0
+
+    asyncio.run(adapter.execute_async(["SELECT 1;", "SELECT 2;"]))
+
+    assert [call[1]["query"] for call in connection_mock._client.query.call_args_list] == [
+        "SELECT 1;",
+        "SELECT 2;",
+    ]
+    # The job is polled until it's done and its result is only fetched afterwards.
+    assert job_mock.done.call_count == 3
+    assert job_mock.result.call_count == 1
+
+    job_mock.done.side_effect = None
+    job_mock.done.return_value = True
+    job_mock.result.side_effect = Exception("Job failed")
+    with pytest.raises(Exception, match="Job failed"):
+        asyncio.run(adapter.execute_async("SELECT 3;"))
+
+
 def _to_sql_calls(execute_mock: t.Any, identify: bool = True) -> t.List[str]:
     output = []
     for call in execute_mock.call_args_list:
@@ -1,6 +1,7 @@
 # type: ignore
 import typing as t
 
+import pandas as pd
 from pytest_mock.plugin import MockerFixture
 from sqlglot import exp, parse_one
 
@@ -75,3 +76,54 @@ def test_pre_ping(mocker: MockerFixture, make_mocked_engine_adapter: t.Callable)
     ]
 
     adapter._connection_pool.get().ping.assert_called_once_with(reconnect=False)
+
+
+def test_insert_append_pandas(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
+):
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.mysql.MySQLEngineAdapter.table_exists",
+        return_value=False,
+    )
+    adapter = make_mocked_engine_adapter(MySQLEngineAdapter)
+    adapter.BULK_LOAD_MIN_ROWS = 1
+    adapter.DEFAULT_BATCH_SIZE = 2
+
+    temp_table_id = "abcdefgh"
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=make_temp_table_name("test_table", temp_table_id),
+    )
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.5, None, 6.5]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("INT"), "b": exp.DataType.build("DOUBLE")},
+    )
+
+    insert_sql = f"INSERT INTO `__temp_test_table_{temp_table_id}` (`a`, `b`) VALUES (%s, %s)"
+    assert adapter.cursor.executemany.call_args_list == [
+        mocker.call(insert_sql, [(1, 4.5), (2, None)]),
+        mocker.call(insert_sql, [(3, 6.5)]),
+    ]
+    assert to_sql_calls(adapter) == [
+        f"CREATE TABLE IF NOT EXISTS `__temp_test_table_{temp_table_id}` (`a` INT, `b` DOUBLE)",
+        f"INSERT INTO `test_table` (`a`, `b`) SELECT CAST(`a` AS SIGNED) AS `a`, CAST(`b` AS DOUBLE) AS `b` FROM `__temp_test_table_{temp_table_id}`",
+        f"DROP TABLE IF EXISTS `__temp_test_table_{temp_table_id}`",
+    ]
+
+
+def test_insert_append_pandas_in_transaction(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(MySQLEngineAdapter)
+    adapter.BULK_LOAD_MIN_ROWS = 1
+
+    df = pd.DataFrame({"a": [1, 2]})
+    with adapter.transaction():
+        adapter.insert_append("test_table", df, columns_to_types={"a": exp.DataType.build("INT")})
+
+    # Creating the temporary table would commit the transaction, so the rows are rendered as literals
+    adapter.cursor.executemany.assert_not_called()
+    assert to_sql_calls(adapter) == [
+        "INSERT INTO `test_table` (`a`) SELECT CAST(`a` AS SIGNED) AS `a` FROM (SELECT 1 AS `a` UNION ALL SELECT 2) AS `t`"
+    ]
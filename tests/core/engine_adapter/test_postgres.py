@@ -1,5 +1,6 @@
 import typing as t
 
+import pandas as pd
 import pytest
 from pytest_mock import MockFixture
 from pytest_mock.plugin import MockerFixture
@@ -80,3 +81,176 @@ def test_comments(make_mocked_engine_adapter: t.Callable, mocker: MockerFixture)
         """COMMENT ON TABLE "test_table" IS '\\'""",
         """COMMENT ON COLUMN "test_table"."a" IS '\\'""",
     ]
+
+
+def test_insert_append_pandas_copy(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
+):
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.postgres.PostgresEngineAdapter.table_exists",
+        return_value=False,
+    )
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.BULK_LOAD_MIN_ROWS = 1
+
+    temp_table_id = "abcdefgh"
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=make_temp_table_name("test_table", temp_table_id),
+    )
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append((sql, buffer.read()))
+
+    df = pd.DataFrame({"a": [1, None, 3], "b": ["x", None, ""]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("INT"), "b": exp.DataType.build("TEXT")},
+    )
+
+    assert copied == [
+        (
+            f"""COPY "__temp_test_table_{temp_table_id}" ("a", "b") FROM STDIN WITH (FORMAT csv, NULL '\\N')""",
+            # Empty strings are unquoted but still distinguishable from NULLs
+            "1,x\n\\N,\\N\n3,\n",
+        )
+    ]
+    assert to_sql_calls(adapter) == [
+        f'CREATE TABLE IF NOT EXISTS "__temp_test_table_{temp_table_id}" ("a" INT, "b" TEXT)',
+        f'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS INT) AS "a", CAST("b" AS TEXT) AS "b" FROM "__temp_test_table_{temp_table_id}"',
+        f'DROP TABLE IF EXISTS "__temp_test_table_{temp_table_id}"',
+    ]
+
+
+def test_insert_append_pandas_executemany(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
+):
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.postgres.PostgresEngineAdapter.table_exists",
+        return_value=False,
+    )
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.BULK_LOAD_MIN_ROWS = 1
+    # Drivers like pg8000 don't support COPY FROM STDIN
+    del adapter.cursor.copy_expert
+
+    temp_table_id = "abcdefgh"
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=make_temp_table_name("test_table", temp_table_id),
+    )
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("INT"), "b": exp.DataType.build("TEXT")},
+    )
+
+    adapter.cursor.executemany.assert_called_once_with(
+        f'INSERT INTO "__temp_test_table_{temp_table_id}" ("a", "b") VALUES (%s, %s)',
+        [(1, "x"), (2, None), (3, "z")],
+    )
+    assert [type(value) for value in adapter.cursor.executemany.call_args[0][1][0]] == [int, str]
+
+
+def test_insert_append_pandas_nested_values(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+
+    df = pd.DataFrame({"a": [1, 2], "b": [[1, 2], []], "c": [{"x": 1}, None]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={
+            "a": exp.DataType.build("INT"),
+            "b": exp.DataType.build("INT[]", dialect="postgres"),
+            "c": exp.DataType.build("JSONB", dialect="postgres"),
+        },
+    )
+
+    # Lists and dicts can't be written as CSV or bound as parameters, so they are rendered as literals
+    adapter.cursor.copy_expert.assert_not_called()
+    adapter.cursor.executemany.assert_not_called()
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "test_table" ("a", "b", "c") SELECT CAST("a" AS INT) AS "a", CAST("b" AS INT[]) AS "b", CAST("c" AS JSONB) AS "c" FROM (VALUES (1, ARRAY[1, 2], MAP(ARRAY[\'x\'], ARRAY[1])), (2, ARRAY[], NULL)) AS "t"("a", "b", "c")'
+    ]
+
+
+def test_insert_append_pandas_small(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+
+    df = pd.DataFrame({"a": [1, 2]})
+    adapter.insert_append("test_table", df, columns_to_types={"a": exp.DataType.build("INT")})
+
+    # A temporary table isn't worth its round trips for a few rows
+    adapter.cursor.copy_expert.assert_not_called()
+    adapter.cursor.executemany.assert_not_called()
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "test_table" ("a") SELECT CAST("a" AS INT) AS "a" FROM (VALUES (1), (2)) AS "t"("a")'
+    ]
+
+
+def test_insert_append_pandas_binary(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
+):
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.postgres.PostgresEngineAdapter.table_exists",
+        return_value=False,
+    )
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.BULK_LOAD_MIN_ROWS = 1
+
+    temp_table_id = "abcdefgh"
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=make_temp_table_name("test_table", temp_table_id),
+    )
+
+    df = pd.DataFrame({"a": [1, 2], "b": [b"\x00", None]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={
+            "a": exp.DataType.build("INT"),
+            "b": exp.DataType.build("BYTEA", dialect="postgres"),
+        },
+    )
+
+    # Bytes would be written to the CSV as their text representation
+    adapter.cursor.copy_expert.assert_not_called()
+    adapter.cursor.executemany.assert_called_once_with(
+        f'INSERT INTO "__temp_test_table_{temp_table_id}" ("a", "b") VALUES (%s, %s)',
+        [(1, b"\x00"), (2, None)],
+    )
+
+
+def test_insert_append_pandas_null_marker(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
+):
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.postgres.PostgresEngineAdapter.table_exists",
+        return_value=False,
+    )
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.BULK_LOAD_MIN_ROWS = 1
+
+    temp_table_id = "abcdefgh"
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=make_temp_table_name("test_table", temp_table_id),
+    )
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["\\N", None]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("INT"), "b": exp.DataType.build("TEXT")},
+    )
+
+    # The string "\N" would be loaded as NULL by COPY
+    adapter.cursor.copy_expert.assert_not_called()
+    adapter.cursor.executemany.assert_called_once_with(
+        f'INSERT INTO "__temp_test_table_{temp_table_id}" ("a", "b") VALUES (%s, %s)',
+        [(1, "\\N"), (2, None)],
+    )
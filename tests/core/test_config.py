@@ -12,6 +12,7 @@ from sqlmesh.core.config import (
     DuckDBConnectionConfig,
     GatewayConfig,
     ModelDefaultsConfig,
+    ResourcePoolConfig,
 )
 from sqlmesh.core.config.connection import DuckDBAttachOptions
 from sqlmesh.core.config.feature_flag import DbtFeatureFlag, FeatureFlag
@@ -584,3 +585,56 @@ model_defaults:
     assert config.model_defaults.audits[1][1]["column"].this.this == "id"
     assert type(config.model_defaults.audits[1][1]["threshold"]) == exp.Literal
     assert config.model_defaults.audits[1][1]["threshold"].this == "1000"
+
+
+def test_load_resource_pools(tmp_path):
+    config_path = tmp_path / "config_resource_pools.yaml"
+    with open(config_path, "w", encoding="utf-8") as fd:
+        fd.write(
+            """
+resource_pools:
+    warehouse:
+        max_slots: 4
+        weight: 2
+        models:
+            - sushi.*
+        tags:
+            - Heavy
+    remote:
+        max_slots: 1
+        gateways:
+            - remote_gateway
+model_defaults:
+    dialect: ''
+        """
+        )
+
+    config = load_config_from_paths(
+        Config,
+        project_paths=[config_path],
+    )
+
+    def _node(name, tags):
+        node = mock.Mock(tags=tags)
+        node.name = name
+        return node
+
+    warehouse = config.resource_pools["warehouse"]
+    assert warehouse == ResourcePoolConfig(
+        max_slots=4, weight=2, models=["sushi.*"], tags=["Heavy"]
+    )
+    assert config.resource_pools["remote"].gateways == ["remote_gateway"]
+
+    assert warehouse.is_assigned(_node("sushi.orders", []))
+    assert warehouse.is_assigned(_node("raw.events", ["heavy"]))
+    assert not warehouse.is_assigned(_node("raw.events", ["light"]))
+    assert config.resource_pools["remote"].is_assigned(
+        _node("raw.events", []), gateway="remote_gateway"
+    )
+    assert not config.resource_pools["remote"].is_assigned(_node("raw.events", []), gateway="local")
+
+    with pytest.raises(ConfigError, match=r"positive integer"):
+        ResourcePoolConfig(max_slots=0)
+
+    with pytest.raises(ConfigError, match=r"can't exceed its number of slots"):
+        ResourcePoolConfig(max_slots=1, weight=2)
@@ -1,5 +1,7 @@
 import logging
+import os
 import pathlib
+import sys
 import typing as t
 from datetime import date, timedelta
 from tempfile import TemporaryDirectory
@@ -14,8 +16,10 @@ from sqlglot import parse_one
 from sqlglot.errors import SchemaError
 
 import sqlmesh.core.constants
+import sqlmesh.core.loader
 import sqlmesh.core.dialect as d
 from sqlmesh.core.config import (
+    CacheConfig,
     Config,
     DuckDBConnectionConfig,
     EnvironmentSuffixTarget,
@@ -26,7 +30,7 @@ from sqlmesh.core.config import (
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import parse, schema_
 from sqlmesh.core.environment import Environment
-from sqlmesh.core.model import load_sql_based_model, model
+from sqlmesh.core.model import SqlModel, load_sql_based_model, model
 from sqlmesh.core.model.kind import ModelKindName
 from sqlmesh.core.plan import BuiltInPlanEvaluator, PlanBuilder
 from sqlmesh.utils.date import (
@@ -230,8 +234,8 @@ def test_diff(sushi_context: Context, mocker: MockerFixture):
 
 
 @pytest.mark.slow
-def test_evaluate_limit():
-    context = Context(config=Config())
+def test_evaluate_limit(tmp_path: Path):
+    context = Context(paths=tmp_path, config=Config())
 
     context.upsert_model(
         load_sql_based_model(
@@ -262,8 +266,8 @@ def test_evaluate_limit():
     assert context.evaluate("without_limit", "2020-01-01", "2020-01-02", "2020-01-02", 2).size == 2
 
 
-def test_plan_execution_time():
-    context = Context(config=Config())
+def test_plan_execution_time(tmp_path: Path):
+    context = Context(paths=tmp_path, config=Config())
     context.upsert_model(
         load_sql_based_model(
             parse(
@@ -318,13 +322,13 @@ def test_python_model_empty_df_raises(sushi_context, capsys):
     ) in capsys.readouterr().out
 
 
-def test_env_and_default_schema_normalization(mocker: MockerFixture):
+def test_env_and_default_schema_normalization(tmp_path: Path, mocker: MockerFixture):
     from sqlglot.dialects import DuckDB
     from sqlglot.dialects.dialect import NormalizationStrategy
 
     mocker.patch.object(DuckDB, "NORMALIZATION_STRATEGY", NormalizationStrategy.UPPERCASE)
 
-    context = Context(config=Config())
+    context = Context(paths=tmp_path, config=Config())
     context.upsert_model(
         load_sql_based_model(
             parse(
@@ -568,6 +572,26 @@ def test_janitor(sushi_context, mocker: MockerFixture) -> None:
     )
 
 
+@pytest.mark.slow
+def test_plan_fetches_state_once(sushi_context: Context, mocker: MockerFixture) -> None:
+    model = sushi_context.get_model("sushi.waiter_revenue_by_day")
+    sushi_context.upsert_model(model, stamp="changed")
+
+    get_environment_spy = mocker.spy(sushi_context.state_sync, "get_environment")
+    get_snapshots_spy = mocker.spy(sushi_context.state_sync, "get_snapshots")
+    get_stored_snapshots_spy = mocker.spy(sushi_context.state_sync, "get_stored_snapshots")
+    plan = sushi_context.plan("dev", no_prompts=True)
+    assert plan.context_diff.modified_snapshots
+
+    # Prod is fetched as the base of the new environment and to resolve remote snapshots.
+    assert [call.args[0] for call in get_environment_spy.call_args_list] == ["dev", "prod"]
+    # Only the previous versions of modified snapshots are fetched in full.
+    get_stored_snapshots_spy.assert_called_once()
+    get_snapshots_spy.assert_called_once_with(
+        {old.snapshot_id for _, old in plan.context_diff.modified_snapshots.values()}
+    )
+
+
 @pytest.mark.slow
 def test_plan_default_end(sushi_context_pre_scheduling: Context):
     prod_plan_builder = sushi_context_pre_scheduling.plan_builder("prod")
@@ -780,6 +804,190 @@ def test_disabled_model(copy_to_temp_path):
     assert not context.get_model("sushi.disabled_py")
 
 
+def test_load_sql_models_concurrently(copy_to_temp_path, mocker: MockerFixture):
+    path = copy_to_temp_path("examples/sushi")
+    config = load_configs("config", Config, paths=path)[path[0]]
+
+    sequential_context = Context(paths=path, config=config)
+    sequential_context.clear_caches()
+
+    config.loader_kwargs = {"max_workers": 2}
+    pool_spy = mocker.spy(sqlmesh.core.loader, "ProcessPoolExecutor")
+    context = Context(paths=path, config=config)
+    pool_spy.assert_called_once()
+
+    # Models loaded in worker processes should be identical to the ones loaded sequentially
+    assert context.models.keys() == sequential_context.models.keys()
+    for name, loaded_model in context.models.items():
+        assert loaded_model.data_hash == sequential_context.models[name].data_hash
+        assert loaded_model.full_depends_on == sequential_context.models[name].full_depends_on
+
+    # Models that are already cached are not loaded again
+    Context(paths=path, config=config)
+    pool_spy.assert_called_once()
+
+
+def test_load_sql_models_sequentially_with_other_threads(copy_to_temp_path, mocker: MockerFixture):
+    path = copy_to_temp_path("examples/sushi")
+    config = load_configs("config", Config, paths=path)[path[0]]
+    config.loader_kwargs = {"max_workers": 2}
+
+    pool_spy = mocker.spy(sqlmesh.core.loader, "ProcessPoolExecutor")
+    mocker.patch("sqlmesh.core.loader.threading.active_count", return_value=2)
+    context = Context(paths=path, config=config)
+
+    # Forking while other threads are running is unsafe
+    pool_spy.assert_not_called()
+    assert context.get_model("sushi.customers")
+
+
+def test_load_keeps_unrelated_modules(
+    copy_to_temp_path, tmp_path: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+):
+    path = copy_to_temp_path("examples/sushi")
+    unrelated_module = mocker.Mock(__file__=str(tmp_path / "site-packages" / "models" / "foo.py"))
+    project_module = mocker.Mock(__file__=str(path[0] / "macros" / "utils.py"))
+    monkeypatch.setitem(sys.modules, "models.foo", unrelated_module)
+    monkeypatch.setitem(sys.modules, "macros.utils", project_module)
+
+    Context(paths=path)
+
+    assert sys.modules["models.foo"] is unrelated_module
+    assert sys.modules.get("macros.utils") is not project_module
+
+
+def test_load_updates_schemas_incrementally(copy_to_temp_path):
+    path = copy_to_temp_path("examples/sushi")[0]
+    context = Context(paths=path)
+
+    def modify_file(file_path: Path, old: str, new: str) -> None:
+        mtime = file_path.stat().st_mtime
+        file_path.write_text(file_path.read_text().replace(old, new))
+        os.utime(file_path, (mtime + 1, mtime + 1))
+
+    previous_models = dict(context.models)
+    modify_file(
+        path / "models" / "waiter_revenue_by_day.sql",
+        "Revenue from orders",
+        "Revenue from all orders",
+    )
+    context.load()
+
+    # The change doesn't affect the columns of the modified model, so downstream models are reused
+    assert (
+        context.get_model("sushi.waiter_revenue_by_day")
+        is not previous_models['"memory"."sushi"."waiter_revenue_by_day"']
+    )
+    assert (
+        context.get_model("sushi.top_waiters") is previous_models['"memory"."sushi"."top_waiters"']
+    )
+
+    previous_models = dict(context.models)
+    modify_file(
+        path / "models" / "waiter_revenue_by_day.sql",
+        "o.event_date::DATE AS event_date",
+        "o.event_date::DATE AS event_date, 1::INT AS one",
+    )
+    context.load()
+
+    top_waiters = context.get_model("sushi.top_waiters")
+    assert top_waiters is not previous_models['"memory"."sushi"."top_waiters"']
+    assert "one" in top_waiters.mapping_schema['"memory"']['"sushi"']['"waiter_revenue_by_day"']
+    assert context.get_model("sushi.customers") is previous_models['"memory"."sushi"."customers"']
+
+    incremental_models = dict(context.models)
+    context.clear_caches()
+    assert {name: m.data_hash for name, m in incremental_models.items()} == {
+        name: m.data_hash for name, m in Context(paths=path).models.items()
+    }
+
+
+def test_refresh_reloads_changed_models(copy_to_temp_path, mocker):
+    path = copy_to_temp_path("examples/sushi")[0]
+    context = Context(paths=path)
+    load_mock = mocker.spy(context, "load")
+
+    model_path = path / "models" / "waiter_revenue_by_day.sql"
+    mtime = model_path.stat().st_mtime
+    model_path.write_text(
+        model_path.read_text().replace(
+            "o.event_date::DATE AS event_date",
+            "o.event_date::DATE AS event_date, 1::INT AS one",
+        )
+    )
+    os.utime(model_path, (mtime + 1, mtime + 1))
+
+    previous_models = dict(context.models)
+    context.refresh([model_path, path / "README.md"])
+    load_mock.assert_not_called()
+    assert not context._loader.reload_needed()
+
+    assert "one" in context.get_model("sushi.waiter_revenue_by_day").columns_to_types
+    top_waiters = context.get_model("sushi.top_waiters")
+    assert top_waiters is not previous_models['"memory"."sushi"."top_waiters"']
+    assert "one" in top_waiters.mapping_schema['"memory"']['"sushi"']['"waiter_revenue_by_day"']
+    assert context.get_model("sushi.customers") is previous_models['"memory"."sushi"."customers"']
+    assert '"memory"."sushi"."waiter_revenue_by_day"' in context.dag.upstream(
+        '"memory"."sushi"."top_waiters"'
+    )
+
+    refreshed_models = dict(context.models)
+    context.clear_caches()
+    loaded_models = Context(paths=path).models
+    for name in ('"memory"."sushi"."waiter_revenue_by_day"', '"memory"."sushi"."top_waiters"'):
+        assert refreshed_models[name].data_hash == loaded_models[name].data_hash
+
+    model_path.unlink()
+    context.refresh([model_path])
+    load_mock.assert_not_called()
+    assert "sushi.waiter_revenue_by_day" not in {m.name for m in context.models.values()}
+
+    context.refresh([path / "macros" / "utils.py"])
+    load_mock.assert_called_once()
+
+
+def test_load_with_pack_cache_store(copy_to_temp_path):
+    path = copy_to_temp_path("examples/sushi")
+    config = load_configs("config", Config, paths=path)[path[0]]
+    config.cache = CacheConfig(store="pack")
+
+    context = Context(paths=path, config=config)
+    cache_path = path[0] / sqlmesh.core.constants.CACHE
+    for prefix in ("model_definition", "optimized_query"):
+        assert {p.suffix for p in (cache_path / prefix).iterdir()} == {".pack", ".idx"}
+
+    assert Context(paths=path, config=config).models.keys() == context.models.keys()
+
+
+def test_snapshots_reuse_cached_node_hashes(tmp_path: pathlib.Path, mocker: MockerFixture):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "a.sql").write_text("MODEL (name test.a); SELECT 1 AS a")
+    (models_dir / "b.sql").write_text("MODEL (name test.b); SELECT a FROM test.a")
+    config = Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))
+
+    fingerprints = {
+        name: snapshot.fingerprint
+        for name, snapshot in Context(paths=tmp_path, config=config).snapshots.items()
+    }
+
+    context = Context(paths=tmp_path, config=config)
+    data_hash_values = mocker.patch.object(
+        SqlModel, "_data_hash_values", new_callable=mocker.PropertyMock
+    )
+    snapshots = context.snapshots
+    assert {name: snapshot.fingerprint for name, snapshot in snapshots.items()} == fingerprints
+    data_hash_values.assert_not_called()
+
+    # A changed node is hashed again
+    data_hash_values.return_value = ["changed"]
+    context.upsert_model("test.a", stamp="changed")
+    assert (
+        context.snapshots['"memory"."test"."a"'].fingerprint != fingerprints['"memory"."test"."a"']
+    )
+    data_hash_values.assert_called_once()
+
+
 def test_get_model_mixed_dialects(copy_to_temp_path):
     path = copy_to_temp_path("examples/sushi")
 
@@ -1035,7 +1035,7 @@ def test_seed_model_custom_types(tmp_path):
 
 def test_seed_with_special_characters_in_column(tmp_path, assert_exp_eq):
     config = Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))
-    context = Context(config=config)
+    context = Context(paths=tmp_path, config=config)
 
     model_csv_path = (tmp_path / "model.csv").absolute()
     with open(model_csv_path, "w", encoding="utf-8") as fd:
@@ -1911,9 +1911,9 @@ def test_python_model_with_session_properties():
     }
 
 
-def test_python_models_returning_sql(assert_exp_eq) -> None:
+def test_python_models_returning_sql(assert_exp_eq, tmp_path: Path) -> None:
     config = Config(model_defaults=ModelDefaultsConfig(dialect="snowflake"))
-    context = Context(config=config)
+    context = Context(paths=tmp_path, config=config)
 
     @model(
         name="model1",
@@ -2104,8 +2104,8 @@ def test_python_model_decorator_col_descriptions() -> None:
         )
 
 
-def test_star_expansion(assert_exp_eq) -> None:
-    context = Context(config=Config())
+def test_star_expansion(assert_exp_eq, tmp_path: Path) -> None:
+    context = Context(paths=tmp_path, config=Config())
 
     model1 = load_sql_based_model(
         d.parse(
@@ -2241,9 +2241,9 @@ def test_star_expansion(assert_exp_eq) -> None:
     )
 
 
-def test_case_sensitivity(assert_exp_eq):
+def test_case_sensitivity(assert_exp_eq, tmp_path: Path):
     config = Config(model_defaults=ModelDefaultsConfig(dialect="snowflake"))
-    context = Context(config=config)
+    context = Context(paths=tmp_path, config=config)
 
     source = load_sql_based_model(
         d.parse(
@@ -2703,6 +2703,75 @@ def test_check_schema_mapping_when_rendering_at_runtime(assert_exp_eq):
     )
 
 
+def test_render_query_branches_on_interval_dates():
+    expressions = d.parse(
+        """
+        MODEL (name db.table, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+        SELECT a, ds, @IF(@start_ds LIKE '%-01', 'month_start', 'regular') AS day_type
+        FROM db.source
+        WHERE ds BETWEEN @start_ds AND @end_ds
+        """
+    )
+    model = load_sql_based_model(expressions)
+
+    def day_type(start: str) -> str:
+        query = model.render_query_or_raise(start=start, end=start, execution_time=start)
+        return query.selects[-1].this.name
+
+    assert day_type("2024-06-05") == "regular"
+    assert day_type("2024-07-01") == "month_start"
+    assert day_type("2024-07-02") == "regular"
+
+
+def test_render_query_interval_cache():
+    expressions = d.parse(
+        """
+        MODEL (name db.table, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+        SELECT a, ds, @IF(@start_ds LIKE '%-01', 'month_start', 'regular') AS day_type
+        FROM db.source
+        WHERE ds BETWEEN @start_ds AND @end_ds
+        """
+    )
+    model = load_sql_based_model(expressions)
+    renderer = model._query_renderer
+
+    with patch.object(renderer, "_optimize_query", wraps=renderer._optimize_query) as render_mock:
+        first = model.render_query_or_raise(start="2024-07-01", end="2024-07-01")
+        second = model.render_query_or_raise(start="2024-07-01", end="2024-07-01")
+        assert render_mock.call_count == 1
+        assert first == second
+        assert first is not second
+        assert first.selects[-1].this.name == "month_start"
+
+        other = model.render_query_or_raise(start="2024-07-02", end="2024-07-02")
+        assert render_mock.call_count == 2
+        assert other.selects[-1].this.name == "regular"
+
+        model.render_query_or_raise(
+            start="2024-07-01", end="2024-07-01", variables={"var": "value"}
+        )
+        assert render_mock.call_count == 3
+
+    @macro()
+    def max_ds(evaluator):
+        return evaluator.engine_adapter.fetchone("SELECT MAX(ds) FROM db.source")[0]
+
+    expressions = d.parse(
+        """
+        MODEL (name db.table, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+        SELECT a, ds FROM db.source WHERE ds BETWEEN @start_ds AND @MAX_DS()
+        """
+    )
+    model = load_sql_based_model(expressions)
+    renderer = model._query_renderer
+
+    # Queries rendered by macros that use the engine adapter are never cached.
+    assert renderer._interval_cache_key("2024-07-01", "2024-07-01", None) is None
+
+
 def test_model_normalization():
     expr = d.parse(
         """
@@ -718,7 +718,9 @@ def test_restate_models_with_existing_missing_intervals(sushi_context: Context):
     yesterday_ts = to_timestamp(yesterday_ds())
 
     assert not sushi_context.plan(no_prompts=True).requires_backfill
-    waiter_revenue_by_day = sushi_context.snapshots['"memory"."sushi"."waiter_revenue_by_day"']
+    # Local snapshots are copies, so the intervals are changed on the snapshot cached by the state sync.
+    snapshot_id = sushi_context.snapshots['"memory"."sushi"."waiter_revenue_by_day"'].snapshot_id
+    waiter_revenue_by_day = sushi_context.state_sync.get_snapshots([snapshot_id])[snapshot_id]
     waiter_revenue_by_day.intervals = [
         (waiter_revenue_by_day.intervals[0][0], yesterday_ts),
     ]
@@ -1,10 +1,14 @@
+import asyncio
+import time
 import typing as t
+from threading import Event, current_thread
 
 import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one, parse
 
 from sqlmesh.core.audit import AuditResult
+from sqlmesh.core.config import ResourcePoolConfig
 from sqlmesh.core.context import Context
 from sqlmesh.core.environment import EnvironmentNamingInfo
 from sqlmesh.core.model import load_sql_based_model
@@ -16,14 +20,15 @@ from sqlmesh.core.model.kind import (
     TimeColumn,
 )
 from sqlmesh.core.node import IntervalUnit
-from sqlmesh.core.scheduler import Scheduler, compute_interval_params
+from sqlmesh.core.scheduler import IntervalCommitBuffer, Scheduler, compute_interval_params
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache
 from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
     SnapshotChangeCategory,
     DeployabilityIndex,
 )
-from sqlmesh.utils.date import to_datetime
+from sqlmesh.utils.date import to_datetime, to_timestamp
 from sqlmesh.utils.errors import CircuitBreakerError, AuditError
 
 
@@ -622,6 +627,327 @@ def test_audit_failure_notifications(
     assert notify_mock.call_count == 1
 
 
+def test_non_blocking_audits_run_in_background(
+    scheduler: Scheduler, waiter_names: Snapshot, mocker: MockerFixture
+):
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.evaluate", return_value=None)
+    notify_mock = mocker.patch("sqlmesh.core.notification_target.NotificationTargetManager.notify")
+    add_interval_mock = mocker.patch.object(scheduler.state_sync, "add_snapshots_intervals")
+
+    audit = next(iter(waiter_names.audits))
+    blocking_audit = audit.copy(update={"blocking": True})
+    non_blocking_audit = audit.copy(update={"blocking": False})
+
+    def _audit(blocking_result: t.Optional[AuditResult]) -> t.Callable:
+        def _side_effect(**kwargs: t.Any) -> t.List[AuditResult]:
+            assert kwargs["blocking"] is not None
+            if kwargs["blocking"]:
+                return [blocking_result] if blocking_result else []
+            assert kwargs.get("wap_id") is None
+            return [AuditResult(audit=non_blocking_audit, model=waiter_names.model, count=1)]
+
+        return _side_effect
+
+    scheduler.audit_max_workers = 2
+
+    audit_mock = mocker.patch(
+        "sqlmesh.core.scheduler.SnapshotEvaluator.audit", side_effect=_audit(None)
+    )
+    assert scheduler.run(
+        EnvironmentNamingInfo(),
+        "2022-01-01",
+        "2022-01-03",
+        selected_snapshots={waiter_names.name},
+    )
+    add_interval_mock.assert_called_once()
+    assert audit_mock.call_count == 2
+    notify_mock.assert_called_once()
+
+    add_interval_mock.reset_mock()
+    notify_mock.reset_mock()
+
+    # Failed blocking audits still fail the evaluation.
+    mocker.patch(
+        "sqlmesh.core.scheduler.SnapshotEvaluator.audit",
+        side_effect=_audit(AuditResult(audit=blocking_audit, model=waiter_names.model, count=1)),
+    )
+    assert not scheduler.run(
+        EnvironmentNamingInfo(),
+        "2022-01-01",
+        "2022-01-03",
+        selected_snapshots={waiter_names.name},
+    )
+    add_interval_mock.assert_not_called()
+    notify_mock.assert_called_once()
+
+
+@pytest.fixture
+def daily_snapshot(make_snapshot) -> Snapshot:
+    snapshot = make_snapshot(
+        SqlModel(
+            name="test_model",
+            kind=IncrementalByTimeRangeKind(time_column="ds", batch_size=1),
+            cron="@daily",
+            start="2023-01-01",
+            query=parse_one("SELECT 1, ds FROM source"),
+        ),
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    return snapshot
+
+
+def test_interval_commit_buffer(mocker: MockerFixture, daily_snapshot: Snapshot):
+    state_sync = mocker.MagicMock()
+    buffer = IntervalCommitBuffer(state_sync, max_size=3, max_delay_seconds=3600)
+
+    buffer.add(daily_snapshot, "2023-01-02", "2023-01-02")
+    buffer.add(daily_snapshot, "2023-01-01", "2023-01-01")
+    buffer.add(daily_snapshot, "2023-01-05", "2023-01-05", is_dev=True)
+    state_sync.add_snapshots_intervals.assert_called_once()
+    (snapshots_intervals,), _ = state_sync.add_snapshots_intervals.call_args
+    assert len(snapshots_intervals) == 1
+    assert snapshots_intervals[0].snapshot_id == daily_snapshot.snapshot_id
+    assert snapshots_intervals[0].intervals == [
+        (to_timestamp("2023-01-01"), to_timestamp("2023-01-03"))
+    ]
+    assert snapshots_intervals[0].dev_intervals == [
+        (to_timestamp("2023-01-05"), to_timestamp("2023-01-06"))
+    ]
+
+    # Intervals stay buffered if the state sync fails to add them.
+    state_sync.reset_mock()
+    state_sync.add_snapshots_intervals.side_effect = [Exception("Failed"), None]
+    buffer.add(daily_snapshot, "2023-01-03", "2023-01-03")
+    with pytest.raises(Exception, match="Failed"):
+        buffer.flush()
+    buffer.add(daily_snapshot, "2023-01-04", "2023-01-04")
+    buffer.flush()
+    (snapshots_intervals,), _ = state_sync.add_snapshots_intervals.call_args
+    assert snapshots_intervals[0].intervals == [
+        (to_timestamp("2023-01-03"), to_timestamp("2023-01-05"))
+    ]
+
+    state_sync.reset_mock()
+    state_sync.add_snapshots_intervals.side_effect = None
+    buffer.flush()
+    state_sync.add_snapshots_intervals.assert_not_called()
+
+    buffer = IntervalCommitBuffer(state_sync, max_size=100, max_delay_seconds=0)
+    buffer.add(daily_snapshot, "2023-01-01", "2023-01-01")
+    state_sync.add_snapshots_intervals.assert_called_once()
+
+
+def test_interval_commit_buffer_flushes_on_timer(mocker: MockerFixture, daily_snapshot: Snapshot):
+    state_sync = mocker.MagicMock()
+    flushed = Event()
+    state_sync.add_snapshots_intervals.side_effect = lambda *args: flushed.set()
+    buffer = IntervalCommitBuffer(state_sync, max_size=100, max_delay_seconds=0.1)
+
+    # The interval is recorded once it's old enough, even though no other interval is added.
+    buffer.add(daily_snapshot, "2023-01-01", "2023-01-01")
+    state_sync.add_snapshots_intervals.assert_not_called()
+    assert flushed.wait(timeout=10)
+    (snapshots_intervals,), _ = state_sync.add_snapshots_intervals.call_args
+    assert snapshots_intervals[0].intervals == [
+        (to_timestamp("2023-01-01"), to_timestamp("2023-01-02"))
+    ]
+
+    # An explicit flush cancels the pending timer.
+    state_sync.reset_mock()
+    buffer.add(daily_snapshot, "2023-01-02", "2023-01-02")
+    buffer.flush()
+    state_sync.add_snapshots_intervals.assert_called_once()
+    time.sleep(0.2)
+    state_sync.add_snapshots_intervals.assert_called_once()
+
+
+def test_run_buffers_interval_commits(mocker: MockerFixture, daily_snapshot: Snapshot):
+    def _evaluate(snapshot: Snapshot, start: t.Any, **kwargs: t.Any) -> None:
+        if to_datetime(start) == to_datetime("2023-01-04"):
+            raise RuntimeError("Evaluation failed")
+
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.evaluate", side_effect=_evaluate)
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.audit", return_value=[])
+
+    state_sync = mocker.MagicMock()
+    scheduler = Scheduler(
+        snapshots=[daily_snapshot],
+        snapshot_evaluator=SnapshotEvaluator(adapter=mocker.MagicMock()),
+        state_sync=state_sync,
+        default_catalog=None,
+        interval_commit_batch_size=2,
+    )
+
+    assert not scheduler.run(EnvironmentNamingInfo(), "2023-01-01", "2023-01-06")
+
+    state_sync.add_interval.assert_not_called()
+    # Evaluated batches are recorded in bulk, including the ones that are still buffered when the run fails.
+    assert [
+        snapshots_intervals[0].intervals
+        for (snapshots_intervals,), _ in state_sync.add_snapshots_intervals.call_args_list
+    ] == [
+        [(to_timestamp("2023-01-01"), to_timestamp("2023-01-03"))],
+        [
+            (to_timestamp("2023-01-03"), to_timestamp("2023-01-04")),
+            (to_timestamp("2023-01-05"), to_timestamp("2023-01-06")),
+        ],
+        [(to_timestamp("2023-01-06"), to_timestamp("2023-01-07"))],
+    ]
+
+
+@pytest.mark.parametrize("in_event_loop", [False, True])
+def test_run_async_evaluation(mocker: MockerFixture, daily_snapshot: Snapshot, in_event_loop: bool):
+    evaluated = []
+
+    def _evaluate(snapshot: Snapshot, start: t.Any, **kwargs: t.Any) -> None:
+        if to_datetime(start) == to_datetime("2023-01-04"):
+            raise RuntimeError("Evaluation failed")
+        evaluated.append((to_timestamp(start), current_thread().name))
+
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.evaluate", side_effect=_evaluate)
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.audit", return_value=[])
+
+    scheduler = Scheduler(
+        snapshots=[daily_snapshot],
+        snapshot_evaluator=SnapshotEvaluator(adapter=mocker.MagicMock()),
+        state_sync=mocker.MagicMock(),
+        default_catalog=None,
+        max_workers=2,
+        async_evaluation=True,
+    )
+
+    def _run() -> bool:
+        return scheduler.run(EnvironmentNamingInfo(), "2023-01-01", "2023-01-06")
+
+    async def _run_in_event_loop() -> bool:
+        return _run()
+
+    assert not (asyncio.run(_run_in_event_loop()) if in_event_loop else _run())
+    assert sorted(start for start, _ in evaluated) == [
+        to_timestamp(day)
+        for day in ("2023-01-01", "2023-01-02", "2023-01-03", "2023-01-05", "2023-01-06")
+    ]
+    assert all(thread_name.startswith("evaluation") for _, thread_name in evaluated)
+
+
+def test_run_interval_commit_failure(mocker: MockerFixture, daily_snapshot: Snapshot):
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.evaluate")
+    mocker.patch("sqlmesh.core.scheduler.SnapshotEvaluator.audit", return_value=[])
+
+    state_sync = mocker.MagicMock()
+    state_sync.add_snapshots_intervals.side_effect = RuntimeError("State sync is unavailable")
+    scheduler = Scheduler(
+        snapshots=[daily_snapshot],
+        snapshot_evaluator=SnapshotEvaluator(adapter=mocker.MagicMock()),
+        state_sync=state_sync,
+        default_catalog=None,
+        interval_commit_batch_size=100,
+    )
+    stop_progress_mock = mocker.spy(scheduler.console, "stop_evaluation_progress")
+
+    assert not scheduler.run(EnvironmentNamingInfo(), "2023-01-01", "2023-01-03")
+
+    state_sync.add_snapshots_intervals.assert_called_once()
+    stop_progress_mock.assert_called_once_with(success=False)
+    state_sync.recycle.assert_called_once()
+
+
+def test_critical_path_priorities(mocker: MockerFixture, make_snapshot, tmp_path):
+    def _make_snapshot(name: str, *parents: Snapshot) -> Snapshot:
+        snapshot = make_snapshot(
+            SqlModel(
+                name=name,
+                kind=FullKind(),
+                query=parse_one(
+                    "SELECT 1 AS a" + "".join(f" UNION ALL SELECT a FROM {p.name}" for p in parents)
+                ),
+            ),
+            nodes={p.name: p.model for p in parents},
+        )
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        return snapshot
+
+    heavy = _make_snapshot("heavy")
+    heavy_child = _make_snapshot("heavy_child", heavy)
+    light = _make_snapshot("light")
+    new = _make_snapshot("new")
+    snapshots = [heavy, heavy_child, light, new]
+
+    durations = EvaluationDurationCache(tmp_path)
+    interval = (to_timestamp("2023-01-01"), to_timestamp("2023-01-02"))
+    durations.record(heavy, interval, 100)
+    durations.record(heavy_child, interval, 1000)
+    durations.record(light, interval, 200)
+
+    scheduler = Scheduler(
+        snapshots,
+        SnapshotEvaluator(adapter=mocker.MagicMock()),
+        mocker.MagicMock(),
+        default_catalog=None,
+        max_workers=2,
+        evaluation_durations=durations,
+    )
+
+    batches = {snapshot: [tuple(map(to_datetime, interval))] for snapshot in snapshots}
+    priorities = scheduler._critical_path_priorities(
+        scheduler._dag(batches),
+        {s.name: s for s in snapshots},  # type: ignore
+    )
+    priorities_by_name = {node[0]: priority for node, priority in priorities.items()}
+
+    assert priorities_by_name == {
+        heavy.name: 1100,
+        heavy_child.name: 1000,
+        light.name: 200,
+        # Snapshots without recorded durations get the median of recorded durations.
+        new.name: 200,
+    }
+
+
+def test_node_resources(mocker: MockerFixture, make_snapshot):
+    def _make_snapshot(name: str, tags: t.List[str]) -> Snapshot:
+        snapshot = make_snapshot(
+            SqlModel(name=name, kind=FullKind(), tags=tags, query=parse_one("SELECT 1 AS a"))
+        )
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        return snapshot
+
+    heavy = _make_snapshot("raw.heavy", ["heavy"])
+    orders = _make_snapshot("sushi.orders", [])
+    other = _make_snapshot("raw.other", [])
+    snapshots = [heavy, orders, other]
+
+    def _resources(gateway: t.Optional[str]) -> t.Dict[str, t.Dict[str, int]]:
+        scheduler = Scheduler(
+            snapshots,
+            SnapshotEvaluator(adapter=mocker.MagicMock()),
+            mocker.MagicMock(),
+            default_catalog=None,
+            resource_pools={
+                "warehouse": ResourcePoolConfig(max_slots=4, weight=2, tags=["heavy"]),
+                "sushi": ResourcePoolConfig(max_slots=1, models=["sushi.*"]),
+                "remote": ResourcePoolConfig(max_slots=2, gateways=["remote"]),
+            },
+            gateway=gateway,
+        )
+        interval = (to_datetime("2023-01-01"), to_datetime("2023-01-02"))
+        resources = scheduler._node_resources(
+            scheduler._dag({snapshot: [interval] for snapshot in snapshots}),
+            {s.name: s for s in snapshots},  # type: ignore
+        )
+        return {node[0]: slots for node, slots in resources.items()}
+
+    assert _resources(None) == {
+        heavy.name: {"warehouse": 2},
+        orders.name: {"sushi": 1},
+    }
+    assert _resources("remote") == {
+        heavy.name: {"warehouse": 2, "remote": 1},
+        orders.name: {"sushi": 1, "remote": 1},
+        other.name: {"remote": 1},
+    }
+
+
 def test_signal_factory(mocker: MockerFixture, make_snapshot):
     from sqlmesh.core.scheduler import signal_factory, Batch, Signal
 
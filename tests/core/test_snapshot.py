@@ -32,6 +32,7 @@ from sqlmesh.core.model import (
     load_sql_based_model,
 )
 from sqlmesh.core.model.kind import TimeColumn, ModelKindName
+from sqlmesh.core.node import IntervalUnit
 from sqlmesh.core.snapshot import (
     DeployabilityIndex,
     QualifiedViewName,
@@ -43,11 +44,17 @@ from sqlmesh.core.snapshot import (
     earliest_start_date,
     fingerprint_from_node,
     has_paused_forward_only,
+    merge_intervals,
     missing_intervals,
 )
-from sqlmesh.core.snapshot.cache import SnapshotCache
+from sqlmesh.core.snapshot.cache import EvaluationDurationCache, ParsedNodeCache, SnapshotCache
 from sqlmesh.core.snapshot.categorizer import categorize_change
-from sqlmesh.core.snapshot.definition import display_name
+from sqlmesh.core.snapshot.definition import (
+    Intervals,
+    compute_missing_intervals,
+    display_name,
+    insert_interval,
+)
 from sqlmesh.utils import AttributeDict
 from sqlmesh.utils.date import to_date, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
@@ -208,6 +215,17 @@ def test_add_interval(snapshot: Snapshot, make_snapshot):
     ]
 
 
+def test_insert_interval() -> None:
+    intervals: Intervals = []
+    expected: Intervals = []
+    for start, end in [(10, 20), (30, 40), (20, 25), (0, 5), (5, 10), (50, 60), (26, 29), (1, 55)]:
+        insert_interval(intervals, start, end)
+        expected = merge_intervals([*expected, (start, end)])
+        assert intervals == expected
+
+    assert intervals == [(0, 60)]
+
+
 def test_add_interval_dev(snapshot: Snapshot, make_snapshot):
     snapshot.version = "existing_version"
     snapshot.change_category = SnapshotChangeCategory.FORWARD_ONLY
@@ -284,6 +302,59 @@ def test_missing_intervals(snapshot: Snapshot):
     ]
 
 
+def test_compute_missing_intervals() -> None:
+    start = to_timestamp("2023-01-01")
+    hour = 60 * 60 * 1000
+
+    # Overlapping intervals.
+    assert compute_missing_intervals(
+        IntervalUnit.HOUR,
+        ((start, start + 3 * hour), (start + hour, start + 2 * hour)),
+        start,
+        start + 5 * hour,
+        0,
+        None,
+    ) == [(start + 3 * hour, start + 4 * hour), (start + 4 * hour, start + 5 * hour)]
+
+    # Unsorted intervals are scanned in order.
+    assert compute_missing_intervals(
+        IntervalUnit.HOUR,
+        ((start + hour, start + 2 * hour), (start, start + 3 * hour)),
+        start,
+        start + 3 * hour,
+        0,
+        None,
+    ) == [(start, start + hour)]
+
+    # Missing intervals within the lookback window make previous intervals missing.
+    assert compute_missing_intervals(
+        IntervalUnit.HOUR,
+        ((start, start + 2 * hour), (start + 3 * hour, start + 5 * hour)),
+        start,
+        start + 5 * hour,
+        1,
+        None,
+    ) == [
+        (start + hour, start + 2 * hour),
+        (start + 2 * hour, start + 3 * hour),
+        (start + 4 * hour, start + 5 * hour),
+    ]
+
+    # The last interval ends at the end even if it's partial.
+    assert compute_missing_intervals(
+        IntervalUnit.HOUR, (), start, start + 2 * hour + 1, 0, start + hour
+    ) == [(start, start + hour)]
+
+    five_minutes = 5 * 60 * 1000
+    end = to_timestamp("2024-01-01")
+    missing = compute_missing_intervals(
+        IntervalUnit.FIVE_MINUTE, ((start, start + five_minutes),), start, end, 0, None
+    )
+    assert len(missing) == (end - start) // five_minutes - 1
+    assert missing[0] == (start + five_minutes, start + 2 * five_minutes)
+    assert missing[-1] == (end - five_minutes, end)
+
+
 def test_missing_intervals_partial(make_snapshot):
     snapshot = make_snapshot(
         SqlModel(
@@ -2046,3 +2117,60 @@ def test_missing_intervals_interval_end_per_model(make_snapshot):
         snapshot_a: [(to_timestamp("2023-01-08"), to_timestamp("2023-01-09"))],
         snapshot_b: [(to_timestamp("2023-01-08"), to_timestamp("2023-01-09"))],
     }
+
+
+def test_evaluation_duration_cache(make_snapshot, tmp_path):
+    full_snapshot = make_snapshot(SqlModel(name="full_model", query=parse_one("SELECT 1")))
+    incremental_snapshot = make_snapshot(
+        SqlModel(
+            name="incremental_model",
+            kind=IncrementalByTimeRangeKind(time_column="ds"),
+            query=parse_one("SELECT ds FROM tbl"),
+        )
+    )
+
+    day = 24 * 60 * 60 * 1000
+    cache = EvaluationDurationCache(tmp_path, max_intervals=2)
+    assert cache.estimate(full_snapshot, (0, day)) is None
+
+    cache.record(full_snapshot, (0, day), 100)
+    cache.record(full_snapshot, (day, 2 * day), 300)
+    cache.record(incremental_snapshot, (0, day), 100)
+    cache.record(incremental_snapshot, (day, 3 * day), 400)
+
+    assert cache.estimate(full_snapshot, (day, 2 * day)) == 300
+    assert cache.estimate(full_snapshot, (0, 10 * day)) == 200
+    assert cache.estimate(incremental_snapshot, (0, 10 * day)) == 1500
+
+    # Only the most recent intervals are kept.
+    cache.record(full_snapshot, (2 * day, 3 * day), 500)
+    assert cache.estimate(full_snapshot, (0, day)) == 400
+
+    cache.flush()
+    cache = EvaluationDurationCache(tmp_path, max_intervals=2)
+    assert cache.estimate(full_snapshot, (2 * day, 3 * day)) == 500
+    assert cache.estimate(incremental_snapshot, (0, day)) == 100
+
+
+def test_parsed_node_cache():
+    model_a = SqlModel(name="a", query=parse_one("SELECT 1"))
+    model_b = SqlModel(name="b", query=parse_one("SELECT 2"))
+
+    cache = ParsedNodeCache(max_size=1)
+    assert cache.get("a") is None
+
+    cache.put("a", model_a)
+    cached_model_a = cache.get("a")
+    assert cached_model_a == model_a
+    assert cached_model_a is not model_a
+    assert cache.get("a") is not cached_model_a
+
+    # Modifying a returned node doesn't change the cached one.
+    cached_model_a.query.select("2 AS b", copy=False)
+    cached_model_a.mapping_schema["c"] = {"d": "int"}
+    assert cache.get("a") == model_a
+
+    # The least recently used node is evicted.
+    cache.put("b", model_b)
+    assert cache.get("a") is None
+    assert cache.get("b") == model_b
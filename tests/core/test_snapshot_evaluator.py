@@ -1042,35 +1042,6 @@ def test_audit_unversioned(mocker: MockerFixture, adapter_mock, make_snapshot):
 @pytest.mark.parametrize(
     "input_dfs, output_dict",
     [
-        (
-            """pd.DataFrame({"a": [1, 2, 3], "ds": ["2023-01-01", "2023-01-02", "2023-01-03"]}),
-        pd.DataFrame({"a": [4, 5, 6], "ds": ["2023-01-04", "2023-01-05", "2023-01-06"]}),
-        pd.DataFrame({"a": [7, 8, 9], "ds": ["2023-01-07", "2023-01-08", "2023-01-09"]})""",
-            {
-                "a": {
-                    0: 1,
-                    1: 2,
-                    2: 3,
-                    3: 4,
-                    4: 5,
-                    5: 6,
-                    6: 7,
-                    7: 8,
-                    8: 9,
-                },
-                "ds": {
-                    0: "2023-01-01",
-                    1: "2023-01-02",
-                    2: "2023-01-03",
-                    3: "2023-01-04",
-                    4: "2023-01-05",
-                    5: "2023-01-06",
-                    6: "2023-01-07",
-                    7: "2023-01-08",
-                    8: "2023-01-09",
-                },
-            },
-        ),
         (
             """pd.DataFrame({"a": [1, 2, 3], "ds": ["2023-01-01", "2023-01-02", "2023-01-03"]})""",
             {
@@ -1133,6 +1104,74 @@ def python_func(**kwargs):
     assert adapter_mock.insert_overwrite_by_time_partition.call_args[0][1].to_dict() == output_dict
 
 
+def test_snapshot_evaluator_yield_pd_staged(adapter_mock, make_snapshot):
+    adapter_mock.is_pyspark_df.return_value = False
+    adapter_mock.INSERT_OVERWRITE_STRATEGY = InsertOverwriteStrategy.INSERT_OVERWRITE
+    adapter_mock.try_get_df = lambda x: x
+    adapter_mock._get_temp_table.return_value = exp.to_table("sqlmesh__db.__temp_staging")
+    adapter_mock._select_columns = EngineAdapter._select_columns
+    evaluator = SnapshotEvaluator(adapter_mock)
+
+    snapshot = make_snapshot(
+        PythonModel(
+            name="db.model",
+            entrypoint="python_func",
+            kind=IncrementalByTimeRangeKind(time_column=TimeColumn(column="ds", format="%Y-%m-%d")),
+            columns={
+                "a": "INT",
+                "ds": "STRING",
+            },
+            python_env={
+                "python_func": Executable(
+                    name="python_func",
+                    alias="python_func",
+                    path="test_snapshot_evaluator.py",
+                    payload="""import pandas as pd
+def python_func(**kwargs):
+    yield pd.DataFrame({"a": [1, 2], "ds": ["2023-01-01", "2023-01-02"]})
+    yield pd.DataFrame({"a": [], "ds": []})
+    yield pd.DataFrame({"a": [3], "ds": ["2023-01-03"]})""",
+                )
+            },
+        )
+    )
+
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    evaluator.create([snapshot], {})
+    adapter_mock.create_table.reset_mock()
+
+    evaluator.evaluate(
+        snapshot,
+        start="2023-01-01",
+        end="2023-01-03",
+        execution_time="2023-01-03",
+        snapshots={},
+    )
+
+    staging_table = exp.to_table("sqlmesh__db.__temp_staging")
+    adapter_mock._get_temp_table.assert_called_once_with(snapshot.table_name())
+    adapter_mock.create_table.assert_called_once_with(
+        staging_table, snapshot.model.columns_to_types
+    )
+
+    # Empty dataframes are not staged
+    assert adapter_mock.insert_append.call_count == 2
+    assert [
+        call.args[1].to_dict(orient="list") for call in adapter_mock.insert_append.call_args_list
+    ] == [
+        {"a": [1, 2], "ds": ["2023-01-01", "2023-01-02"]},
+        {"a": [3], "ds": ["2023-01-03"]},
+    ]
+
+    # The target table is overwritten once using the staged data
+    adapter_mock.insert_overwrite_by_time_partition.assert_called_once()
+    assert (
+        adapter_mock.insert_overwrite_by_time_partition.call_args[0][1].sql()
+        == 'SELECT "a", "ds" FROM sqlmesh__db.__temp_staging'
+    )
+    adapter_mock.drop_table.assert_called_once_with(staging_table)
+
+
 def test_create_clone_in_dev(mocker: MockerFixture, adapter_mock, make_snapshot):
     adapter_mock.SUPPORTS_CLONING = True
     adapter_mock.get_alter_expressions.return_value = []
@@ -2120,6 +2159,70 @@ def test_audit_wap(adapter_mock, make_snapshot):
     adapter_mock.wap_publish.assert_called_once_with(snapshot.table_name(), wap_id)
 
 
+def test_audit_fused(duck_conn, make_snapshot, mocker: MockerFixture):
+    duck_conn.execute(
+        "CREATE VIEW tbl AS SELECT * FROM (VALUES (1, NULL), (NULL, 2), (3, 200)) AS t(a, b)"
+    )
+    adapter = create_engine_adapter(lambda: duck_conn, "duckdb")
+    evaluator = SnapshotEvaluator(adapter)
+
+    custom_audit = ModelAudit(
+        name="custom_audit",
+        query="SELECT COUNT(*) FROM @this_model HAVING COUNT(*) > 1",
+    )
+
+    model = SqlModel(
+        name="db.model",
+        kind=FullKind(),
+        query=parse_one("SELECT a::int AS a, b::int AS b FROM tbl"),
+        audits=[
+            ("not_null", {"columns": exp.to_column("a")}),
+            ("not_null", {"columns": exp.to_column("b")}),
+            ("accepted_range", {"column": exp.to_column("b"), "max_v": exp.Literal.number(100)}),
+            ("unique_values", {"columns": exp.to_column("a")}),
+            ("custom_audit", {}),
+        ],
+    )
+    snapshot = make_snapshot(model, audits={custom_audit.name: custom_audit})
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    evaluator.create([snapshot], {})
+    evaluator.evaluate(
+        snapshot,
+        start="2020-01-01",
+        end="2020-01-01",
+        execution_time="2020-01-01",
+        snapshots={},
+    )
+
+    fetchone_spy = mocker.spy(adapter, "fetchone")
+    results = evaluator.audit(snapshot, snapshots={}, raise_exception=False)
+
+    assert [(result.audit.name, result.count) for result in results] == [
+        ("not_null", 1),
+        ("not_null", 1),
+        ("accepted_range", 1),
+        ("unique_values", 0),
+        ("custom_audit", 1),
+    ]
+
+    # The first 3 audits are fused into a single query
+    assert fetchone_spy.call_count == 3
+    assert fetchone_spy.call_args_list[0][0][0].sql() == (
+        'SELECT SUM(CASE WHEN "a" IS NULL AND TRUE THEN 1 ELSE 0 END) AS audit_0, '
+        'SUM(CASE WHEN "b" IS NULL AND TRUE THEN 1 ELSE 0 END) AS audit_1, '
+        'SUM(CASE WHEN "b" > 100 AND TRUE THEN 1 ELSE 0 END) AS audit_2 '
+        f'FROM (SELECT * FROM "sqlmesh__db"."db__model__{snapshot.version}" AS "db__model__{snapshot.version}") AS "_q_0"'
+    )
+
+    # Each result still references the audit's own query
+    for result in results:
+        assert result.query
+        assert duck_conn.execute(
+            f"SELECT COUNT(*) FROM ({result.query.sql(dialect='duckdb')})"
+        ).fetchone() == (result.count,)
+
+
 def test_audit_set_blocking_at_use_site(adapter_mock, make_snapshot):
     evaluator = SnapshotEvaluator(adapter_mock)
 
@@ -2177,6 +2280,36 @@ def test_audit_set_blocking_at_use_site(adapter_mock, make_snapshot):
         evaluator.audit(snapshot, snapshots={})
 
 
+def test_audit_filtered_by_blocking(adapter_mock, make_snapshot, mocker: MockerFixture):
+    evaluator = SnapshotEvaluator(adapter_mock)
+
+    model = SqlModel(
+        name="test_schema.test_table",
+        kind=FullKind(),
+        query=parse_one("SELECT a::int FROM tbl"),
+        audits=[
+            ("not_null", {"columns": exp.to_column("a")}),
+            ("unique_values", {"columns": exp.to_column("a"), "blocking": exp.false()}),
+        ],
+    )
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    adapter_mock.fetchone.return_value = (0,)
+
+    render_spy = mocker.spy(evaluator, "_render_audit")
+    blocking_results = evaluator.audit(snapshot, snapshots={}, blocking=True)
+    non_blocking_results = evaluator.audit(snapshot, snapshots={}, blocking=False)
+
+    assert [result.audit.name for result in blocking_results] == ["not_null"]
+    assert [result.audit.name for result in non_blocking_results] == ["unique_values"]
+    assert [call.kwargs["audit"].name for call in render_spy.call_args_list] == [
+        "not_null",
+        "unique_values",
+    ]
+    # The model's audit arguments are left intact
+    assert model.audits[1][1]["blocking"] == exp.false()
+
+
 def test_create_post_statements_use_deployable_table(
     mocker: MockerFixture, adapter_mock, make_snapshot
 ):
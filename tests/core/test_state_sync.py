@@ -36,6 +36,7 @@ from sqlmesh.core.snapshot import (
 from sqlmesh.core.state_sync import (
     CachingStateSync,
     EngineAdapterStateSync,
+    StateLoader,
     cleanup_expired_views,
 )
 from sqlmesh.core.state_sync.base import (
@@ -44,8 +45,10 @@ from sqlmesh.core.state_sync.base import (
     PromotionResult,
     Versions,
 )
+from sqlmesh.core.state_sync.engine_adapter import _snapshot_to_json
 from sqlmesh.utils.date import now_timestamp, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.hashing import md5
 
 pytestmark = pytest.mark.slow
 
@@ -1115,6 +1118,129 @@ def test_delete_expired_snapshots(state_sync: EngineAdapterStateSync, make_snaps
     ]
 
     assert not state_sync.get_snapshots(all_snapshots)
+    assert not state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._nodes")
+
+
+def test_push_snapshots_shared_node(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
+    model = SqlModel(name="a", query=parse_one("select a, ds"))
+
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    other_snapshot = make_snapshot(model, version="other_version")
+    other_snapshot.fingerprint = snapshot.fingerprint.copy(update={"data_hash": "other"})
+    other_snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    state_sync.push_snapshots([snapshot, other_snapshot])
+
+    assert state_sync.engine_adapter.fetchall("SELECT node_hash FROM sqlmesh._nodes") == [
+        (md5([snapshot.node.json()]),)
+    ]
+    snapshots = state_sync.get_snapshots([snapshot, other_snapshot])
+    assert snapshots[snapshot.snapshot_id].node == model
+    assert snapshots[other_snapshot.snapshot_id].node == model
+
+    state_sync.delete_snapshots([snapshot])
+    state_sync.delete_expired_snapshots()
+    assert state_sync.engine_adapter.fetchall("SELECT node_hash FROM sqlmesh._nodes") == [
+        (md5([snapshot.node.json()]),)
+    ]
+
+    state_sync.delete_snapshots([other_snapshot])
+    state_sync.delete_expired_snapshots()
+    assert not state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._nodes")
+
+
+def test_delete_snapshots_only_deletes_their_nodes(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+):
+    snapshot = make_snapshot(SqlModel(name="a", query=parse_one("select a, ds")))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot])
+    state_sync.engine_adapter.execute(
+        "INSERT INTO sqlmesh._nodes (node_hash, node) VALUES ('pending', '{}')"
+    )
+
+    state_sync.delete_snapshots([snapshot])
+    assert state_sync.engine_adapter.fetchall("SELECT node_hash FROM sqlmesh._nodes") == [
+        ("pending",)
+    ]
+
+
+def test_get_snapshots_reuses_parsed_nodes(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    model = SqlModel(name="a", query=parse_one("select a, ds"))
+
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    other_snapshot = make_snapshot(model, version="other_version")
+    other_snapshot.fingerprint = snapshot.fingerprint.copy(update={"data_hash": "other"})
+    other_snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    state_sync.push_snapshots([snapshot, other_snapshot])
+    state_sync._snapshot_cache.clear()
+
+    get_nodes_spy = mocker.spy(state_sync, "_get_nodes")
+    snapshots = state_sync.get_snapshots([snapshot, other_snapshot])
+    assert snapshots[snapshot.snapshot_id].node == model
+    assert snapshots[other_snapshot.snapshot_id].node == model
+    assert snapshots[snapshot.snapshot_id].node is not snapshots[other_snapshot.snapshot_id].node
+    assert get_nodes_spy.call_count == 1
+
+    state_sync._snapshot_cache.clear()
+    fetchall_spy = mocker.spy(state_sync, "_fetchall")
+    snapshots = state_sync.get_snapshots([snapshot])
+    assert snapshots[snapshot.snapshot_id].node == model
+    assert all("_nodes" not in c.args[0].sql() for c in fetchall_spy.call_args_list)
+
+
+def test_delete_expired_snapshots_cleanup(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    now_ts = now_timestamp()
+
+    snapshots: t.List[Snapshot] = []
+    for name in ("a", "b", "c"):
+        query = f"select a, ds from {snapshots[-1].name}" if snapshots else "select a, ds"
+        snapshot = make_snapshot(
+            SqlModel(name=name, query=parse_one(query)),
+            nodes={s.name: s.model for s in snapshots},
+        )
+        snapshot.ttl = "in 10 seconds"
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshot.updated_ts = now_ts - 15000
+        snapshots.append(snapshot)
+    state_sync.push_snapshots(snapshots)
+
+    state_sync.SNAPSHOT_BATCH_SIZE = 1
+    cleanup_calls = []
+
+    def _cleanup(cleanup_tasks: t.List[SnapshotTableCleanupTask]) -> None:
+        cleanup_calls.append([task.snapshot.snapshot_id for task in cleanup_tasks])
+        raise RuntimeError("Failed to drop table")
+
+    # Snapshots are only removed once their tables have been cleaned up.
+    with pytest.raises(RuntimeError, match="Failed to drop table"):
+        state_sync.delete_expired_snapshots(cleanup=_cleanup)
+    assert set(state_sync.get_snapshots(snapshots)) == {s.snapshot_id for s in snapshots}
+
+    # The tables of all pages are cleaned up at once, so that the drops can be ordered across pages.
+    cleanup_calls.clear()
+    delete_snapshots_spy = mocker.spy(state_sync, "delete_snapshots")
+    assert state_sync.delete_expired_snapshots(
+        cleanup=lambda cleanup_tasks: cleanup_calls.append(
+            [task.snapshot.snapshot_id for task in cleanup_tasks]
+        )
+    ) == [SnapshotTableCleanupTask(snapshot=s.table_info, dev_table_only=False) for s in snapshots]
+    assert cleanup_calls == [[s.snapshot_id for s in snapshots]]
+    assert not state_sync.get_snapshots(snapshots)
+
+    # Downstream snapshots are removed first.
+    assert [call.args[0] for call in delete_snapshots_spy.call_args_list] == [
+        [s.snapshot_id] for s in reversed(snapshots)
+    ]
 
 
 def test_delete_expired_snapshots_seed(
@@ -1798,9 +1924,10 @@ def test_migrate_rows(state_sync: EngineAdapterStateSync, mocker: MockerFixture)
     customer_revenue_by_day = new_snapshots.loc[
         new_snapshots["name"] == '"sushi"."customer_revenue_by_day"'
     ].iloc[0]
-    assert json.loads(customer_revenue_by_day["snapshot"])["node"]["query"].startswith(
-        "JINJA_QUERY_BEGIN"
-    )
+    customer_revenue_by_day_node = state_sync._get_nodes([customer_revenue_by_day["node_hash"]])
+    assert json.loads(customer_revenue_by_day_node[customer_revenue_by_day["node_hash"]])[
+        "query"
+    ].startswith("JINJA_QUERY_BEGIN")
 
 
 def test_backup_state(state_sync: EngineAdapterStateSync, mocker: MockerFixture) -> None:
@@ -1996,6 +2123,153 @@ def test_cache(state_sync, make_snapshot, mocker):
         mock.assert_called()
 
 
+def test_cache_environments_and_intervals(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    cache = CachingStateSync(state_sync)  # type: ignore
+
+    snapshot = make_snapshot(SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot])
+    promote_snapshots(state_sync, [snapshot], "prod")
+    state_sync.add_interval(snapshot, "2023-01-01", "2023-01-01")
+
+    assert cache.get_environment("prod")
+    assert [e.name for e in cache.get_environments()] == ["prod"]
+    assert cache.max_interval_end_per_model("prod") == {snapshot.name: to_timestamp("2023-01-02")}
+    assert cache.refresh_snapshot_intervals([snapshot])[0].intervals == [
+        (to_timestamp("2023-01-01"), to_timestamp("2023-01-02"))
+    ]
+
+    # Nothing has changed, so cached values are served.
+    get_environment_spy = mocker.spy(state_sync, "get_environment")
+    get_environments_spy = mocker.spy(state_sync, "get_environments")
+    max_interval_end_spy = mocker.spy(state_sync, "max_interval_end_per_model")
+    refresh_intervals_spy = mocker.spy(state_sync, "refresh_snapshot_intervals")
+    assert cache.get_environment("prod")
+    assert cache.get_environments()
+    assert cache.max_interval_end_per_model("prod")
+    assert cache.refresh_snapshot_intervals([snapshot])[0].intervals
+    get_environment_spy.assert_not_called()
+    get_environments_spy.assert_not_called()
+    max_interval_end_spy.assert_not_called()
+    refresh_intervals_spy.assert_not_called()
+
+    # Adding intervals invalidates cached intervals but not environments.
+    state_sync.add_interval(snapshot, "2023-01-02", "2023-01-02")
+    assert cache.get_environment("prod")
+    get_environment_spy.assert_not_called()
+    assert cache.max_interval_end_per_model("prod") == {snapshot.name: to_timestamp("2023-01-03")}
+    assert cache.refresh_snapshot_intervals([snapshot])[0].intervals == [
+        (to_timestamp("2023-01-01"), to_timestamp("2023-01-03"))
+    ]
+    max_interval_end_spy.assert_called_once()
+    refresh_intervals_spy.assert_called_once()
+
+    # Attributes that affect which dev intervals are inherited from previous versions are part of the key.
+    migrated_snapshot = snapshot.copy(update={"migrated": True})
+    assert cache.refresh_snapshot_intervals([migrated_snapshot])[0].intervals
+    assert refresh_intervals_spy.call_count == 2
+    previous_snapshot = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 2, ds"))
+    )
+    previous_snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    previous_version = previous_snapshot.data_version
+    rebased_snapshot = snapshot.copy(update={"previous_versions": (previous_version,)})
+    assert cache.refresh_snapshot_intervals([rebased_snapshot])[0].intervals
+    assert refresh_intervals_spy.call_count == 3
+
+    # Invalidating an environment invalidates cached environments.
+    promote_snapshots(state_sync, [snapshot], "dev")
+    state_sync.invalidate_environment("dev")
+    dev_environment = cache.get_environment("dev")
+    assert dev_environment and dev_environment.expiration_ts
+    assert len(cache.get_environments()) == 2
+    get_environment_spy.assert_called_once()
+    get_environments_spy.assert_called_once()
+
+
+def test_state_loader(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 1, ds")))
+    snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 2, ds")))
+    snapshot_b.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+    promote_snapshots(state_sync, [snapshot_a, snapshot_b], "prod")
+
+    new_snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 3, ds")))
+    new_snapshot_c = make_snapshot(SqlModel(name="c", query=parse_one("select 4, ds")))
+    local_b = make_snapshot(snapshot_b.model.copy())
+
+    loader = StateLoader(state_sync)
+    get_environment_spy = mocker.spy(state_sync, "get_environment")
+    get_snapshots_spy = mocker.spy(state_sync, "get_snapshots")
+    get_stored_snapshots_spy = mocker.spy(state_sync, "get_stored_snapshots")
+
+    # The dev environment doesn't exist, so prod is diffed against instead.
+    loader.prefetch_environment("dev", "prod")
+    assert loader.get_environment("prod")
+    assert get_environment_spy.call_count == 2
+
+    stored = loader.get_stored_snapshots([new_snapshot_a, local_b, new_snapshot_c])
+    assert stored == {snapshot_b.snapshot_id: snapshot_b}
+    assert stored[snapshot_b.snapshot_id].node is local_b.node
+    get_stored_snapshots_spy.assert_called_once()
+    # Only the previous version of the modified snapshot is fetched in full.
+    get_snapshots_spy.assert_called_once_with({snapshot_a.snapshot_id})
+
+    # Loaded and missing snapshots are served without querying the state again.
+    assert loader.get_snapshots([snapshot_a, snapshot_b, new_snapshot_c]) == {
+        snapshot_a.snapshot_id: snapshot_a,
+        snapshot_b.snapshot_id: snapshot_b,
+    }
+    get_snapshots_spy.assert_called_once()
+    get_stored_snapshots_spy.assert_called_once()
+
+
+def test_get_stored_snapshots(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot = make_snapshot(SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2023-01-01", "2023-01-01")
+
+    local_snapshot = make_snapshot(snapshot.model.copy())
+    missing_snapshot = make_snapshot(SqlModel(name="b", query=parse_one("select 2, ds")))
+    get_nodes_spy = mocker.spy(state_sync, "_get_nodes")
+
+    stored = state_sync.get_stored_snapshots([local_snapshot, missing_snapshot])
+    assert list(stored) == [snapshot.snapshot_id]
+    stored_snapshot = stored[snapshot.snapshot_id]
+    assert stored_snapshot.node is local_snapshot.node
+    assert stored_snapshot.version == snapshot.version
+    assert stored_snapshot.change_category == snapshot.change_category
+    assert stored_snapshot.intervals == [(to_timestamp("2023-01-01"), to_timestamp("2023-01-02"))]
+    get_nodes_spy.assert_not_called()
+
+
+def test_cache_get_stored_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
+    cache = CachingStateSync(state_sync)  # type: ignore
+
+    snapshot = make_snapshot(SqlModel(name="a", query=parse_one("select 1, ds")))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    cache.push_snapshots([snapshot])
+    cached = cache.get_snapshots([snapshot.snapshot_id])[snapshot.snapshot_id]
+    cached_node = cached.node
+
+    local_snapshot = make_snapshot(snapshot.model.copy())
+    stored = cache.get_stored_snapshots([local_snapshot])[snapshot.snapshot_id]
+    assert stored.node is local_snapshot.node
+    assert stored is not cached
+
+    # The local node isn't attached to the snapshot that other readers of the cache get.
+    assert cache.get_snapshots([snapshot.snapshot_id])[snapshot.snapshot_id] is cached
+    assert cached.node is cached_node
+
+
 def test_cleanup_expired_views(
     mocker: MockerFixture, state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
 ):
@@ -2208,7 +2482,7 @@ def test_get_snapshots(mocker):
 
 
 def test_snapshot_batching(state_sync, mocker, make_snapshot):
-    mock = mocker.Mock()
+    mock = mocker.MagicMock()
 
     state_sync.SNAPSHOT_BATCH_SIZE = 2
     state_sync.engine_adapter = mock
@@ -2217,6 +2491,7 @@ def test_snapshot_batching(state_sync, mocker, make_snapshot):
     snapshot_b = make_snapshot(SqlModel(name="a", query=parse_one("select 2")), "2")
     snapshot_c = make_snapshot(SqlModel(name="a", query=parse_one("select 3")), "3")
 
+    mock.fetchall.return_value = []
     state_sync.delete_snapshots(
         (
             snapshot_a,
@@ -2238,44 +2513,30 @@ def test_snapshot_batching(state_sync, mocker, make_snapshot):
         ),
     ]
 
-    mock.fetchall.side_effect = [
-        [
-            [
-                make_snapshot(
-                    SqlModel(name="a", query=parse_one("select 1")),
-                ).json(),
-                "a",
-                "1",
-                "1",
-                1,
-                1,
-                False,
-            ],
+    snapshot_rows = []
+    node_rows = []
+    for i in range(1, 4):
+        snapshot = make_snapshot(SqlModel(name="a", query=parse_one(f"select {i}")))
+        snapshot_rows.append(
             [
-                make_snapshot(
-                    SqlModel(name="a", query=parse_one("select 2")),
-                ).json(),
+                _snapshot_to_json(snapshot, exclude_node=True),
                 "a",
-                "2",
-                "2",
+                str(i),
+                str(i),
                 1,
                 1,
                 False,
-            ],
-        ],
-        [
-            [
-                make_snapshot(
-                    SqlModel(name="a", query=parse_one("select 3")),
-                ).json(),
-                "a",
-                "3",
-                "3",
-                1,
-                1,
-                False,
-            ],
-        ],
+                f"node_{i}",
+            ]
+        )
+        node_rows.append((f"node_{i}", snapshot.node.json()))
+
+    mock.fetchall.reset_mock()
+    mock.fetchall.side_effect = [
+        snapshot_rows[:2],
+        snapshot_rows[2:],
+        node_rows[:2],
+        node_rows[2:],
     ]
 
     snapshots = state_sync._get_snapshots(
@@ -2288,7 +2549,7 @@ def test_snapshot_batching(state_sync, mocker, make_snapshot):
     )
     assert len(snapshots) == 3
     calls = mock.fetchall.call_args_list
-    assert len(calls) == 2
+    assert len(calls) == 4
 
 
 def test_seed_model_metadata_update(
@@ -3,9 +3,10 @@ from pathlib import Path
 from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
 
+from sqlmesh.core.config import CacheConfig
 from sqlmesh.core.model import SqlModel
 from sqlmesh.core.model.cache import OptimizedQueryCache
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import FileCache, PackFileCache
 from sqlmesh.utils.pydantic import PydanticModel
 
 
@@ -39,6 +40,77 @@ def test_file_cache(tmp_path: Path, mocker: MockerFixture):
     assert "___test_model_" in cache._cache_entry_path('"test_model"').name
 
 
+def test_pack_file_cache(tmp_path: Path, mocker: MockerFixture):
+    cache: PackFileCache[_TestEntry] = PackFileCache(tmp_path, prefix="test")
+
+    test_entry_a = _TestEntry(value="value_a")
+    test_entry_b = _TestEntry(value="value_b")
+
+    loader = mocker.Mock(return_value=test_entry_a)
+
+    assert cache.get("test_name", "test_entry_a") is None
+    assert not cache.exists("test_name", "test_entry_a")
+
+    assert cache.get_or_load("test_name", "test_entry_a", loader=loader) == test_entry_a
+    assert cache.get_or_load("test_name", "test_entry_a", loader=loader) == test_entry_a
+    assert cache.exists("test_name", "test_entry_a")
+
+    cache.put("test_name", "test_entry_b", value=test_entry_b)
+    assert cache.get("test_name", "test_entry_b") == test_entry_b
+    assert cache.get("test_name", "test_entry_a") == test_entry_a
+    assert cache.get("different_name", "test_entry_b") is None
+
+    loader.assert_called_once()
+
+    # Entries are stored in a single pack file and can be read by a new cache instance
+    assert {p.suffix for p in (tmp_path / "test").iterdir()} == {".pack", ".idx"}
+    new_cache: PackFileCache[_TestEntry] = PackFileCache(tmp_path, prefix="test")
+    assert new_cache.get("test_name", "test_entry_a") == test_entry_a
+    assert new_cache.get("test_name", "test_entry_b") == test_entry_b
+
+    new_cache.clear()
+    assert not new_cache.exists("test_name", "test_entry_a")
+    assert not (tmp_path / "test").exists()
+
+
+def test_pack_file_cache_eviction(tmp_path: Path):
+    cache: PackFileCache[_TestEntry] = PackFileCache(tmp_path, max_size=2000)
+
+    for i in range(10):
+        cache.put(f"name_{i}", value=_TestEntry(value="x" * 100))
+        # Reading an entry makes it the most recently used one
+        assert cache.get("name_0") is not None
+
+    assert (tmp_path / f"{cache._pack_path.stem}.pack").stat().st_size <= 2000
+    assert cache.exists("name_0")
+    assert cache.exists("name_9")
+    assert not cache.exists("name_1")
+
+    new_cache: PackFileCache[_TestEntry] = PackFileCache(tmp_path, max_size=2000)
+    assert new_cache.get("name_0") == _TestEntry(value="x" * 100)
+    assert new_cache.get("name_9") == _TestEntry(value="x" * 100)
+    assert new_cache.get("name_1") is None
+
+
+def test_optimized_query_cache_pack_store(tmp_path: Path):
+    model = SqlModel(
+        name="test_model",
+        query=parse_one("SELECT a FROM tbl"),
+        mapping_schema={"tbl": {"a": "int"}},
+    )
+
+    cache = OptimizedQueryCache(tmp_path, CacheConfig(store="pack"))
+
+    assert not cache.with_optimized_query(model)
+    assert {p.suffix for p in (tmp_path / "optimized_query").iterdir()} == {".pack", ".idx"}
+
+    model._query_renderer._cache = []
+    model._query_renderer._optimized_cache = None
+
+    assert OptimizedQueryCache(tmp_path, CacheConfig(store="pack")).with_optimized_query(model)
+    assert model._query_renderer._optimized_cache is not None
+
+
 def test_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
     model = SqlModel(
         name="test_model",
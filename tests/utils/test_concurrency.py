@@ -1,12 +1,20 @@
+import asyncio
+import threading
+import time
+import typing as t
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
 from sqlmesh.utils.concurrency import (
     NodeExecutionFailedError,
+    async_apply_to_dag,
+    concurrent_apply_to_dag,
     concurrent_apply_to_snapshots,
     concurrent_apply_to_values,
 )
+from sqlmesh.utils.dag import DAG
 
 
 @pytest.mark.parametrize("tasks_num", [1, 2])
@@ -142,6 +150,145 @@ def test_concurrent_apply_to_snapshots_skip_each_node_only_once(mocker: MockerFi
     assert skipped == [snapshot_a.snapshot_id, snapshot_b.snapshot_id, snapshot_c.snapshot_id]
 
 
+def test_concurrent_apply_to_dag_order_and_concurrency() -> None:
+    dag: DAG[int] = DAG()
+    for node in range(1000):
+        dag.add(node, [node - 1, node - 7] if node >= 7 else [])
+    graph = dag.graph
+
+    lock = threading.Lock()
+    processed_nodes: t.Set[int] = set()
+    running_nodes: t.Set[int] = set()
+    max_running_nodes_num = 0
+
+    def fn(node: int) -> None:
+        nonlocal max_running_nodes_num
+        with lock:
+            assert graph[node] <= processed_nodes
+            running_nodes.add(node)
+            max_running_nodes_num = max(max_running_nodes_num, len(running_nodes))
+        if node == 500:
+            raise RuntimeError("fail")
+        with lock:
+            running_nodes.remove(node)
+            processed_nodes.add(node)
+
+    errors, skipped = concurrent_apply_to_dag(dag, fn, 3, raise_on_error=False)
+
+    assert [error.node for error in errors] == [500]
+    assert set(skipped) == set(range(501, 1000))
+    assert len(skipped) == 499
+    assert processed_nodes == set(range(500))
+    assert max_running_nodes_num <= 3
+
+
+def test_concurrent_apply_to_dag_priorities() -> None:
+    dag: DAG[str] = DAG({"root": set(), "a": {"root"}, "b": {"root"}, "c": {"root"}})
+
+    lock = threading.Lock()
+    processed_nodes: t.List[str] = []
+
+    def fn(node: str) -> None:
+        with lock:
+            processed_nodes.append(node)
+
+    concurrent_apply_to_dag(dag, fn, 2, priorities={"a": 1.0, "b": 10.0, "c": 5.0})
+
+    assert processed_nodes[0] == "root"
+    assert set(processed_nodes[1:3]) == {"b", "c"}
+    assert processed_nodes[3] == "a"
+
+
+def test_concurrent_apply_to_dag_resource_limits() -> None:
+    dag: DAG[int] = DAG({node: set() for node in range(20)})
+
+    lock = threading.Lock()
+    running_slots = {"a": 0, "b": 0}
+    max_running_slots = {"a": 0, "b": 0}
+    node_resources = {
+        node: {"a": 1} if node % 2 else {"a": 1, "b": 2, "unknown": 100} for node in range(20)
+    }
+
+    def fn(node: int) -> None:
+        with lock:
+            for resource, slots in node_resources[node].items():
+                if resource in running_slots:
+                    running_slots[resource] += slots
+                    max_running_slots[resource] = max(
+                        max_running_slots[resource], running_slots[resource]
+                    )
+        time.sleep(0.001)
+        with lock:
+            for resource, slots in node_resources[node].items():
+                if resource in running_slots:
+                    running_slots[resource] -= slots
+
+    errors, skipped = concurrent_apply_to_dag(
+        dag, fn, 8, node_resources=node_resources, resource_limits={"a": 3, "b": 2}
+    )
+
+    assert not errors
+    assert not skipped
+    assert max_running_slots["a"] <= 3
+    assert max_running_slots["b"] <= 2
+
+
+class _FakeAsyncEngineAdapter:
+    def __init__(self) -> None:
+        self.executed: t.List[str] = []
+        self.running_jobs_num = 0
+        self.max_running_jobs_num = 0
+
+    async def execute_async(self, sql: str) -> None:
+        self.running_jobs_num += 1
+        self.max_running_jobs_num = max(self.max_running_jobs_num, self.running_jobs_num)
+        try:
+            await asyncio.sleep(0.01)
+            if "fail" in sql:
+                raise RuntimeError(sql)
+            self.executed.append(sql)
+        finally:
+            self.running_jobs_num -= 1
+
+
+def test_async_apply_to_dag():
+    dag: DAG[str] = DAG()
+    for i in range(200):
+        dag.add(f"model_{i}", [])
+    dag.add("downstream", [f"model_{i}" for i in range(200)])
+
+    adapter = _FakeAsyncEngineAdapter()
+    threads_num = threading.active_count()
+
+    errors, skipped = asyncio.run(
+        async_apply_to_dag(dag, lambda node: adapter.execute_async(node), 150)
+    )
+
+    assert not errors
+    assert not skipped
+    assert adapter.max_running_jobs_num == 150
+    assert adapter.executed[-1] == "downstream"
+    assert len(adapter.executed) == 201
+    # Jobs are awaited on the event loop without any additional threads.
+    assert threading.active_count() == threads_num
+
+
+def test_async_apply_to_dag_errors():
+    dag: DAG[str] = DAG({"fail_a": set(), "b": {"fail_a"}, "c": {"b"}, "d": set(), "e": {"d"}})
+
+    adapter = _FakeAsyncEngineAdapter()
+    errors, skipped = asyncio.run(
+        async_apply_to_dag(dag, adapter.execute_async, 2, raise_on_error=False)
+    )
+
+    assert [error.node for error in errors] == ["fail_a"]
+    assert sorted(skipped) == ["b", "c"]
+    assert adapter.executed == ["d", "e"]
+
+    with pytest.raises(NodeExecutionFailedError, match="Execution failed for node fail_a"):
+        asyncio.run(async_apply_to_dag(dag, _FakeAsyncEngineAdapter().execute_async, 2))
+
+
 @pytest.mark.parametrize("tasks_num", [1, 3])
 def test_concurrent_apply(tasks_num: int):
     values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
@@ -104,3 +104,31 @@ def test_prune():
         "a": {"d"},
         "d": set(),
     }
+
+
+def test_upstream_deep_chain():
+    dag = DAG({i: {i - 1} for i in range(1, 10000)})
+
+    assert dag.upstream(9999) == set(range(9999))
+    assert dag.downstream(0) == list(range(1, 10000))
+
+
+def test_upstream_after_add():
+    dag = DAG({"a": {"b"}, "b": {"c"}})
+    assert dag.upstream("a") == {"b", "c"}
+    assert dag.upstream("b") == {"c"}
+
+    dag.add("c", ["d"])
+    dag.add("e", ["a"])
+    assert dag.upstream("a") == {"b", "c", "d"}
+    assert dag.upstream("b") == {"c", "d"}
+    assert dag.upstream("e") == {"a", "b", "c", "d"}
+    assert dag.upstream("f") == set()
+    assert dag.sorted == ["d", "c", "b", "a", "e"]
+
+
+def test_subdag():
+    dag = DAG({"a": {"b"}, "b": {"c"}, "d": {"c"}})
+
+    assert dag.subdag("b", "x").graph == {"b": {"c"}, "c": set(), "x": set()}
+    assert dag.lineage("b").graph == {"a": {"b"}, "b": {"c"}, "c": set()}
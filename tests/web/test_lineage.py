@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import pytest
 from fastapi.testclient import TestClient
+from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.context import Context
+from web.server.api.endpoints import lineage
+from web.server.api.endpoints.lineage import column_lineage_index
 from web.server.main import app
 
 pytestmark = pytest.mark.web
@@ -735,3 +738,21 @@ def test_get_lineage_quoted_columns(project_context: Context) -> None:
     response_json = response.json()
     assert response_json['"foo"']["@col"]["models"] == {'"bar"': ["col"]}
     assert response_json['"bar"']["col"]["models"] == {'"external_table"': ["col"]}
+
+
+def test_get_lineage_memoized(web_sushi_context: Context, mocker: MockerFixture) -> None:
+    lineage_mock = mocker.spy(lineage, "lineage")
+
+    response = client.get("/api/lineage/sushi.waiters/event_date")
+    assert response.status_code == 200
+    assert lineage_mock.call_count == 2
+
+    assert client.get("/api/lineage/sushi.waiters/event_date").json() == response.json()
+    assert lineage_mock.call_count == 2
+
+    model = web_sushi_context.get_model("sushi.waiters")
+    web_sushi_context._models.update({model.fqn: model.copy()})
+    assert client.get("/api/lineage/sushi.waiters/event_date").json() == response.json()
+    assert lineage_mock.call_count == 3
+    assert column_lineage_index.lineage(web_sushi_context, model, "event_date")
+    assert lineage_mock.call_count == 4
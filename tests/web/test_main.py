@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import threading
 from pathlib import Path
 
@@ -12,7 +13,9 @@ from pytest_mock.plugin import MockerFixture
 from sqlmesh.core.context import Context
 from sqlmesh.core.environment import Environment
 from sqlmesh.utils.errors import PlanError
+from web.server.api.endpoints import models as models_endpoint
 from web.server.api.endpoints.files import _get_file_with_content
+from web.server.api.endpoints.lineage import column_lineage_index
 from web.server.main import app
 from web.server.settings import get_settings
 
@@ -442,6 +445,45 @@ def test_get_models(web_sushi_context: Context) -> None:
     assert test_model.get("columns")
 
 
+def test_get_models_paginated(web_sushi_context: Context) -> None:
+    response = client.get("/api/models")
+    assert response.status_code == 200
+    all_models = response.json()
+    etag = response.headers["etag"]
+
+    response = client.get("/api/models", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.content
+
+    response = client.get("/api/models", params={"offset": 2, "limit": 3})
+    assert response.status_code == 200
+    assert response.json() == all_models[2:5]
+
+    response = client.get("/api/models", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["etag"] != etag
+    assert [json.loads(line) for line in response.text.splitlines()] == all_models
+
+    assert client.get("/api/models", params={"offset": -1}).status_code == 422
+    assert client.get("/api/models", params={"limit": 0}).status_code == 422
+
+
+def test_get_models_prunes_removed_models(web_sushi_context: Context) -> None:
+    fqn = web_sushi_context.get_model("sushi.top_waiters").fqn
+    assert client.get("/api/lineage/sushi.top_waiters/waiter_id").status_code == 200
+    assert client.get("/api/models").status_code == 200
+    assert fqn in models_endpoint._serialized_models
+    assert fqn in column_lineage_index._models
+
+    web_sushi_context._models.pop(fqn)
+    response = client.get("/api/models")
+    assert response.status_code == 200
+    assert "sushi.top_waiters" not in {model["name"] for model in response.json()}
+    assert fqn not in models_endpoint._serialized_models
+    assert fqn not in column_lineage_index._models
+
+
 def test_render(web_sushi_context: Context) -> None:
     response = client.post("/api/commands/render", json={"model": "sushi.items"})
     assert response.status_code == 200
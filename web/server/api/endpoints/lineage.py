@@ -9,6 +9,7 @@ from sqlglot import exp
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import normalize_model_name
 from sqlmesh.core.lineage import column_dependencies, lineage
+from sqlmesh.core.model import Model
 from web.server.exceptions import ApiException
 from web.server.models import LineageColumn
 from web.server.settings import get_loaded_context
@@ -42,6 +43,105 @@ def get_column_name(node: Node) -> str:
     return exp.to_column(node.name).name
 
 
+class _LineageNode(t.NamedTuple):
+    """A node of a column's lineage within a single model."""
+
+    name: str
+    column: str
+    expression: str
+    source: str
+    models: t.Dict[str, t.Set[str]]
+    upstream: t.List[t.Tuple[str, str]]
+
+
+class ColumnLineageIndex:
+    """Memoizes the lineage of model columns.
+
+    The memoized lineage of a model is dropped as soon as a different instance of the model is
+    requested, i.e. once the model has been reloaded, since either its query or the columns of its
+    upstream dependencies may have changed.
+    """
+
+    def __init__(self) -> None:
+        self._models: t.Dict[str, t.Tuple[Model, t.Dict[t.Tuple[str, bool], t.Any]]] = {}
+
+    def lineage(self, context: Context, model: Model, column: str) -> t.List[_LineageNode]:
+        """Returns the nodes of a column's lineage within the given model."""
+        cache = self._model_cache(model)
+        key = (column, False)
+        if key not in cache:
+            cache[key] = _model_column_lineage(context, model, column)
+        return cache[key]
+
+    def column_dependencies(
+        self, context: Context, model: Model, column: str
+    ) -> t.Dict[str, t.Set[str]]:
+        """Returns the upstream columns the given column of the model depends on by model name."""
+        cache = self._model_cache(model)
+        key = (column, True)
+        if key not in cache:
+            cache[key] = column_dependencies(
+                context, model.fqn, quote_column(column, model.dialect)
+            )
+        return cache[key]
+
+    def prune(self, context: Context) -> None:
+        """Drops the memoized lineage of models that are no longer part of the project."""
+        for fqn in self._models.keys() - context.models.keys():
+            self._models.pop(fqn, None)
+
+    def _model_cache(self, model: Model) -> t.Dict[t.Tuple[str, bool], t.Any]:
+        entry = self._models.get(model.fqn)
+        if entry is None or entry[0] is not model:
+            entry = (model, {})
+            self._models[model.fqn] = entry
+        return entry[1]
+
+
+column_lineage_index = ColumnLineageIndex()
+
+
+def _model_column_lineage(context: Context, model: Model, column: str) -> t.List[_LineageNode]:
+    root = lineage(quote_column(column, model.dialect), model)
+
+    nodes = []
+    for node in root.walk():
+        if root.name == "UNION" and node is root:
+            continue
+        dependencies: t.Dict[str, t.Set[str]] = defaultdict(set)
+        upstream = []
+        for d in node.downstream:
+            table = get_source_name(
+                d,
+                default_catalog=context.default_catalog,
+                dialect=model.dialect,
+                model_name=model.fqn,
+            )
+            if table:
+                column_name = get_column_name(d)
+                dependencies[table].add(column_name)
+                if isinstance(d.expression, exp.Table):
+                    upstream.append((table, column_name))
+
+        nodes.append(
+            _LineageNode(
+                name=get_source_name(
+                    node,
+                    default_catalog=context.default_catalog,
+                    dialect=model.dialect,
+                    model_name=model.fqn,
+                )
+                or model.fqn,
+                column=get_column_name(node),
+                expression=node.expression.sql(pretty=True, dialect=model.dialect),
+                source=node.source.sql(pretty=True, dialect=model.dialect),
+                models=dict(dependencies),
+                upstream=upstream,
+            )
+        )
+    return nodes
+
+
 def create_lineage_adjacency_list(
     model_name: str, column_name: str, context: Context
 ) -> t.Dict[str, t.Dict[str, LineageColumn]]:
@@ -62,42 +162,21 @@ def create_lineage_adjacency_list(
             )
             continue
 
-        root = lineage(quote_column(column, model.dialect), model)
-
-        for node in root.walk():
-            if root.name == "UNION" and node is root:
-                continue
-            node_name = (
-                get_source_name(
-                    node,
-                    default_catalog=context.default_catalog,
-                    dialect=model.dialect,
-                    model_name=model_name,
-                )
-                or model_name
-            )
-            node_column = get_column_name(node)
-            if node_column in graph[node_name]:
-                dependencies = defaultdict(set, graph[node_name][node_column].models)
-            else:
-                dependencies = defaultdict(set)
-            for d in node.downstream:
-                table = get_source_name(
-                    d,
-                    default_catalog=context.default_catalog,
-                    dialect=model.dialect,
-                    model_name=model_name,
-                )
-                if table:
-                    column_name = get_column_name(d)
-                    dependencies[table].add(column_name)
-                    if isinstance(d.expression, exp.Table) and (table, column_name) not in visited:
-                        nodes.append((table, column_name))
-                        visited.add((table, column_name))
-
-            graph[node_name][node_column] = LineageColumn(
-                expression=node.expression.sql(pretty=True, dialect=model.dialect),
-                source=node.source.sql(pretty=True, dialect=model.dialect),
+        for node in column_lineage_index.lineage(context, model, column):
+            dependencies: t.Dict[str, t.Set[str]] = defaultdict(set)
+            if node.column in graph[node.name]:
+                for table, column_names in graph[node.name][node.column].models.items():
+                    dependencies[table] |= column_names
+            for table, column_names in node.models.items():
+                dependencies[table] |= column_names
+            for upstream in node.upstream:
+                if upstream not in visited:
+                    nodes.append(upstream)
+                    visited.add(upstream)
+
+            graph[node.name][node.column] = LineageColumn(
+                expression=node.expression,
+                source=node.source,
                 models=dependencies,
             )
     return graph
@@ -114,8 +193,8 @@ def create_models_only_lineage_adjacency_list(
         model = context.get_model(model_name)
         dependencies = defaultdict(set)
         if model:
-            for table, column_names in column_dependencies(
-                context, model_name, quote_column(column, model.dialect)
+            for table, column_names in column_lineage_index.column_dependencies(
+                context, model, column
             ).items():
                 for column_name in column_names:
                     dependencies[table].add(column_name)
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 import typing as t
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlglot import exp
-from starlette.status import HTTP_404_NOT_FOUND
+from starlette.status import HTTP_304_NOT_MODIFIED, HTTP_404_NOT_FOUND
 
 from sqlmesh.core.context import Context
 from sqlmesh.core.lineage import column_description
 from sqlmesh.core.model import Model
 from sqlmesh.utils.date import now, to_datetime
+from sqlmesh.utils.hashing import md5
 from web.server import models
+from web.server.api.endpoints.lineage import column_lineage_index
 from web.server.settings import get_loaded_context
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 @router.get(
     "",
@@ -22,10 +28,40 @@ router = APIRouter()
     response_model_exclude_unset=True,
     response_model_exclude_none=True,
 )
-def get_models(context: Context = Depends(get_loaded_context)) -> t.List[models.Model]:
-    """Get a list of models"""
+def get_models(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: t.Optional[int] = Query(None, ge=1),
+    context: Context = Depends(get_loaded_context),
+) -> Response:
+    """Get a list of models
+
+    The models are returned as a JSON array or, if requested with the `application/x-ndjson`
+    media type, streamed one model per line. The response is tagged with the revision of the
+    project, so that it isn't sent again while the models remain the same.
+    """
     context.refresh()
-    return serialize_all_models(context)
+    serialized_models = serialize_all_models_json(context)
+    column_lineage_index.prune(context)
+
+    media_type = (
+        NDJSON_MEDIA_TYPE
+        if NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+        else "application/json"
+    )
+    etag = f'"{md5([media_type, *(model.hash for model in serialized_models)])}"'
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+    page = serialized_models[offset : offset + limit if limit is not None else None]
+    if media_type == NDJSON_MEDIA_TYPE:
+        return StreamingResponse(
+            (f"{model.json}\n" for model in page), media_type=media_type, headers=headers
+        )
+    return Response(
+        f"[{','.join(model.json for model in page)}]", media_type=media_type, headers=headers
+    )
 
 
 @router.get(
@@ -58,6 +94,52 @@ def serialize_all_models(
     )
 
 
+class _SerializedModel(t.NamedTuple):
+    model: Model
+    name: str
+    json: str
+    hash: str
+    expires_at: datetime
+
+
+_serialized_models: t.Dict[str, _SerializedModel] = {}
+
+
+def serialize_all_models_json(context: Context) -> t.List[_SerializedModel]:
+    """Serializes all models to JSON, reusing the serialization of models that haven't been reloaded
+    since the previous call, unless their cron schedule has moved on. Serializations of models that
+    are no longer part of the project are dropped.
+
+    Returns:
+        The serialized models sorted by name.
+    """
+    global _serialized_models
+
+    current_time = now()
+    serialized_models = {}
+    for fqn, model in context.models.items():
+        serialized_model = _serialized_models.get(fqn)
+        if (
+            serialized_model is None
+            or serialized_model.model is not model
+            or serialized_model.expires_at <= current_time
+        ):
+            serialized = serialize_model(context, model)
+            json = serialized.json(exclude_unset=True)
+            cron_next = serialized.details.cron_next if serialized.details else None
+            serialized_model = _SerializedModel(
+                model=model,
+                name=serialized.name,
+                json=json,
+                hash=md5([json]),
+                expires_at=to_datetime(cron_next) if cron_next else current_time,
+            )
+        serialized_models[fqn] = serialized_model
+
+    _serialized_models = serialized_models
+    return sorted(serialized_models.values(), key=lambda model: model.name)
+
+
 def serialize_model(context: Context, model: Model, render_query: bool = False) -> models.Model:
     type = _get_model_type(model)
     default_catalog = model.default_catalog
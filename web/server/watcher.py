@@ -1,7 +1,10 @@
+import asyncio
+import logging
 import typing as t
 from pathlib import Path
 
 from watchfiles import Change, DefaultFilter, awatch
+from watchfiles.main import FileChange
 
 from sqlmesh.core import constants as c
 from sqlmesh.core.context import Context
@@ -12,22 +15,17 @@ from web.server.exceptions import ApiException
 from web.server.settings import (
     Settings,
     get_context,
+    get_context_lock,
     get_settings,
     invalidate_context_cache,
 )
-from web.server.utils import is_relative_to
+
+logger = logging.getLogger(__name__)
 
 
 async def watch_project() -> None:
     settings = get_settings()
     context = await get_context(settings)
-    paths = [
-        (settings.project_path / c.AUDITS).resolve(),
-        (settings.project_path / c.MACROS).resolve(),
-        (settings.project_path / c.MODELS).resolve(),
-        (settings.project_path / c.METRICS).resolve(),
-        (settings.project_path / c.SEEDS).resolve(),
-    ]
     ignore_entity_patterns = context.config.ignore_patterns if context else c.IGNORE_PATTERNS
     ignore_entity_patterns.append("^\\.DS_Store$")
     ignore_entity_patterns.append("^.*\\.db(\\.wal)?$")
@@ -35,9 +33,7 @@ async def watch_project() -> None:
     watch_filter = DefaultFilter(
         ignore_paths=ignore_paths, ignore_entity_patterns=ignore_entity_patterns
     )
-    async for entries in awatch(
-        settings.project_path, watch_filter=watch_filter, force_polling=True
-    ):
+    async for entries in _watch(settings.project_path, watch_filter):
         changes: t.List[models.ArtifactChange] = []
         directories: t.Dict[str, models.Directory] = {}
         for change, path_str in entries:
@@ -65,16 +61,6 @@ async def watch_project() -> None:
                             ),
                         )
                     )
-                if context:
-                    in_paths = any(is_relative_to(path, p) for p in paths)
-                    is_modified_new_file = (
-                        change == Change.modified and path not in context._loader._path_mtimes
-                    )
-                    should_track_file = path.is_file() and in_paths
-                    should_reset_mtime = Change.added or is_modified_new_file
-                    if should_track_file and should_reset_mtime:
-                        context._loader._path_mtimes[path] = 0
-
             except Exception:
                 error = ApiException(
                     message="Error updating file",
@@ -98,6 +84,7 @@ async def watch_project() -> None:
 
         if is_config_changed(entries, settings, context):
             invalidate_context_cache()
+            context = await get_context(settings)
             api_console.log_event(
                 event=models.EventName.WARNINGS,
                 data=ApiException(
@@ -106,6 +93,39 @@ async def watch_project() -> None:
                     trigger="config",
                 ).to_dict(),
             )
+        # Files are only tracked once the context has been loaded
+        elif context and context._loader._path_mtimes:
+            try:
+                async with get_context_lock:
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, context.refresh, {Path(path) for _, path in entries}
+                    )
+            except Exception:
+                api_console.log_event(
+                    event=models.EventName.WARNINGS,
+                    data=ApiException(
+                        message="Error refreshing models",
+                        origin="API -> watcher -> watch_project",
+                    ).to_dict(),
+                )
+
+
+async def _watch(
+    path: Path, watch_filter: DefaultFilter
+) -> t.AsyncGenerator[t.Set[FileChange], None]:
+    """Watches the path using native file system notifications, falling back to polling when
+    notifications are not available, e.g. when the limit of inotify watches has been reached."""
+    try:
+        async for entries in awatch(path, watch_filter=watch_filter):
+            yield entries
+    except OSError:
+        logger.warning(
+            "Unable to watch '%s' using file system notifications, falling back to polling",
+            path,
+            exc_info=True,
+        )
+        async for entries in awatch(path, watch_filter=watch_filter, force_polling=True):
+            yield entries
 
 
 def is_config_changed(